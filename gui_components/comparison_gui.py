@@ -0,0 +1,201 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+import queue
+import threading
+
+from os_simulations.cpu_scheduling import SCHEDULERS
+from os_simulations.gantt_timeline import GanttTimeline
+from os_simulations.sweep import iter_sweep, sweep_grid
+from gui_components.gantt_view import GanttView
+
+
+class ComparisonFrame(ttk.Frame):
+    """
+    Runs several scheduling algorithms against the same workload at once and
+    shows them side by side: one Gantt lane and one metrics row per run.
+
+    The runs happen in worker processes (see sweep.iter_sweep) that share one
+    read-only copy of the workload. A background thread collects the results
+    and the table and lanes fill in as each run finishes.
+    """
+    POLL_INTERVAL_MS = 100
+    METRIC_COLUMNS = (
+        ('avg_waiting_time', "Avg. Waiting", "{:.2f}"),
+        ('avg_turnaround_time', "Avg. Turnaround", "{:.2f}"),
+        ('cpu_utilization', "CPU Util. (%)", "{:.2f}"),
+        ('context_switches', "Context Switches", "{}"),
+        ('total_time', "Total Time", "{}"),
+        ('throughput', "Throughput", "{:.3f}"),
+    )
+
+    def __init__(self, master, get_processes):
+        """:param get_processes: Returns the ProcessTable to compare on, e.g. the CPU Scheduling tab's."""
+        super().__init__(master)
+        self.get_processes = get_processes
+        self.results = queue.Queue()  # (position, row), or (None, error message), from the worker thread
+        self._cancel_event = threading.Event()
+        self._thread = None
+        self.configs = []
+        self.lanes = []  # [(name, GanttTimeline)], an empty timeline until the run finishes
+        self.after_id = None
+        self.create_widgets()
+
+    def create_widgets(self):
+        config_frame = ttk.LabelFrame(self, text="Comparison Setup", padding="10")
+        config_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=10)
+
+        algo_frame = ttk.LabelFrame(config_frame, text="Algorithms", padding="10")
+        algo_frame.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
+        self.algorithm_vars = {}
+        for column, name in enumerate(SCHEDULERS):
+            var = tk.BooleanVar(value=name in ('fcfs', 'sjf', 'rr'))
+            ttk.Checkbutton(algo_frame, text=name.upper(), variable=var).grid(row=0, column=column, padx=4, sticky="w")
+            self.algorithm_vars[name] = var
+
+        options_frame = ttk.LabelFrame(config_frame, text="Options", padding="10")
+        options_frame.grid(row=0, column=1, padx=5, pady=5, sticky="nsew")
+        ttk.Label(options_frame, text="RR Quanta:").grid(row=0, column=0, sticky="w", pady=2)
+        self.quanta_entry = ttk.Entry(options_frame, width=12)
+        self.quanta_entry.insert(0, "2 4 8")
+        self.quanta_entry.grid(row=0, column=1, sticky="ew", pady=2)
+        ttk.Label(options_frame, text="Workers:").grid(row=1, column=0, sticky="w", pady=2)
+        self.workers_entry = ttk.Entry(options_frame, width=12)
+        self.workers_entry.insert(0, "auto")
+        self.workers_entry.grid(row=1, column=1, sticky="ew", pady=2)
+
+        button_frame = ttk.Frame(config_frame)
+        button_frame.grid(row=0, column=2, padx=5, pady=5, sticky="nsew")
+        self.run_button = ttk.Button(button_frame, text="Run Comparison", command=self.start_comparison)
+        self.run_button.pack(fill=tk.X, pady=2)
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self.cancel_comparison, state=tk.DISABLED)
+        self.cancel_button.pack(fill=tk.X, pady=2)
+        self.status_label = ttk.Label(button_frame, text="Uses the processes from the CPU Scheduling tab.")
+        self.status_label.pack(fill=tk.X, pady=2)
+
+        viz_frame = ttk.LabelFrame(self, text="Gantt Charts", padding="10")
+        viz_frame.pack(fill=tk.X, padx=10, pady=5)
+        self.gantt_view = GanttView(viz_frame, height=100)
+        self.gantt_view.pack(fill=tk.X, expand=True)
+
+        table_frame = ttk.LabelFrame(self, text="Metrics", padding="10")
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        columns = [key for key, _, _ in self.METRIC_COLUMNS]
+        self.metrics_table = ttk.Treeview(table_frame, columns=columns, height=8)
+        self.metrics_table.heading('#0', text="Algorithm")
+        self.metrics_table.column('#0', width=120, anchor="w")
+        for key, heading, _ in self.METRIC_COLUMNS:
+            self.metrics_table.heading(key, text=heading)
+            self.metrics_table.column(key, width=110, anchor="e")
+        self.metrics_table.pack(fill=tk.BOTH, expand=True)
+
+    @staticmethod
+    def config_label(algorithm, quantum):
+        return algorithm.upper() if quantum is None else f"{algorithm.upper()} q={quantum}"
+
+    def _read_options(self):
+        """Returns (configs, max_workers) from the inputs; raises ValueError on bad input."""
+        algorithms = [name for name, var in self.algorithm_vars.items() if var.get()]
+        if not algorithms:
+            raise ValueError("Select at least one algorithm.")
+        quanta = [int(value) for value in self.quanta_entry.get().replace(',', ' ').split()]
+        if any(quantum <= 0 for quantum in quanta):
+            raise ValueError("Time quanta must be positive integers.")
+        configs = sweep_grid(algorithms, quanta)
+        if not configs:
+            raise ValueError("Round Robin needs at least one time quantum.")
+        workers = self.workers_entry.get().strip()
+        max_workers = None if workers in ('', 'auto') else int(workers)
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("Workers must be a positive integer or 'auto'.")
+        return configs, max_workers
+
+    def start_comparison(self):
+        if self._thread is not None:
+            return
+        processes = self.get_processes()
+        if not processes:
+            messagebox.showwarning("No Processes", "Add processes on the CPU Scheduling tab first.")
+            return
+        try:
+            configs, max_workers = self._read_options()
+        except ValueError as error:
+            messagebox.showerror("Input Error", str(error))
+            return
+
+        self.configs = configs
+        self.metrics_table.delete(*self.metrics_table.get_children())
+        for position, config in enumerate(configs):
+            self.metrics_table.insert('', tk.END, iid=str(position), text=self.config_label(*config),
+                                      values=["..."] * len(self.METRIC_COLUMNS))
+        self.lanes = [(self.config_label(*config), GanttTimeline()) for config in configs]
+        self.gantt_view.set_lanes(self.lanes)
+        self.gantt_view.redraw()
+
+        self._received = 0
+        self._cancel_event.clear()
+        # A snapshot, so editing the process list during the run cannot affect it.
+        workload = processes.fresh_copy()
+        self._thread = threading.Thread(target=self._run, args=(workload, configs, max_workers),
+                                        name="comparison-runner", daemon=True)
+        self._thread.start()
+        self.run_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.status_label.config(text=f"Running {len(configs)} simulations...")
+        self.after_id = self.after(self.POLL_INTERVAL_MS, self._poll_results)
+
+    def _run(self, workload, configs, max_workers):
+        """Worker thread: forwards results to self.results until done or cancelled."""
+        results = iter_sweep(workload, configs, max_workers, timelines=True)
+        try:
+            for position, row in results:
+                self.results.put((position, row))
+                if self._cancel_event.is_set():
+                    break
+        except Exception as error:  # Reported on the GUI thread
+            self.results.put((None, str(error)))
+        finally:
+            results.close()
+            self.results.put((None, None))
+
+    def cancel_comparison(self):
+        """Stops after the runs in progress; runs not yet started are dropped."""
+        self._cancel_event.set()
+        self.cancel_button.config(state=tk.DISABLED)
+        self.status_label.config(text="Cancelling...")
+
+    def _poll_results(self):
+        finished = False
+        updated = False
+        while True:
+            try:
+                position, row = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if position is None:
+                if row is None:
+                    finished = True
+                else:
+                    messagebox.showerror("Comparison Error", row)
+                continue
+            self._show_result(position, row)
+            updated = True
+
+        if updated:
+            self.gantt_view.set_lanes(self.lanes)
+            self.gantt_view.on_scroll("moveto", 0)  # Compare the runs from time 0.
+        if finished:
+            self._thread.join()
+            self._thread = None
+            self.after_id = None
+            self.run_button.config(state=tk.NORMAL)
+            self.cancel_button.config(state=tk.DISABLED)
+            self.status_label.config(text=f"{self._received} of {len(self.configs)} simulations completed.")
+            return
+        self.status_label.config(text=f"{self._received} of {len(self.configs)} simulations completed...")
+        self.after_id = self.after(self.POLL_INTERVAL_MS, self._poll_results)
+
+    def _show_result(self, position, row):
+        self._received += 1
+        self.lanes[position] = (self.lanes[position][0], row['timeline'])
+        values = [fmt.format(row[key]) for key, _, fmt in self.METRIC_COLUMNS]
+        self.metrics_table.item(str(position), values=values)
@@ -1,22 +1,46 @@
 
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import collections
+import heapq
+import queue
 import time 
 
 
-from os_simulations.cpu_scheduling import Process, FCFSScheduler, SJFScheduler, RoundRobinScheduler
+from os_simulations import instrumentation
+from os_simulations.cpu_scheduling import (FCFSScheduler, SJFScheduler, RoundRobinScheduler, SRTFScheduler,
+                                           PriorityScheduler, MLFQScheduler)
+from os_simulations.process_table import ProcessTable
+from os_simulations.smp_scheduling import SMPScheduler
+from os_simulations.workload import format_bursts, load_processes, parse_bursts
+from gui_components.gantt_view import GanttView
+from gui_components.simulation_runner import SimulationRunner
 
 class CPUSchedulingFrame(ttk.Frame):
+    FRAME_INTERVAL_MS = 33  # UI refresh cap, about 30 frames per second
+    CHECKPOINT_INTERVAL = 100  # Ticks between checkpoints, the most a timeline seek replays
+    MAX_CHECKPOINTS = 1000
+    SPEEDS = [
+        ("1 tick/s (real time)", 1),
+        ("2 ticks/s", 2),
+        ("10 ticks/s", 10),
+        ("100 ticks/s", 100),
+        ("1,000 ticks/s", 1000),
+        ("100,000 ticks/s", 100000),
+        ("As fast as possible", None),
+    ]
+
     def __init__(self, master):
         super().__init__(master)
         self.scheduler = None
+        self.runner = None
         self.current_time = 0
+        self.furthest_time = 0  # Latest time reached, the end of the timeline slider
         self.is_running = False
         self.after_id = None 
 
-        self.processes_data = [] 
+        self.processes_data = ProcessTable()
 
         self.create_widgets()
         self.reset_simulation() 
@@ -42,8 +66,20 @@ class CPUSchedulingFrame(ttk.Frame):
         self.burst_entry = ttk.Entry(process_input_frame, width=10)
         self.burst_entry.grid(row=2, column=1, sticky="ew", pady=2)
 
+        ttk.Label(process_input_frame, text="Priority:").grid(row=3, column=0, sticky="w", pady=2)
+        self.priority_entry = ttk.Entry(process_input_frame, width=10)
+        self.priority_entry.insert(0, "0")
+        self.priority_entry.grid(row=3, column=1, sticky="ew", pady=2)
+
+        ttk.Label(process_input_frame, text="CPU/I-O Bursts:").grid(row=4, column=0, sticky="w", pady=2)
+        self.bursts_entry = ttk.Entry(process_input_frame, width=10)
+        self.bursts_entry.grid(row=4, column=1, sticky="ew", pady=2)
+
         add_process_btn = ttk.Button(process_input_frame, text="Add Process", command=self.add_process_gui)
-        add_process_btn.grid(row=3, column=0, columnspan=2, pady=5, sticky="ew")
+        add_process_btn.grid(row=5, column=0, columnspan=2, pady=5, sticky="ew")
+
+        load_workload_btn = ttk.Button(process_input_frame, text="Load Workload...", command=self.load_workload_gui)
+        load_workload_btn.grid(row=6, column=0, columnspan=2, pady=5, sticky="ew")
 
         
         algo_select_frame = ttk.LabelFrame(config_frame, text="Select Algorithm", padding="10")
@@ -53,6 +89,9 @@ class CPUSchedulingFrame(ttk.Frame):
         ttk.Radiobutton(algo_select_frame, text="FCFS (First-Come, First-Served)", variable=self.algorithm_var, value="FCFS", command=self.on_algorithm_change).pack(anchor="w")
         ttk.Radiobutton(algo_select_frame, text="SJF (Shortest Job First)", variable=self.algorithm_var, value="SJF", command=self.on_algorithm_change).pack(anchor="w")
         ttk.Radiobutton(algo_select_frame, text="Round Robin", variable=self.algorithm_var, value="RoundRobin", command=self.on_algorithm_change).pack(anchor="w")
+        ttk.Radiobutton(algo_select_frame, text="SRTF (Shortest Remaining Time First)", variable=self.algorithm_var, value="SRTF", command=self.on_algorithm_change).pack(anchor="w")
+        ttk.Radiobutton(algo_select_frame, text="Priority (with Aging)", variable=self.algorithm_var, value="Priority", command=self.on_algorithm_change).pack(anchor="w")
+        ttk.Radiobutton(algo_select_frame, text="MLFQ (Multilevel Feedback Queue)", variable=self.algorithm_var, value="MLFQ", command=self.on_algorithm_change).pack(anchor="w")
 
         self.quantum_frame = ttk.Frame(algo_select_frame)
         self.quantum_frame.pack(anchor="w", pady=5)
@@ -62,9 +101,42 @@ class CPUSchedulingFrame(ttk.Frame):
         self.quantum_entry.pack(side=tk.LEFT, padx=5)
         self.quantum_frame.pack_forget() 
 
+        self.aging_frame = ttk.Frame(algo_select_frame)
+        ttk.Label(self.aging_frame, text="Aging Interval:").pack(side=tk.LEFT)
+        self.aging_entry = ttk.Entry(self.aging_frame, width=5)
+        self.aging_entry.insert(0, "10")
+        self.aging_entry.pack(side=tk.LEFT, padx=5)
+
+        self.mlfq_frame = ttk.Frame(algo_select_frame)
+        ttk.Label(self.mlfq_frame, text="Level Quanta:").grid(row=0, column=0, sticky="w")
+        self.mlfq_quanta_entry = ttk.Entry(self.mlfq_frame, width=10)
+        self.mlfq_quanta_entry.insert(0, "2 4 8")
+        self.mlfq_quanta_entry.grid(row=0, column=1, padx=5)
+        ttk.Label(self.mlfq_frame, text="Boost Interval:").grid(row=1, column=0, sticky="w")
+        self.boost_entry = ttk.Entry(self.mlfq_frame, width=10)
+        self.boost_entry.insert(0, "50")
+        self.boost_entry.grid(row=1, column=1, padx=5)
+
+
+        smp_frame = ttk.LabelFrame(config_frame, text="Multiprocessor", padding="10")
+        smp_frame.grid(row=0, column=2, padx=5, pady=5, sticky="nsew")
+
+        cpus_frame = ttk.Frame(smp_frame)
+        cpus_frame.pack(anchor="w", pady=2)
+        ttk.Label(cpus_frame, text="CPUs:").pack(side=tk.LEFT)
+        self.cpus_entry = ttk.Entry(cpus_frame, width=5)
+        self.cpus_entry.insert(0, "1")
+        self.cpus_entry.pack(side=tk.LEFT, padx=5)
+
+        self.queue_mode_var = tk.StringVar(value="per-cpu")
+        ttk.Radiobutton(smp_frame, text="Per-CPU Queues", variable=self.queue_mode_var, value="per-cpu", command=self.reset_simulation).pack(anchor="w")
+        ttk.Radiobutton(smp_frame, text="Global Queue", variable=self.queue_mode_var, value="global", command=self.reset_simulation).pack(anchor="w")
+        self.work_stealing_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(smp_frame, text="Work Stealing", variable=self.work_stealing_var, command=self.reset_simulation).pack(anchor="w")
+
        
         controls_frame = ttk.LabelFrame(config_frame, text="Controls", padding="10")
-        controls_frame.grid(row=0, column=2, padx=5, pady=5, sticky="nsew")
+        controls_frame.grid(row=0, column=3, padx=5, pady=5, sticky="nsew")
 
         self.start_pause_btn = ttk.Button(controls_frame, text="Start Simulation", command=self.toggle_simulation)
         self.start_pause_btn.pack(fill=tk.X, pady=2)
@@ -72,6 +144,13 @@ class CPUSchedulingFrame(ttk.Frame):
         reset_btn = ttk.Button(controls_frame, text="Reset Simulation", command=self.reset_simulation)
         reset_btn.pack(fill=tk.X, pady=2)
 
+        ttk.Label(controls_frame, text="Speed:").pack(anchor="w", pady=(5, 0))
+        self.speed_var = tk.StringVar(value=self.SPEEDS[1][0])
+        speed_combo = ttk.Combobox(controls_frame, textvariable=self.speed_var, state="readonly", width=20,
+                                   values=[label for label, _ in self.SPEEDS])
+        speed_combo.pack(fill=tk.X, pady=2)
+        speed_combo.bind("<<ComboboxSelected>>", self.on_speed_change)
+
       
         process_list_frame = ttk.LabelFrame(self, text="Current Processes (PID, Arrival, Burst)", padding="10")
         process_list_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -82,10 +161,18 @@ class CPUSchedulingFrame(ttk.Frame):
         viz_frame = ttk.LabelFrame(self, text="Gantt Chart", padding="10")
         viz_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        self.gantt_canvas = tk.Canvas(viz_frame, bg="white", height=100, bd=2, relief="groove")
-        self.gantt_canvas.pack(fill=tk.X, expand=True)
-        self.gantt_canvas.bind("<Configure>", self.on_canvas_resize)
+        self.gantt_view = GanttView(viz_frame, height=100)
+        self.gantt_view.pack(fill=tk.X, expand=True)
+
 
+        timeline_frame = ttk.Frame(viz_frame)
+        timeline_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Label(timeline_frame, text="Timeline:").pack(side=tk.LEFT)
+        self.timeline_var = tk.DoubleVar(value=0)
+        self.timeline_scale = ttk.Scale(timeline_frame, from_=0, to=1, variable=self.timeline_var,
+                                        command=self.on_timeline_scrub)
+        self.timeline_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.timeline_scale.state(["disabled"])
 
         self.current_time_label = ttk.Label(viz_frame, text="Current Time: 0", font=("Arial", 12, "bold"))
         self.current_time_label.pack(pady=5)
@@ -110,10 +197,18 @@ class CPUSchedulingFrame(ttk.Frame):
         self.context_switches_label = ttk.Label(stats_frame, text="Context Switches: 0", font=("Arial", 10))
         self.context_switches_label.grid(row=0, column=3, sticky="w", pady=2)
 
-    def on_canvas_resize(self, event):
-        """Redraws the Gantt chart when the canvas is resized."""
-        self.draw_gantt_chart()
+        self.percentile_labels = {}
+        for column, (key, title) in enumerate((("waiting_time", "Waiting"), ("turnaround_time", "Turnaround"),
+                                               ("response_time", "Response"))):
+            label = ttk.Label(stats_frame, text=f"{title} p50/p95/p99/max: -", font=("Arial", 10))
+            label.grid(row=1, column=column, sticky="w", pady=2)
+            self.percentile_labels[key] = (title, label)
+
+        self.extra_stats_label = ttk.Label(stats_frame, text="", font=("Arial", 10))
+        self.extra_stats_label.grid(row=2, column=0, columnspan=4, sticky="w", pady=2)
 
+        self.io_stats_label = ttk.Label(stats_frame, text="Throughput: 0.000 processes/tick", font=("Arial", 10))
+        self.io_stats_label.grid(row=3, column=0, columnspan=4, sticky="w", pady=2)
 
     def on_algorithm_change(self):
         """Handles changes in the selected scheduling algorithm."""
@@ -121,6 +216,14 @@ class CPUSchedulingFrame(ttk.Frame):
             self.quantum_frame.pack(anchor="w", pady=5)
         else:
             self.quantum_frame.pack_forget()
+        if self.algorithm_var.get() == "Priority":
+            self.aging_frame.pack(anchor="w", pady=5)
+        else:
+            self.aging_frame.pack_forget()
+        if self.algorithm_var.get() == "MLFQ":
+            self.mlfq_frame.pack(anchor="w", pady=5)
+        else:
+            self.mlfq_frame.pack_forget()
         self.reset_simulation() 
 
     def add_process_gui(self):
@@ -128,35 +231,60 @@ class CPUSchedulingFrame(ttk.Frame):
         pid = self.pid_entry.get().strip()
         try:
             arrival = int(self.arrival_entry.get())
-            burst = int(self.burst_entry.get())
+            priority = int(self.priority_entry.get() or 0)
+            io = None
+            if self.bursts_entry.get().strip():
+                # "5 disk:3 2": CPU bursts alternating with device:time I/O bursts.
+                burst, io = parse_bursts(self.bursts_entry.get(), 1)
+            else:
+                burst = int(self.burst_entry.get())
             if not pid or burst <= 0 or arrival < 0:
                 raise ValueError("Invalid input")
 
            
-            if any(p.pid == pid for p in self.processes_data):
+            if self.processes_data.index_of(pid) is not None:
                 messagebox.showerror("Input Error", f"Process with PID '{pid}' already exists.")
                 return
 
-            new_process = Process(pid, arrival, burst)
-            self.processes_data.append(new_process)
-            self.processes_data.sort(key=lambda p: p.arrival_time) 
+            self.processes_data.add(pid, arrival, burst, priority, io)
 
             self.update_process_list_display()
             self.reset_simulation()
             self.pid_entry.delete(0, tk.END)
             self.arrival_entry.delete(0, tk.END)
             self.burst_entry.delete(0, tk.END)
+            self.bursts_entry.delete(0, tk.END)
 
         except ValueError:
-            messagebox.showerror("Input Error", "Please enter valid PID (text), non-negative Arrival Time, and positive Burst Time.")
+            messagebox.showerror("Input Error", "Please enter valid PID (text), non-negative Arrival Time, positive Burst Time and integer Priority. "
+                                                "CPU/I-O Bursts, if given, alternate CPU times and device:time I/O bursts, e.g. 5 disk:3 2.")
+
+    def load_workload_gui(self):
+        """Replaces the process list with a CSV/JSONL workload file."""
+        path = filedialog.askopenfilename(
+            title="Load Workload",
+            filetypes=[("Workload files", "*.csv *.jsonl *.ndjson"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            self.processes_data = load_processes(path)
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Load Error", str(error))
+            return
+        self.update_process_list_display()
+        self.reset_simulation()
 
-    def update_process_list_display(self):
-        """Updates the label showing current processes."""
+    def update_process_list_display(self, max_shown=50):
+        """Updates the label showing current processes (the first max_shown by arrival)."""
         if not self.processes_data:
             self.process_list_label.config(text="No processes added yet.")
             return
 
-        process_str = ", ".join([f"{p.pid}({p.arrival_time},{p.burst_time})" for p in self.processes_data])
+        shown = heapq.nsmallest(max_shown, self.processes_data, key=lambda p: p.arrival_time)
+        process_str = ", ".join([f"{p.pid}({p.arrival_time},{format_bursts(p.burst_time, p.io_bursts)})" for p in shown])
+        if len(self.processes_data) > max_shown:
+            process_str += f", ... ({len(self.processes_data)} processes)"
         self.process_list_label.config(text=process_str)
 
     def toggle_simulation(self):
@@ -175,8 +303,25 @@ class CPUSchedulingFrame(ttk.Frame):
         if self.scheduler is None:
            
             algo = self.algorithm_var.get()
+            try:
+                cpus = int(self.cpus_entry.get())
+                if cpus <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Input Error", "CPUs must be a positive integer.")
+                self.reset_simulation()
+                return
+            if cpus > 1 and algo not in ("FCFS", "RoundRobin"):
+                messagebox.showerror("Input Error", "Multiprocessor mode supports FCFS and Round Robin.")
+                self.reset_simulation()
+                return
+            smp_options = {'queue_mode': self.queue_mode_var.get(), 'work_stealing': self.work_stealing_var.get()}
+
             if algo == "FCFS":
-                self.scheduler = FCFSScheduler()
+                if cpus > 1:
+                    self.scheduler = SMPScheduler(cpus, 'fcfs', **smp_options)
+                else:
+                    self.scheduler = FCFSScheduler()
             elif algo == "SJF":
                 self.scheduler = SJFScheduler()
             elif algo == "RoundRobin":
@@ -184,34 +329,95 @@ class CPUSchedulingFrame(ttk.Frame):
                     quantum_val = int(self.quantum_entry.get())
                     if quantum_val <= 0:
                         raise ValueError
-                    self.scheduler = RoundRobinScheduler(quantum_val)
+                    if cpus > 1:
+                        self.scheduler = SMPScheduler(cpus, 'rr', quantum_val, **smp_options)
+                    else:
+                        self.scheduler = RoundRobinScheduler(quantum_val)
                 except ValueError:
                     messagebox.showerror("Input Error", "Quantum must be a positive integer.")
                     self.reset_simulation()
                     return
+            elif algo == "SRTF":
+                self.scheduler = SRTFScheduler()
+            elif algo == "Priority":
+                try:
+                    aging_val = int(self.aging_entry.get() or 0)
+                    if aging_val < 0:
+                        raise ValueError
+                    self.scheduler = PriorityScheduler(aging_val or None)
+                except ValueError:
+                    messagebox.showerror("Input Error", "Aging interval must be a non-negative integer (0 disables aging).")
+                    self.reset_simulation()
+                    return
+            elif algo == "MLFQ":
+                try:
+                    quanta = [int(q) for q in self.mlfq_quanta_entry.get().split()]
+                    boost_val = int(self.boost_entry.get() or 0)
+                    self.scheduler = MLFQScheduler(quanta, boost_val or None)
+                except ValueError:
+                    messagebox.showerror("Input Error", "Level quanta must be positive integers separated by spaces, and the boost interval a non-negative integer (0 disables boosting).")
+                    self.reset_simulation()
+                    return
 
            
-            for p in self.processes_data:
-                self.scheduler.add_process(p)
-            self.scheduler.reset_state() 
+            self.scheduler.add_processes(self.processes_data)
+            self.scheduler.enable_checkpoints(self.CHECKPOINT_INTERVAL, self.MAX_CHECKPOINTS)
+            if isinstance(self.scheduler, SMPScheduler):
+                self.gantt_view.set_lanes([(f"CPU{cpu}", timeline)
+                                           for cpu, timeline in enumerate(self.scheduler.gantt_charts)])
+            else:
+                self.gantt_view.set_lanes([("CPU", self.scheduler.gantt_chart)])
         self.is_running = True
         self.start_pause_btn.config(text="Pause Simulation")
-        self._run_simulation_step()
+        self.timeline_scale.state(["disabled"])
+        self.runner = SimulationRunner(self.scheduler, self._selected_speed(),
+                                       snapshot_interval=self.FRAME_INTERVAL_MS / 1000)
+        self.runner.start()
+        self._poll_snapshots()
 
     def pause_simulation(self):
         """Pauses the simulation loop."""
         self.is_running = False
         self.start_pause_btn.config(text="Start Simulation")
+        if self.runner is not None:
+            self.runner.stop()
+            self._apply_latest_snapshot()
+            self.runner = None
         if self.after_id:
             self.after_cancel(self.after_id)
             self.after_id = None
+        if self.scheduler is not None:
+            self.timeline_scale.state(["!disabled"])
+
+    def on_timeline_scrub(self, value):
+        """Rewinds or replays the paused simulation to the time picked on the timeline slider."""
+        if self.scheduler is None or self.is_running:
+            return
+        target = round(float(value))
+        if target == self.scheduler.total_execution_time:
+            return
+        self.scheduler.seek(target)
+        self.gantt_view.redraw()
+        self._show_metrics(self.scheduler.get_metrics())
+
+    def _selected_speed(self):
+        return dict(self.SPEEDS).get(self.speed_var.get())
+
+    def on_speed_change(self, event=None):
+        """Applies a new speed to the running simulation without restarting it."""
+        if self.runner is not None:
+            self.runner.set_speed(self._selected_speed())
 
     def reset_simulation(self):
         """Resets the entire simulation state."""
         self.pause_simulation() 
         self.current_time = 0
-        self.gantt_canvas.delete("all") 
+        self.furthest_time = 0
+        self.gantt_view.clear()
         self.current_time_label.config(text="Current Time: 0")
+        self.timeline_scale.config(to=1)
+        self.timeline_var.set(0)
+        self.timeline_scale.state(["disabled"])
 
         
         self.scheduler = None 
@@ -219,84 +425,80 @@ class CPUSchedulingFrame(ttk.Frame):
         self.avg_turnaround_label.config(text="Avg. Turnaround Time: 0.00")
         self.cpu_util_label.config(text="CPU Utilization: 0.00%")
         self.context_switches_label.config(text="Context Switches: 0")
+        self.extra_stats_label.config(text="")
+        self.io_stats_label.config(text="Throughput: 0.000 processes/tick")
+        for title, label in self.percentile_labels.values():
+            label.config(text=f"{title} p50/p95/p99/max: -")
         self.update_process_list_display()
 
-    def _run_simulation_step(self):
-        """Performs one step of the simulation and schedules the next."""
+    def _poll_snapshots(self):
+        """Applies the newest snapshot from the simulation thread, at most once per frame."""
         if not self.is_running:
             return
-
-      
-        if self.scheduler.current_process is None and \
-           not self.scheduler.ready_queue and \
-           len(self.scheduler.completed_processes) == len(self.processes_data):
-            
+        snapshot = self._apply_latest_snapshot()
+        if snapshot is not None and snapshot.finished:
             self.pause_simulation()
             messagebox.showinfo("Simulation Complete", "All processes have finished execution!")
             return
-
-       
-        pid_this_tick, avg_wait, avg_turnaround, cpu_util, context_switches = self.scheduler.step(self.current_time)
-
+        self.after_id = self.after(self.FRAME_INTERVAL_MS, self._poll_snapshots)
+
+    def _apply_latest_snapshot(self):
+        """Drains the snapshot queue and shows only the last entry. Returns it, or None."""
+        snapshot = None
+        while True:
+            try:
+                snapshot = self.runner.snapshots.get_nowait()
+            except queue.Empty:
+                break
+        if snapshot is None:
+            return None
+        self._show_metrics(snapshot.metrics)
+        return snapshot
+
+    def _show_metrics(self, metrics):
+        """Updates the Gantt chart, the timeline slider and the statistics from a get_metrics() dict."""
+        self.current_time = metrics['total_time']
+        self.furthest_time = max(self.furthest_time, self.current_time)
         self.draw_gantt_chart()
-        self.current_time_label.config(text=f"Current Time: {self.current_time + 1}")
-        self.avg_waiting_label.config(text=f"Avg. Waiting Time: {avg_wait:.2f}")
-        self.avg_turnaround_label.config(text=f"Avg. Turnaround Time: {avg_turnaround:.2f}")
-        self.cpu_util_label.config(text=f"CPU Utilization: {cpu_util:.2f}%")
-        self.context_switches_label.config(text=f"Context Switches: {context_switches}")
-
-        self.current_time += 1
-        self.after_id = self.after(500, self._run_simulation_step) 
+        self.current_time_label.config(text=f"Current Time: {self.current_time}")
+        self.timeline_scale.config(to=max(1, self.furthest_time))
+        self.timeline_var.set(self.current_time)
+        self.avg_waiting_label.config(text=f"Avg. Waiting Time: {metrics['avg_waiting_time']:.2f}")
+        self.avg_turnaround_label.config(text=f"Avg. Turnaround Time: {metrics['avg_turnaround_time']:.2f}")
+        self.cpu_util_label.config(text=f"CPU Utilization: {metrics['cpu_utilization']:.2f}%")
+        self.context_switches_label.config(text=f"Context Switches: {metrics['context_switches']}")
+        io_text = f"Throughput: {metrics['throughput']:.3f} processes/tick"
+        if metrics['device_utilization']:
+            devices = "  ".join(f"{name}: {share:.0f}%" for name, share in metrics['device_utilization'].items())
+            io_text += (f"   I/O Utilization: {metrics['io_utilization']:.2f}%   "
+                        f"CPU/I-O Overlap: {metrics['cpu_io_overlap']:.2f}%   Devices: {devices}")
+        self.io_stats_label.config(text=io_text)
+        for key, (title, label) in self.percentile_labels.items():
+            if metrics['completed_processes']:
+                p = metrics['percentiles'][key]
+                label.config(text=f"{title} p50/p95/p99/max: {p['p50']:.1f} / {p['p95']:.1f} / {p['p99']:.1f} / {p['max']}")
+            else:
+                label.config(text=f"{title} p50/p95/p99/max: -")  # Rewound to before the first completion
+        if isinstance(self.scheduler, SMPScheduler):
+            per_cpu = metrics['per_cpu_utilization']
+            self.extra_stats_label.config(
+                text=f"Migrations: {metrics['migrations']}   Steals: {metrics['steals']}   "
+                     f"Per-CPU Utilization: {min(per_cpu):.2f}% - {max(per_cpu):.2f}%"
+            )
+        elif isinstance(self.scheduler, MLFQScheduler):
+            residency = "  ".join(f"L{level}: {share:.0f}%" for level, share in enumerate(metrics['per_level_residency']))
+            self.extra_stats_label.config(
+                text=f"Level Residency: {residency}   Avg. Response Time: {metrics['avg_response_time']:.2f}   "
+                     f"Boosts: {metrics['boosts']}"
+            )
 
     def draw_gantt_chart(self):
-        """Draws the Gantt chart on the canvas."""
-        self.gantt_canvas.delete("all")
-        if not self.scheduler or not self.scheduler.gantt_chart:
+        """Draws the ticks added since the last call onto the Gantt chart."""
+        if self.runner is None:
+            self.gantt_view.refresh()
             return
+        with self.runner.lock:
+            self.gantt_view.refresh()
 
-       
-        process_colors = {}
-        color_idx = 0
-        base_colors = ["#FF5733", "#33FF57", "#3357FF", "#FF33F5", "#F5FF33", "#33F5FF"] # Vibrant colors
-
-        def get_process_color(pid):
-            nonlocal color_idx
-            if pid == 'Idle':
-                return "#A9A9A9"
-            if pid not in process_colors:
-                process_colors[pid] = base_colors[color_idx % len(base_colors)]
-                color_idx += 1
-            return process_colors[pid]
-
-        x_offset = 0
-        cell_width = 30 
-
-       
-        required_width = len(self.scheduler.gantt_chart) * cell_width + 50
-        
-        if required_width > self.gantt_canvas.winfo_width() or self.gantt_canvas.winfo_width() < 1:
-            self.gantt_canvas.config(width=required_width)
-            
-        for item in self.scheduler.gantt_chart:
-            color = get_process_color(item['pid'])
-            self.gantt_canvas.create_rectangle(
-                x_offset, 0, x_offset + cell_width, 50,
-                fill=color, outline="black"
-            )
-            self.gantt_canvas.create_text(
-                x_offset + cell_width / 2, 25,
-                text=item['pid'], fill="white", font=("Arial", 8, "bold")
-            )
-           
-            self.gantt_canvas.create_text(
-                x_offset, 65, 
-                text=str(item['time']), anchor="nw", font=("Arial", 7)
-            )
-            x_offset += cell_width
 
-       
-        if self.scheduler.gantt_chart:
-            self.gantt_canvas.create_text(
-                x_offset, 65,
-                text=str(self.current_time), anchor="nw", font=("Arial", 7)
-            )
\ No newline at end of file
+instrumentation.register(CPUSchedulingFrame, 'draw_gantt_chart', "CPUSchedulingFrame.draw_gantt_chart")
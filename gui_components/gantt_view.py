@@ -0,0 +1,307 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+IDLE_COLOR = "#A9A9A9"
+BASE_COLORS = ["#FF5733", "#33FF57", "#3357FF", "#FF33F5", "#F5FF33", "#33F5FF"] # Vibrant colors
+
+
+class GanttRenderer:
+    """
+    Draws one or more GanttTimeline lanes onto a canvas.
+    Lanes shrink to fit MAX_LANES_HEIGHT, so an SMP run can show one lane per CPU.
+
+    Only the visible time window is drawn. refresh() adds items for ticks
+    that appeared since the previous call and stretches the last rectangle
+    when the same pid keeps running, so a refresh costs the same no matter
+    how long the simulation has been running. Below one pixel per tick,
+    ticks are aggregated into pixel columns, which bounds the item count by
+    the canvas width.
+    """
+    ZOOM_LEVELS = (40, 30, 20, 10, 5, 2, 1, 0.5, 0.2, 0.1, 0.05, 0.02, 0.01)  # Pixels per tick
+    DEFAULT_ZOOM_INDEX = 1
+    LANE_HEIGHT = 50
+    LANE_GAP = 8
+    AXIS_HEIGHT = 20
+    LANE_LABEL_WIDTH = 50
+    MAX_LANES_HEIGHT = 400  # Pixels available to all lanes together
+    MIN_LABELLED_LANE_HEIGHT = 10  # Thinner lanes get no labels or outlines
+    MIN_LABEL_SPACING = 40  # Pixels between time axis labels
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.lanes = []  # [(name, GanttTimeline)]
+        self.zoom_index = self.DEFAULT_ZOOM_INDEX
+        self.view_start = 0
+        self.follow = True  # Keep the newest tick in view
+        self.process_colors = {}
+        self._fit_lanes()
+        self._reset_drawn_state()
+
+    def _fit_lanes(self):
+        pitch = self.LANE_HEIGHT + self.LANE_GAP
+        if len(self.lanes) * pitch > self.MAX_LANES_HEIGHT:
+            pitch = max(3, self.MAX_LANES_HEIGHT // len(self.lanes))
+        self.lane_gap = max(1, pitch * self.LANE_GAP // (self.LANE_HEIGHT + self.LANE_GAP))
+        self.lane_height = pitch - self.lane_gap
+
+    def _reset_drawn_state(self):
+        self.canvas.delete("gantt")
+        self._last_items = [None] * len(self.lanes)  # Per lane: [pid, start, end, rect_id, text_id]
+        self._drawn_until = [self.view_start] * len(self.lanes)
+        self._axis_drawn_until = self.view_start
+
+    @property
+    def pixels_per_tick(self):
+        return self.ZOOM_LEVELS[self.zoom_index]
+
+    def set_lanes(self, lanes):
+        """Replaces the displayed timelines. lanes is a list of (name, GanttTimeline)."""
+        self.lanes = list(lanes)
+        self._fit_lanes()
+        self.view_start = self.data_start()
+        self.follow = True
+        self.redraw()
+
+    def clear(self):
+        """Removes every lane and forgets the colour assignments."""
+        self.lanes = []
+        self.view_start = 0
+        self.follow = True
+        self.process_colors = {}
+        self._fit_lanes()
+        self._reset_drawn_state()
+
+    def color_for(self, pid):
+        if pid == 'Idle':
+            return IDLE_COLOR
+        if pid not in self.process_colors:
+            self.process_colors[pid] = BASE_COLORS[len(self.process_colors) % len(BASE_COLORS)]
+        return self.process_colors[pid]
+
+    def required_height(self):
+        return max(1, len(self.lanes)) * (self.lane_height + self.lane_gap) + self.AXIS_HEIGHT
+
+    def _left_margin(self):
+        return self.LANE_LABEL_WIDTH if len(self.lanes) > 1 else 0
+
+    def _plot_width(self):
+        width = self.canvas.winfo_width()
+        if width <= 1:
+            width = 600
+        return max(1, width - self._left_margin())
+
+    def visible_ticks(self):
+        return self._plot_width() / self.pixels_per_tick
+
+    def data_start(self):
+        return min((timeline.start_time for _, timeline in self.lanes if timeline), default=0)
+
+    def data_end(self):
+        return max((timeline.end_time for _, timeline in self.lanes), default=0)
+
+    def _x(self, time):
+        return self._left_margin() + (time - self.view_start) * self.pixels_per_tick
+
+    def _lane_top(self, lane_index):
+        return lane_index * (self.lane_height + self.lane_gap)
+
+    def redraw(self):
+        """Discards the drawn items and draws the visible window from scratch."""
+        self._reset_drawn_state()
+        if len(self.lanes) > 1 and self.lane_height >= self.MIN_LABELLED_LANE_HEIGHT:
+            for lane_index, (name, _) in enumerate(self.lanes):
+                self.canvas.create_text(
+                    2, self._lane_top(lane_index) + self.lane_height / 2,
+                    text=str(name), anchor="w", font=("Arial", 8, "bold"), tags=("gantt",)
+                )
+        self.refresh()
+
+    def refresh(self):
+        """Draws the ticks added since the last call."""
+        end = self.data_end()
+        visible = self.visible_ticks()
+        if self.follow and end > self.view_start + visible:
+            # Jump a page forward so most refreshes only append.
+            self.view_start = max(self.data_start(), int(end - visible / 4))
+            self.redraw()
+            return
+
+        view_end = min(end, self.view_start + visible)
+        for lane_index, (_, timeline) in enumerate(self.lanes):
+            lane_end = min(view_end, timeline.end_time)
+            if self.pixels_per_tick >= 1:
+                self._draw_segments(lane_index, timeline, lane_end)
+            else:
+                self._draw_columns(lane_index, timeline, lane_end)
+        self._draw_axis(view_end)
+
+    def _draw_segments(self, lane_index, timeline, view_end):
+        drawn_until = self._drawn_until[lane_index]
+        for pid, start, length in timeline.segments_in_range(drawn_until, view_end):
+            self._draw_cell(lane_index, pid, max(start, drawn_until), min(start + length, view_end))
+        self._drawn_until[lane_index] = max(drawn_until, view_end)
+
+    def _draw_columns(self, lane_index, timeline, view_end):
+        ticks_per_column = round(1 / self.pixels_per_tick)
+        column = (self._drawn_until[lane_index] - self.view_start) // ticks_per_column
+        while True:
+            start = self.view_start + column * ticks_per_column
+            if start >= view_end:
+                break
+            pid = timeline.pid_at(start)
+            if pid is not None:
+                self._draw_cell(lane_index, pid, start, start + ticks_per_column)
+            column += 1
+            self._drawn_until[lane_index] = start + ticks_per_column
+
+    def _draw_cell(self, lane_index, pid, start, end):
+        """Draws [start, end) for pid, extending the lane's last rectangle when possible."""
+        if end <= start:
+            return
+        top = self._lane_top(lane_index)
+        last = self._last_items[lane_index]
+        if last is not None and last[0] == pid and last[2] == start:
+            last[2] = end
+            self.canvas.coords(last[3], self._x(last[1]), top, self._x(end), top + self.lane_height)
+            self._place_text(lane_index, last)
+            return
+
+        rect_id = self.canvas.create_rectangle(
+            self._x(start), top, self._x(end), top + self.lane_height,
+            fill=self.color_for(pid), tags=("gantt",),
+            outline="black" if self.lane_height >= self.MIN_LABELLED_LANE_HEIGHT else ""
+        )
+        item = [pid, start, end, rect_id, None]
+        self._last_items[lane_index] = item
+        self._place_text(lane_index, item)
+
+    def _place_text(self, lane_index, item):
+        pid, start, end, _, text_id = item
+        width = self._x(end) - self._x(start)
+        center_x = (self._x(start) + self._x(end)) / 2
+        center_y = self._lane_top(lane_index) + self.lane_height / 2
+        if text_id is not None:
+            self.canvas.coords(text_id, center_x, center_y)
+        elif width >= 20 and self.lane_height >= self.MIN_LABELLED_LANE_HEIGHT:
+            item[4] = self.canvas.create_text(
+                center_x, center_y,
+                text=str(pid), fill="white", font=("Arial", 8, "bold"), tags=("gantt",)
+            )
+
+    def _draw_axis(self, view_end):
+        ticks_per_label = self.MIN_LABEL_SPACING / self.pixels_per_tick
+        spacing = 1
+        while spacing < ticks_per_label:
+            for factor in (2, 5, 10):
+                if spacing * factor >= ticks_per_label:
+                    spacing *= factor
+                    break
+            else:
+                spacing *= 10
+        y = len(self.lanes) * (self.lane_height + self.lane_gap) + 2
+        time = -(-self._axis_drawn_until // spacing) * spacing
+        while time <= view_end:
+            self.canvas.create_text(
+                self._x(time), y, text=str(int(time)), anchor="nw", font=("Arial", 7), tags=("gantt",)
+            )
+            time += spacing
+        self._axis_drawn_until = time
+
+    def scroll_to(self, time):
+        """Moves the left edge of the view to `time` and redraws."""
+        start = self.data_start()
+        latest_start = max(start, self.data_end() - self.visible_ticks())
+        self.view_start = int(min(max(time, start), latest_start))
+        self.follow = self.view_start >= latest_start
+        self.redraw()
+
+    def set_zoom(self, zoom_index):
+        """Switches to ZOOM_LEVELS[zoom_index], keeping the left edge (or the live end) in view."""
+        self.zoom_index = min(max(zoom_index, 0), len(self.ZOOM_LEVELS) - 1)
+        if self.follow:
+            self.view_start = max(self.data_start(), int(self.data_end() - self.visible_ticks()))
+        self.redraw()
+
+    def scroll_fractions(self):
+        """Returns (first, last) fractions of the data range that are visible, for a scrollbar."""
+        start, end = self.data_start(), self.data_end()
+        total = end - start
+        if total <= 0:
+            return 0.0, 1.0
+        first = (self.view_start - start) / total
+        last = (self.view_start + self.visible_ticks() - start) / total
+        return max(0.0, first), min(1.0, last)
+
+
+class GanttView(ttk.Frame):
+    """
+    Scrollable, zoomable Gantt chart widget built on GanttRenderer.
+    """
+    def __init__(self, master, height=100):
+        super().__init__(master)
+        self.canvas = tk.Canvas(self, bg="white", height=height, bd=2, relief="groove")
+        self.canvas.pack(fill=tk.X, expand=True)
+        self.renderer = GanttRenderer(self.canvas)
+
+        controls = ttk.Frame(self)
+        controls.pack(fill=tk.X)
+        self.scrollbar = ttk.Scrollbar(controls, orient=tk.HORIZONTAL, command=self.on_scroll)
+        self.scrollbar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Button(controls, text="-", width=3, command=self.zoom_out).pack(side=tk.LEFT, padx=2)
+        ttk.Button(controls, text="+", width=3, command=self.zoom_in).pack(side=tk.LEFT, padx=2)
+        self.zoom_label = ttk.Label(controls, width=14)
+        self.zoom_label.pack(side=tk.LEFT, padx=5)
+
+        self.canvas.bind("<Configure>", self.on_canvas_resize)
+        self._update_controls()
+
+    def set_lanes(self, lanes):
+        self.renderer.set_lanes(lanes)
+        self.canvas.config(height=self.renderer.required_height())
+        self._update_controls()
+
+    def clear(self):
+        self.renderer.clear()
+        self._update_controls()
+
+    def refresh(self):
+        self.renderer.refresh()
+        self._update_controls()
+
+    def redraw(self):
+        """Redraws from scratch, e.g. after a seek replaced the end of the timelines."""
+        renderer = self.renderer
+        renderer.scroll_to(renderer.data_end() if renderer.follow else renderer.view_start)
+        self._update_controls()
+
+    def on_canvas_resize(self, event):
+        """Redraws only the visible window when the canvas is resized."""
+        self.renderer.redraw()
+        self._update_controls()
+
+    def on_scroll(self, action, amount, unit=None):
+        renderer = self.renderer
+        if action == "moveto":
+            start, end = renderer.data_start(), renderer.data_end()
+            renderer.scroll_to(start + float(amount) * (end - start))
+        elif action == "scroll":
+            step = renderer.visible_ticks() if unit == "pages" else renderer.visible_ticks() / 10
+            renderer.scroll_to(renderer.view_start + int(amount) * max(1, int(step)))
+        self._update_controls()
+
+    def zoom_in(self):
+        self.renderer.set_zoom(self.renderer.zoom_index - 1)
+        self._update_controls()
+
+    def zoom_out(self):
+        self.renderer.set_zoom(self.renderer.zoom_index + 1)
+        self._update_controls()
+
+    def _update_controls(self):
+        self.scrollbar.set(*self.renderer.scroll_fractions())
+        pixels_per_tick = self.renderer.pixels_per_tick
+        if pixels_per_tick >= 1:
+            self.zoom_label.config(text=f"{pixels_per_tick:g} px/tick")
+        else:
+            self.zoom_label.config(text=f"{1 / pixels_per_tick:g} ticks/px")
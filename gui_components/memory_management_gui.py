@@ -2,9 +2,18 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from os_simulations.memory_management import MemoryManager
+from os_simulations import instrumentation
+from os_simulations.buddy_allocator import BuddyAllocator
+from os_simulations.memory_management import ALLOCATION_ALGORITHMS, MemoryManager
+from os_simulations.slab_allocator import SlabAllocator
 
 class MemoryManagementFrame(ttk.Frame):
+    ALLOCATORS = {
+        "Contiguous": MemoryManager,
+        "Buddy System": BuddyAllocator,
+        "Slab (size classes)": SlabAllocator,
+    }
+
     def __init__(self, master):
         super().__init__(master)
         self.memory_manager = MemoryManager(1000) 
@@ -26,16 +35,26 @@ class MemoryManagementFrame(ttk.Frame):
         self.total_memory_entry.insert(0, "1000")
         self.total_memory_entry.grid(row=0, column=1, sticky="ew", pady=2)
         
+        ttk.Label(mem_config_frame, text="Allocator:").grid(row=1, column=0, sticky="w", pady=2)
+        self.allocator_var = tk.StringVar(value="Contiguous")
+        allocator_combo = ttk.Combobox(mem_config_frame, textvariable=self.allocator_var, values=list(self.ALLOCATORS),
+                                       state="readonly", width=12)
+        allocator_combo.grid(row=1, column=1, sticky="ew", pady=2)
+        allocator_combo.bind("<<ComboboxSelected>>", lambda event: self.set_total_memory())
+
         set_memory_btn = ttk.Button(mem_config_frame, text="Set & Reset Memory", command=self.set_total_memory)
-        set_memory_btn.grid(row=1, column=0, columnspan=2, pady=5, sticky="ew")
+        set_memory_btn.grid(row=2, column=0, columnspan=2, pady=5, sticky="ew")
 
         
         algo_select_frame = ttk.LabelFrame(config_frame, text="Select Algorithm", padding="10")
         algo_select_frame.grid(row=0, column=1, padx=5, pady=5, sticky="nsew")
 
         self.algorithm_var = tk.StringVar(value="First Fit")
-        ttk.Radiobutton(algo_select_frame, text="First Fit", variable=self.algorithm_var, value="First Fit").pack(anchor="w")
-        ttk.Radiobutton(algo_select_frame, text="Best Fit", variable=self.algorithm_var, value="Best Fit").pack(anchor="w")
+        self.algorithm_buttons = []
+        for algorithm in ALLOCATION_ALGORITHMS:
+            button = ttk.Radiobutton(algo_select_frame, text=algorithm, variable=self.algorithm_var, value=algorithm)
+            button.pack(anchor="w")
+            self.algorithm_buttons.append(button)
 
        
         ops_frame = ttk.LabelFrame(config_frame, text="Memory Operations", padding="10")
@@ -84,17 +103,31 @@ class MemoryManagementFrame(ttk.Frame):
         self.largest_free_label = ttk.Label(stats_frame, text="Largest Free Block: 0 units", font=("Arial", 10))
         self.largest_free_label.grid(row=0, column=3, sticky="w", pady=2)
 
+        self.internal_frag_label = ttk.Label(stats_frame, text="", font=("Arial", 10))
+        self.internal_frag_label.grid(row=1, column=0, columnspan=4, sticky="w", pady=2)
+
+        self.slab_label = ttk.Label(stats_frame, text="", font=("Arial", 10))
+        self.slab_label.grid(row=2, column=0, columnspan=4, sticky="w", pady=2)
+
+        self.latency_label = ttk.Label(stats_frame, text="", font=("Arial", 10))
+        self.latency_label.grid(row=3, column=0, columnspan=4, sticky="w", pady=2)
+
     def on_canvas_resize(self, event):
         """Redraws the memory map when the canvas is resized."""
         self.draw_memory_map()
 
     def set_total_memory(self):
-        """Sets the total memory size and resets the memory manager."""
+        """Sets the total memory size and resets the memory manager, with the selected allocator."""
         try:
             new_total_memory = int(self.total_memory_entry.get())
             if new_total_memory <= 0:
                 raise ValueError
-            self.memory_manager = MemoryManager(new_total_memory)
+            allocator = self.ALLOCATORS[self.allocator_var.get()]
+            self.memory_manager = allocator(new_total_memory)
+            # The buddy system has one placement rule, so the algorithm choice does not apply.
+            state = tk.DISABLED if allocator is BuddyAllocator else tk.NORMAL
+            for button in self.algorithm_buttons:
+                button.config(state=state)
             self.draw_memory_map()
             self.update_stats_display()
         except ValueError:
@@ -122,6 +155,7 @@ class MemoryManagementFrame(ttk.Frame):
                 self.pid_entry.delete(0, tk.END)
                 self.size_entry.delete(0, tk.END)
             else:
+                self.update_latency_display()
                 messagebox.showinfo("Allocation Failed", "Could not allocate memory. No suitable free block found.")
         except ValueError:
             messagebox.showerror("Input Error", "Please enter a valid Process ID (text) and positive Memory Size (integer).")
@@ -184,6 +218,14 @@ class MemoryManagementFrame(ttk.Frame):
                 fill=fill_color, outline="black", width=1
             )
 
+            if block.get('used', block['size']) < block['size']:
+                # Internal fragmentation: the part of a buddy block or slab beyond the requests.
+                x_used = ((block['start'] + block['used']) / total_memory_size) * canvas_width
+                self.memory_canvas.create_rectangle(
+                    x_used, y_pos, x_end, y_pos + block_height,
+                    fill="white", stipple="gray50", outline=""
+                )
+
           
             if block['size'] / total_memory_size * canvas_width > 40: 
                 self.memory_canvas.create_text(
@@ -198,4 +240,39 @@ class MemoryManagementFrame(ttk.Frame):
         self.free_memory_label.config(text=f"Total Free Memory: {stats['free_memory']} units")
         self.allocated_memory_label.config(text=f"Total Allocated Memory: {stats['allocated_memory']} units")
         self.free_holes_label.config(text=f"Number of Free Holes: {stats['free_holes']}")
-        self.largest_free_label.config(text=f"Largest Free Block: {stats['largest_free_block']} units")
\ No newline at end of file
+        self.largest_free_label.config(text=f"Largest Free Block: {stats['largest_free_block']} units")
+        if 'internal_fragmentation' in stats:
+            self.internal_frag_label.config(
+                text=f"Internal Fragmentation: {stats['internal_fragmentation']} units "
+                     f"(requested {stats['requested_memory']} of {stats['allocated_memory']} allocated)"
+            )
+        else:
+            self.internal_frag_label.config(text="Internal Fragmentation: 0 units (blocks are sized exactly)")
+        if 'size_classes' in stats:
+            hit_rates = "   ".join(f"{size}: {size_class['hit_rate']:.0f}%"
+                                   for size, size_class in stats['size_classes'].items() if size_class['requests'])
+            self.slab_label.config(
+                text=f"Slab Utilization: {stats['slab_utilization']:.1f}% of {stats['slab_memory']} units"
+                     f"   Hit Rate by Size Class:   {hit_rates or 'no requests yet'}"
+            )
+        else:
+            self.slab_label.config(text="")
+        self.update_latency_display()
+
+    def update_latency_display(self):
+        """Shows the mean and p95 allocation latency of each algorithm, from the instrumentation hooks."""
+        timings = instrumentation.registry.snapshot()
+        parts = []
+        hooks = [(algorithm, f"MemoryManager.allocate[{algorithm}]") for algorithm in ALLOCATION_ALGORITHMS]
+        hooks.append(("Buddy System", "BuddyAllocator.allocate"))
+        hooks.append(("Slab", "SlabAllocator.allocate"))
+        for name, label in hooks:
+            timing = timings.get(label)
+            if timing and timing['calls']:
+                parts.append(f"{name}: {timing['mean_seconds'] * 1e6:.1f} / {timing['p95_seconds'] * 1e6:.1f} us")
+        if parts:
+            self.latency_label.config(text="Allocation Latency (mean / p95):   " + "   ".join(parts))
+        elif instrumentation.registry.enabled:
+            self.latency_label.config(text="Allocation Latency: no allocations timed yet.")
+        else:
+            self.latency_label.config(text="Allocation Latency: turn on Record Timings in the Performance tab.")
\ No newline at end of file
@@ -0,0 +1,160 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import time
+
+from os_simulations import instrumentation
+
+
+class PerformanceFrame(ttk.Frame):
+    """
+    Live view of the instrumentation hooks: a table of call counts and
+    latencies, a latency histogram per hook and the simulated ticks per
+    wall-clock second. Timing only happens while "Record Timings" is on.
+    """
+    REFRESH_MS = 500
+    HISTOGRAM_BUCKETS = 22  # 1 us to about 2 s in powers of two
+    ROW_HEIGHT = 60
+    LABEL_WIDTH = 240
+
+    def __init__(self, master, registry=None):
+        super().__init__(master)
+        self.registry = registry or instrumentation.registry
+        self._last_ticks = None  # (wall time, total ticks) at the previous refresh
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        control_frame = ttk.LabelFrame(self, text="Instrumentation", padding="10")
+        control_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=10)
+
+        self.enabled_var = tk.BooleanVar(value=self.registry.enabled)
+        ttk.Checkbutton(control_frame, text="Record Timings", variable=self.enabled_var,
+                        command=self.toggle_recording).grid(row=0, column=0, padx=5, sticky="w")
+        ttk.Button(control_frame, text="Reset", command=self.reset_stats).grid(row=0, column=1, padx=5)
+        ttk.Button(control_frame, text="Export JSON", command=self.export_json).grid(row=0, column=2, padx=5)
+
+        self.ticks_per_sec_label = ttk.Label(control_frame, text="Ticks/sec: -", font=("Arial", 10, "bold"))
+        self.ticks_per_sec_label.grid(row=0, column=3, padx=20, sticky="w")
+
+        table_frame = ttk.LabelFrame(self, text="Hot Paths", padding="10")
+        table_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=5)
+
+        columns = ('calls', 'total', 'mean', 'p50', 'p95', 'p99', 'max', 'ticks_per_sec')
+        headings = ("Calls", "Total (ms)", "Mean (us)", "p50 (us)", "p95 (us)", "p99 (us)", "Max (us)", "Ticks/sec")
+        self.stats_table = ttk.Treeview(table_frame, columns=columns, height=7)
+        self.stats_table.heading('#0', text="Function")
+        self.stats_table.column('#0', width=self.LABEL_WIDTH, anchor="w")
+        for column, heading in zip(columns, headings):
+            self.stats_table.heading(column, text=heading)
+            self.stats_table.column(column, width=90, anchor="e")
+        self.stats_table.pack(fill=tk.X)
+
+        histogram_frame = ttk.LabelFrame(self, text="Latency Histograms (log2 microsecond buckets)", padding="10")
+        histogram_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        self.histogram_canvas = tk.Canvas(histogram_frame, bg="white", bd=2, relief="groove")
+        scrollbar = ttk.Scrollbar(histogram_frame, orient="vertical", command=self.histogram_canvas.yview)
+        self.histogram_canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.histogram_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    def toggle_recording(self):
+        if self.enabled_var.get():
+            self.registry.enable()
+        else:
+            self.registry.disable()
+        self._last_ticks = None
+
+    def reset_stats(self):
+        self.registry.reset()
+        self._last_ticks = None
+        self.refresh(reschedule=False)
+
+    def export_json(self):
+        """Saves the raw statistics of every hook as JSON."""
+        path = filedialog.asksaveasfilename(
+            title="Export Timings",
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            self.registry.export_json(path)
+        except OSError as error:
+            messagebox.showerror("Export Error", str(error))
+
+    def refresh(self, reschedule=True):
+        """Redraws the table and histograms; reschedules itself every REFRESH_MS."""
+        snapshot = self.registry.snapshot()
+        self._update_ticks_per_sec(snapshot)
+        self._update_table(snapshot)
+        self._draw_histograms(snapshot)
+        if reschedule:
+            self.after(self.REFRESH_MS, self.refresh)
+
+    def _update_ticks_per_sec(self, snapshot):
+        """Simulated ticks per second over the last refresh interval, from the scheduler hooks."""
+        now = time.perf_counter()
+        ticks = sum(stats['ticks'] for stats in snapshot.values())
+        if self._last_ticks is not None and self.registry.enabled:
+            last_wall, last_ticks = self._last_ticks
+            rate = (ticks - last_ticks) / (now - last_wall) if now > last_wall else 0
+            self.ticks_per_sec_label.config(text=f"Ticks/sec: {rate:,.0f}")
+        elif not self.registry.enabled:
+            self.ticks_per_sec_label.config(text="Ticks/sec: - (recording off)")
+        self._last_ticks = (now, ticks)
+
+    def _update_table(self, snapshot):
+        def micros(seconds):
+            return f"{seconds * 1_000_000:,.1f}"
+
+        for label, stats in snapshot.items():
+            ticks_per_sec = stats['ticks_per_sec']
+            values = (
+                f"{stats['calls']:,}",
+                f"{stats['total_seconds'] * 1000:,.1f}",
+                micros(stats['mean_seconds']),
+                micros(stats['p50_seconds']),
+                micros(stats['p95_seconds']),
+                micros(stats['p99_seconds']),
+                micros(stats['max_seconds']),
+                "-" if ticks_per_sec is None else f"{ticks_per_sec:,.0f}",
+            )
+            if self.stats_table.exists(label):
+                self.stats_table.item(label, values=values)
+            else:
+                self.stats_table.insert('', tk.END, iid=label, text=label, values=values)
+
+    def _draw_histograms(self, snapshot):
+        canvas = self.histogram_canvas
+        canvas.delete("all")
+        width = max(canvas.winfo_width(), self.LABEL_WIDTH + 200)
+        bar_area = width - self.LABEL_WIDTH - 20
+        bar_width = bar_area / self.HISTOGRAM_BUCKETS
+        bar_height = self.ROW_HEIGHT - 20
+
+        for row, (label, stats) in enumerate(snapshot.items()):
+            top = row * self.ROW_HEIGHT + 5
+            base = top + bar_height
+            canvas.create_text(5, top + bar_height / 2, text=f"{label}\n{stats['calls']:,} calls",
+                               anchor="w", font=("Arial", 9))
+            canvas.create_line(self.LABEL_WIDTH, base, self.LABEL_WIDTH + bar_area, base, fill="gray")
+            counts = {}
+            for upper_us, calls in stats['histogram_us']:
+                bucket = min(upper_us.bit_length() - 1, self.HISTOGRAM_BUCKETS - 1)
+                counts[bucket] = counts.get(bucket, 0) + calls
+            tallest = max(counts.values(), default=0)
+            for bucket, calls in counts.items():
+                x0 = self.LABEL_WIDTH + bucket * bar_width
+                height = bar_height * calls / tallest
+                canvas.create_rectangle(x0 + 1, base - height, x0 + bar_width - 1, base,
+                                        fill="#007bff", outline="")
+
+        # Upper bucket bounds along the bottom: 1us, 4us, 16us, ...
+        axis = len(snapshot) * self.ROW_HEIGHT + 5
+        for bucket in range(0, self.HISTOGRAM_BUCKETS, 2):
+            bound = 2 ** bucket
+            text = f"{bound}us" if bound < 1000 else f"{bound / 1000:g}ms" if bound < 1_000_000 else f"{bound / 1_000_000:g}s"
+            canvas.create_text(self.LABEL_WIDTH + (bucket + 1) * bar_width, axis, text=text, anchor="n", font=("Arial", 8))
+        canvas.configure(scrollregion=(0, 0, width, axis + 20))
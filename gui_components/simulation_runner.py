@@ -0,0 +1,98 @@
+import queue
+import threading
+import time
+from collections import namedtuple
+
+
+Snapshot = namedtuple('Snapshot', 'time avg_wait avg_turnaround cpu_util context_switches metrics finished')
+
+
+class SimulationRunner:
+    """
+    Runs a scheduler on a worker thread and publishes Snapshot tuples on a queue.
+
+    ticks_per_second paces the simulation against the wall clock; None runs
+    it as fast as possible, in chunks sized to take a few milliseconds each.
+    A snapshot is published at most every snapshot_interval seconds (and
+    always at the end), so the queue never floods a slow consumer. The
+    consumer should drain the queue and apply only the newest snapshot.
+
+    The worker holds `lock` while it advances the scheduler; hold it too
+    while reading scheduler state such as the Gantt timelines.
+    """
+    TARGET_CHUNK_SECONDS = 0.005  # Work per lock hold when running flat out
+
+    def __init__(self, scheduler, ticks_per_second=None, snapshot_interval=1 / 30):
+        self.scheduler = scheduler
+        self.ticks_per_second = ticks_per_second
+        self.snapshot_interval = snapshot_interval
+        self.snapshots = queue.Queue()
+        self.lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="simulation-runner", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops the worker after its current chunk and waits for it."""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def set_speed(self, ticks_per_second):
+        """Changes the pace; None means as fast as possible. Safe to call from any thread."""
+        self.ticks_per_second = ticks_per_second
+
+    def _run(self):
+        scheduler = self.scheduler
+        speed = self.ticks_per_second
+        base_wall, base_tick = time.perf_counter(), scheduler.total_execution_time
+        last_published = 0.0
+        chunk = 1
+        while not self._stop_event.is_set():
+            if self.ticks_per_second != speed:
+                speed = self.ticks_per_second
+                base_wall, base_tick = time.perf_counter(), scheduler.total_execution_time
+
+            current = scheduler.total_execution_time
+            if speed is None:
+                target = current + chunk
+            else:
+                target = base_tick + int((time.perf_counter() - base_wall) * speed)
+                if target <= current:
+                    next_tick_due = base_wall + (current + 1 - base_tick) / speed
+                    self._stop_event.wait(min(max(0.0, next_tick_due - time.perf_counter()), self.snapshot_interval))
+                    continue
+
+            started = time.perf_counter()
+            with self.lock:
+                scheduler.advance_to(target, stop_when_finished=True)
+                finished = scheduler.is_finished()
+                if finished or started - last_published >= self.snapshot_interval:
+                    last_published = started
+                    self._publish(finished)
+            if finished:
+                return
+
+            if speed is None:
+                elapsed = time.perf_counter() - started
+                if elapsed < self.TARGET_CHUNK_SECONDS / 2:
+                    chunk *= 2
+                elif elapsed > self.TARGET_CHUNK_SECONDS * 2 and chunk > 1:
+                    chunk //= 2
+
+        with self.lock:
+            self._publish(False)  # Show exactly where a paused run stopped.
+
+    def _publish(self, finished):
+        metrics = self.scheduler.get_metrics()
+        self.snapshots.put(Snapshot(metrics['total_time'], metrics['avg_waiting_time'], metrics['avg_turnaround_time'],
+                                    metrics['cpu_utilization'], metrics['context_switches'], metrics, finished))
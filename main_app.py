@@ -7,6 +7,8 @@ from tkinter import ttk
 from gui_components.cpu_scheduling_gui import CPUSchedulingFrame
 from gui_components.memory_management_gui import MemoryManagementFrame
 from gui_components.deadlock_handling_gui import DeadlockHandlingFrame
+from gui_components.comparison_gui import ComparisonFrame
+from gui_components.performance_gui import PerformanceFrame
 
 class OSResourceDashboardApp:
     """
@@ -54,6 +56,14 @@ class OSResourceDashboardApp:
         self.deadlock_frame = DeadlockHandlingFrame(self.notebook)
         self.notebook.add(self.deadlock_frame, text="Deadlock Handling")
 
+        
+        self.comparison_frame = ComparisonFrame(self.notebook, lambda: self.cpu_frame.processes_data)
+        self.notebook.add(self.comparison_frame, text="Algorithm Comparison")
+
+        
+        self.performance_frame = PerformanceFrame(self.notebook)
+        self.notebook.add(self.performance_frame, text="Performance")
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = OSResourceDashboardApp(root)
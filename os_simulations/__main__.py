@@ -0,0 +1,238 @@
+# os_simulations/__main__.py
+
+"""
+Command line entry point for headless runs, e.g.
+
+    python -m os_simulations run cpu --algo rr --quantum 4 --input workload.csv
+    python -m os_simulations run memory --algo "Best Fit" --total-memory 1000 --input trace.csv
+    python -m os_simulations run memory --allocator slab --compare-first-fit --input trace.csv
+    python -m os_simulations run deadlock --input state.json
+    python -m os_simulations run cpu --algo rr --quantum 4 --input workload.csv --profile timings.json
+    python -m os_simulations run cpu --algo sjf --backend analytic --input workload.csv
+    python -m os_simulations run cpu --algo rr --quantum 4 --cpus 8 --queue global --input workload.csv
+    python -m os_simulations sweep --input workload.csv --algos fcfs sjf rr --quanta 1 2 4 8
+    python -m os_simulations bench --sizes 100 10000 --save baseline.json
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+from os_simulations import batch, instrumentation
+from os_simulations.sweep import SWEEP_COLUMNS, run_sweep, sweep_grid
+from os_simulations.workload import iter_processes, load_processes
+
+
+def _write_result(engine, result, args):
+    out = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        if args.format == 'json':
+            json.dump(result, out, indent=2)
+            out.write('\n')
+        else:
+            header, rows = batch.result_rows(engine, result)
+            writer = csv.writer(out)
+            writer.writerow(header)
+            writer.writerows(rows)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+def _write_timeline(path, timeline):
+    columns = ['cpu', 'pid', 'start', 'length'] if timeline and 'cpu' in timeline[0] else ['pid', 'start', 'length']
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows([segment[column] for column in columns] for segment in timeline)
+
+
+def _run(args):
+    if args.profile:
+        instrumentation.registry.enable()
+    try:
+        result, summary = _run_engine(args)
+    finally:
+        if args.profile:
+            instrumentation.registry.disable()
+            instrumentation.registry.export_json(args.profile)
+
+    if args.summary:
+        args.format = 'json'
+        result = summary
+    _write_result(args.engine, result, args)
+    if not args.summary and (args.format == 'csv' or args.output):
+        print(json.dumps(summary), file=sys.stderr)
+
+
+def _run_engine(args):
+    if args.engine == 'cpu':
+        processes = iter_processes(args.input) if args.stream else load_processes(args.input)
+        options = {}
+        if args.levels:
+            options['quanta'] = [quantum or None for quantum in args.levels]
+        if args.boost_interval:
+            options['boost_interval'] = args.boost_interval
+        details = not args.summary or args.timeline is not None  # --timeline needs the timeline even then
+        result = batch.run_cpu_simulation(processes, args.algo, args.quantum, args.backend,
+                                          stream=args.stream, details=details,
+                                          aging_interval=args.aging_interval, cpus=args.cpus,
+                                          queue_mode=args.queue, work_stealing=not args.no_stealing, **options)
+        if args.timeline:
+            _write_timeline(args.timeline, result['timeline'])
+        summary = result['metrics']
+    elif args.engine == 'memory':
+        operations = batch.load_memory_trace(args.input)
+        result = batch.run_memory_simulation(operations, args.total_memory, args.algo, args.allocator)
+        summary = result['stats']
+        if args.compare_first_fit:
+            result['first_fit_comparison'] = batch.compare_with_first_fit(result, operations)
+            summary = dict(summary, first_fit_comparison=result['first_fit_comparison'])
+    else:
+        result = batch.run_deadlock_detection(batch.load_deadlock_state(args.input))
+        summary = {'result': result['result']}
+    return result, summary
+
+
+def _sweep(args):
+    configs = sweep_grid(args.algos, args.quanta)
+    rows = run_sweep(load_processes(args.input), configs, args.workers)
+    out = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        if args.format == 'json':
+            json.dump(rows, out, indent=2)
+            out.write('\n')
+        else:
+            writer = csv.DictWriter(out, fieldnames=SWEEP_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+def _check_analytic(args):
+    from os_simulations.analytic import check_against_engine
+
+    mismatches = check_against_engine(args.trials, args.max_processes, args.seed)
+    for mismatch in mismatches:
+        print(mismatch)
+    print(f"{args.trials} random workloads checked, {len(mismatches)} mismatches.")
+    if mismatches:
+        sys.exit(1)
+
+
+def _bench(args):
+    from os_simulations import benchmark
+
+    baseline = benchmark.load_baseline(args.compare) if args.compare else None
+    writer = csv.DictWriter(sys.stdout, fieldnames=benchmark.BENCH_COLUMNS)
+    writer.writeheader()
+    results = benchmark.run_benchmarks(args.sizes, args.algos, args.quantum, args.mode, args.seed,
+                                       args.distribution, measure_memory=not args.no_memory,
+                                       progress=lambda row: (writer.writerow(row), sys.stdout.flush()))
+    if args.save:
+        benchmark.save_baseline(results, args.save)
+    if baseline is not None:
+        comparison = benchmark.compare_to_baseline(results, baseline, args.tolerance)
+        regressions = 0
+        for row in comparison:
+            flag = '  REGRESSION' if row['regression'] else ''
+            regressions += row['regression']
+            print(f"{row['algorithm']:>5} {row['processes']:>9} {row['mode']}: "
+                  f"{row['baseline_ticks_per_sec']} -> {row['ticks_per_sec']} ticks/s (x{row['ratio']}){flag}",
+                  file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m os_simulations',
+                                     description='Run the OS simulation engines without the GUI.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='Run one simulation and print its results.')
+    run.add_argument('engine', choices=['cpu', 'memory', 'deadlock'])
+    run.add_argument('--input', required=True,
+                     help='cpu: CSV/JSONL of pid,arrival,burst[,priority][,bursts]; memory: CSV of op,pid,size; '
+                          'deadlock: JSON state.')
+    run.add_argument('--algo', help="cpu: fcfs, sjf, rr, srtf, priority or mlfq (default fcfs); "
+                                    "memory: 'First Fit', 'Best Fit', 'Next Fit' or 'Worst Fit'.")
+    run.add_argument('--quantum', type=int, help='Round Robin time quantum.')
+    run.add_argument('--aging-interval', type=int,
+                     help='priority only: waiting ticks per priority level gained (default: no aging).')
+    run.add_argument('--total-memory', type=int, default=1000, help='Memory size for the memory engine.')
+    run.add_argument('--allocator', choices=['contiguous', 'buddy', 'slab'], default='contiguous',
+                     help='memory only: variable-size holes (with --algo), a binary buddy system, '
+                          'or size-class slabs over variable-size holes.')
+    run.add_argument('--compare-first-fit', action='store_true',
+                     help='memory only: also replay the trace with plain First Fit and report '
+                          'the fragmentation the allocator prevented.')
+    run.add_argument('--format', choices=['json', 'csv'], default='json')
+    run.add_argument('--output', help='Write results to this file instead of stdout.')
+    run.add_argument('--levels', nargs='+', type=int,
+                     help='mlfq only: quantum of each level, top first; 0 makes the last level FCFS '
+                          '(default: --quantum x 1, 2, 4, or 2 4 8).')
+    run.add_argument('--boost-interval', type=int, help='mlfq only: ticks between priority boosts.')
+    run.add_argument('--cpus', type=int, default=1, help='cpu only: simulate an SMP system (fcfs or rr).')
+    run.add_argument('--queue', choices=['per-cpu', 'global'], default='per-cpu',
+                     help='cpu only: run queue layout with --cpus.')
+    run.add_argument('--no-stealing', action='store_true', help='cpu only: disable work stealing with --cpus.')
+    run.add_argument('--timeline', help='cpu only: also write the Gantt timeline as CSV to this file, '
+                                        'with or without --summary.')
+    run.add_argument('--stream', action='store_true',
+                     help='cpu only: read the input lazily; it must be sorted by arrival.')
+    run.add_argument('--summary', action='store_true', help='Only output the summary metrics as JSON.')
+    run.add_argument('--profile', help='Time the hot paths and write the call counts and latencies as JSON here.')
+    run.add_argument('--backend', choices=['engine', 'analytic'], default='engine',
+                     help='cpu only: analytic uses the NumPy fast path for fcfs and sjf.')
+    run.set_defaults(handler=_run)
+
+    sweep = commands.add_parser('sweep', help='Compare algorithms and quanta on one workload in parallel.')
+    sweep.add_argument('--input', required=True, help='CSV/JSONL of pid,arrival,burst[,priority][,bursts].')
+    sweep.add_argument('--algos', nargs='+', default=['fcfs', 'sjf', 'rr'])
+    sweep.add_argument('--quanta', nargs='+', type=int, default=[2, 4, 8], help='Quanta tried for Round Robin.')
+    sweep.add_argument('--workers', type=int, help='Worker processes (default: CPU count).')
+    sweep.add_argument('--format', choices=['json', 'csv'], default='csv')
+    sweep.add_argument('--output', help='Write the table to this file instead of stdout.')
+    sweep.set_defaults(handler=_sweep)
+
+    check = commands.add_parser('check-analytic', help='Compare the analytic backend with the tick engine.')
+    check.add_argument('--trials', type=int, default=50)
+    check.add_argument('--max-processes', type=int, default=40)
+    check.add_argument('--seed', type=int, default=0)
+    check.set_defaults(handler=_check_analytic)
+
+    bench = commands.add_parser('bench', help='Time the scheduler engines on synthetic workloads.')
+    bench.add_argument('--sizes', nargs='+', type=int, default=[100, 10_000, 1_000_000],
+                       help='Workload sizes in processes.')
+    bench.add_argument('--algos', nargs='+', default=['fcfs', 'sjf', 'rr'])
+    bench.add_argument('--quantum', type=int, default=4, help='Round Robin time quantum.')
+    bench.add_argument('--mode', choices=['tick', 'event'], default='tick',
+                       help='tick calls step() every tick; event uses run_to_completion().')
+    bench.add_argument('--distribution', choices=['exponential', 'bimodal', 'heavy-tailed'], default='exponential',
+                       help='Burst time distribution of the generated workloads.')
+    bench.add_argument('--seed', type=int, default=0)
+    bench.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc peak memory run.')
+    bench.add_argument('--save', help='Save the results as a JSON baseline to this file.')
+    bench.add_argument('--compare', help='Compare ticks/sec with a saved baseline; exit 1 on a regression.')
+    bench.add_argument('--tolerance', type=float, default=0.1,
+                       help='Fractional ticks/sec drop that counts as a regression (default 0.1).')
+    bench.set_defaults(handler=_bench)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'run' and args.algo is None:
+        args.algo = 'fcfs' if args.engine == 'cpu' else 'First Fit'
+    try:
+        args.handler(args)
+    except (ImportError, OSError, ValueError) as error:
+        parser.exit(1, f"error: {error}\n")
+
+
+if __name__ == '__main__':
+    main()
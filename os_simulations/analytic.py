@@ -0,0 +1,173 @@
+# os_simulations/analytic.py
+
+"""
+Closed-form backend for the non-preemptive schedulers (FCFS and SJF).
+
+Once the dispatch order is known, completion times are a cumulative sum of
+bursts clamped by arrival times:
+
+    completion[k] = C[k] + max(arrival[j] - C[j-1] for j <= k)
+
+where C is the running sum of bursts in dispatch order. That is a cumsum
+and a running maximum, so start, completion, waiting and turnaround times
+for millions of processes are computed with a few NumPy array operations.
+The results match what FCFSScheduler and SJFScheduler produce tick by tick.
+
+NumPy is only needed for this module.
+"""
+
+import heapq
+import random
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from os_simulations.cpu_scheduling import FCFSScheduler, Process, SJFScheduler
+from os_simulations.quantile_sketch import QuantileSketch
+
+ANALYTIC_ALGORITHMS = ('fcfs', 'sjf')
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("The analytic backend needs NumPy (pip install numpy).")
+
+
+def _sjf_order(arrival, burst, by_arrival):
+    """
+    Dispatch order of non-preemptive SJF, as indices into the input arrays.
+    Ties are broken like SJFScheduler: (burst, arrival, admission order).
+    """
+    arrival_sorted = arrival[by_arrival].tolist()
+    burst_sorted = burst[by_arrival].tolist()
+    count = len(arrival_sorted)
+    order = []
+    ready = []
+    time = 0
+    next_index = 0
+    while len(order) < count:
+        if not ready and time < arrival_sorted[next_index]:
+            time = arrival_sorted[next_index]
+        while next_index < count and arrival_sorted[next_index] <= time:
+            heapq.heappush(ready, (burst_sorted[next_index], arrival_sorted[next_index], next_index))
+            next_index += 1
+        process_burst, _, index = heapq.heappop(ready)
+        order.append(index)
+        time += process_burst
+    return by_arrival[np.asarray(order, dtype=np.int64)]
+
+
+def _metrics(ordered_waiting, ordered_turnaround, busy_time, total_time):
+    """
+    BaseScheduler.get_metrics() for a schedule given in dispatch (= completion)
+    order. Percentiles use the same sketches as the engine, fed in the same order;
+    the response time of a non-preemptive run is its waiting time. There is no I/O.
+    """
+    count = len(ordered_waiting)
+    waiting_sketch = QuantileSketch()
+    turnaround_sketch = QuantileSketch()
+    for waiting, turnaround in zip(ordered_waiting.tolist(), ordered_turnaround.tolist()):
+        waiting_sketch.add(waiting)
+        turnaround_sketch.add(turnaround)
+    return {
+        'avg_waiting_time': float(ordered_waiting.mean()) if count else 0,
+        'avg_turnaround_time': float(ordered_turnaround.mean()) if count else 0,
+        'cpu_utilization': busy_time / total_time * 100 if total_time > 0 else 0,
+        'context_switches': count,
+        'completed_processes': count,
+        'total_time': total_time,
+        'throughput': count / total_time if total_time > 0 else 0.0,
+        'percentiles': {
+            'waiting_time': waiting_sketch.summary(),
+            'turnaround_time': turnaround_sketch.summary(),
+            'response_time': waiting_sketch.summary(),
+        },
+        'device_utilization': {},
+        'io_utilization': 0.0,
+        'cpu_io_overlap': 0.0,
+    }
+
+
+def analyze(arrival, burst, algorithm='fcfs'):
+    """
+    Computes the schedule of a non-preemptive algorithm analytically.
+    :param arrival: Sequence or array of arrival times.
+    :param burst: Sequence or array of burst times (positive).
+    :param algorithm: 'fcfs' or 'sjf'.
+    :return: dict with 'order' (dispatch order as input indices), per-process
+             'start_time', 'completion_time', 'waiting_time' and 'turnaround_time'
+             arrays in input order, and 'metrics' shaped like BaseScheduler.get_metrics().
+    """
+    _require_numpy()
+    algorithm = algorithm.lower()
+    if algorithm not in ANALYTIC_ALGORITHMS:
+        raise ValueError(f"The analytic backend supports {', '.join(ANALYTIC_ALGORITHMS)}, not '{algorithm}'.")
+    arrival = np.asarray(arrival, dtype=np.int64)
+    burst = np.asarray(burst, dtype=np.int64)
+    count = len(arrival)
+    if count == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return {'order': empty, 'start_time': empty, 'completion_time': empty, 'waiting_time': empty,
+                'turnaround_time': empty, 'metrics': _metrics(empty, empty, 0, 0)}
+
+    by_arrival = np.argsort(arrival, kind='stable')
+    order = by_arrival if algorithm == 'fcfs' else _sjf_order(arrival, burst, by_arrival)
+
+    ordered_arrival = arrival[order]
+    ordered_burst = burst[order]
+    cumulative = np.cumsum(ordered_burst)
+    previous_cumulative = cumulative - ordered_burst
+    ordered_completion = cumulative + np.maximum.accumulate(ordered_arrival - previous_cumulative)
+
+    completion = np.empty(count, dtype=np.int64)
+    completion[order] = ordered_completion
+    start = completion - burst
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+
+    metrics = _metrics(waiting[order], turnaround[order], int(cumulative[-1]), int(ordered_completion[-1]))
+    return {'order': order, 'start_time': start, 'completion_time': completion,
+            'waiting_time': waiting, 'turnaround_time': turnaround, 'metrics': metrics}
+
+
+def analyze_processes(processes, algorithm='fcfs'):
+    """Like analyze(), for a list of Process objects."""
+    return analyze([p.arrival_time for p in processes], [p.burst_time for p in processes], algorithm)
+
+
+def check_against_engine(trials=50, max_processes=40, seed=0):
+    """
+    Runs random workloads through both this backend and the tick engine.
+    :return: List of mismatch descriptions (empty when everything agrees).
+    """
+    _require_numpy()
+    rng = random.Random(seed)
+    mismatches = []
+    for trial in range(trials):
+        processes = [Process(f"P{i}", rng.randint(0, 60), rng.randint(1, 12))
+                     for i in range(rng.randint(1, max_processes))]
+        for algorithm, scheduler_class in (('fcfs', FCFSScheduler), ('sjf', SJFScheduler)):
+            scheduler = scheduler_class()
+            scheduler.add_processes(processes)
+            current_time = 0
+            while not scheduler.is_finished():
+                scheduler.step(current_time)
+                current_time += 1
+
+            result = analyze_processes(processes, algorithm)
+            expected = {p.pid: (p.start_time, p.completion_time, p.waiting_time, p.turnaround_time)
+                        for p in scheduler.completed_processes}
+            for index, p in enumerate(processes):
+                got = (int(result['start_time'][index]), int(result['completion_time'][index]),
+                       int(result['waiting_time'][index]), int(result['turnaround_time'][index]))
+                if got != expected[p.pid]:
+                    mismatches.append(f"trial {trial} {algorithm} {p.pid}: analytic {got} != engine {expected[p.pid]}")
+            engine_metrics = scheduler.get_metrics()
+            for key, value in result['metrics'].items():
+                engine_value = engine_metrics[key]
+                differs = value != engine_value if isinstance(value, dict) else abs(engine_value - value) > 1e-9
+                if differs:
+                    mismatches.append(f"trial {trial} {algorithm} {key}: analytic {value} != engine {engine_value}")
+    return mismatches
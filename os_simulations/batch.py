@@ -0,0 +1,273 @@
+# os_simulations/batch.py
+
+"""
+Headless drivers for the simulation engines.
+
+Each run_* function takes plain Python data, runs an engine as fast as
+possible and returns a JSON-serialisable dict. Nothing here imports tkinter.
+"""
+
+import csv
+import json
+
+from os_simulations.cpu_scheduling import create_scheduler
+from os_simulations.buddy_allocator import BuddyAllocator
+from os_simulations.deadlock_handling import DeadlockDetector
+from os_simulations.memory_management import MemoryManager
+from os_simulations.slab_allocator import SlabAllocator
+from os_simulations.smp_scheduling import SMPScheduler
+
+
+def run_cpu_simulation(processes, algorithm, quantum=None, backend='engine', stream=False, details=True,
+                       aging_interval=None, cpus=1, queue_mode='per-cpu', work_stealing=True, **scheduler_options):
+    """
+    Runs a CPU scheduling workload to completion with the event engine
+    or, for non-preemptive algorithms, the analytic backend.
+    :param processes: Iterable of Process objects, or with stream=True an iterator of
+                      (pid, arrival, burst[, priority[, io]]) rows sorted by arrival.
+    :param algorithm: Scheduler short name ('fcfs', 'sjf', 'rr', 'srtf', 'priority').
+    :param backend: 'engine', or 'analytic' for the NumPy fast path (fcfs and sjf only).
+    :param stream: Feed rows to the engine lazily (engine backend only). With details=False
+                   the run then holds only the processes in the system and no timeline.
+    :param details: Include per-process rows and the timeline; False returns metrics only.
+    :param aging_interval: Priority aging interval for the 'priority' algorithm.
+    :param cpus: More than 1 runs an SMPScheduler ('fcfs' or 'rr') with the given
+                 queue_mode and work_stealing; timeline entries then carry a 'cpu'.
+    :param scheduler_options: Extra scheduler arguments, e.g. quanta and boost_interval for 'mlfq'.
+    :return: dict with 'metrics', per-process 'processes' and the Gantt 'timeline'.
+    """
+    if backend == 'analytic':
+        if cpus > 1:
+            raise ValueError("The analytic backend models a single CPU.")
+        if stream:
+            raise ValueError("The analytic backend needs the whole workload; it cannot stream.")
+        processes = list(processes)
+        if any(p.io_bursts for p in processes):
+            raise ValueError("The analytic backend models CPU bursts only; use the engine for I/O.")
+        result = _run_cpu_analytic(processes, algorithm)
+        if not details:
+            del result['processes'], result['timeline']
+        return result
+    gantt_max_segments = 1 if stream and not details else None
+    if cpus > 1:
+        scheduler = SMPScheduler(cpus, algorithm, quantum, queue_mode, work_stealing, gantt_max_segments)
+    else:
+        scheduler = create_scheduler(algorithm, quantum, aging_interval, gantt_max_segments=gantt_max_segments,
+                                     **scheduler_options)
+    completed = []  # Streamed runs release completed rows, so their figures are collected as they complete.
+    if stream:
+        scheduler.load_stream(processes, completed.append if details else None)
+    else:
+        scheduler.add_processes(processes)
+    scheduler.run_to_completion()
+    result = {
+        'algorithm': algorithm,
+        'quantum': quantum,
+        'metrics': scheduler.get_metrics(),
+    }
+    if not details:
+        return result
+    if not stream:
+        completed = [
+            {
+                'pid': p.pid,
+                'arrival_time': p.arrival_time,
+                'burst_time': p.burst_time,
+                'start_time': p.start_time,
+                'completion_time': p.completion_time,
+                'waiting_time': p.waiting_time,
+                'turnaround_time': p.turnaround_time,
+            }
+            for p in scheduler.completed_processes
+        ]
+    result.update({
+        'processes': completed,
+        'timeline': [{'pid': pid, 'start': start, 'length': length}
+                     for pid, start, length in scheduler.gantt_chart],
+    })
+    if cpus > 1:
+        result['timeline'] = [{'cpu': cpu, 'pid': pid, 'start': start, 'length': length}
+                              for cpu, timeline in enumerate(scheduler.gantt_charts)
+                              for pid, start, length in timeline]
+    return result
+
+
+def _run_cpu_analytic(processes, algorithm):
+    from os_simulations.analytic import analyze_processes
+
+    result = analyze_processes(processes, algorithm)
+    rows = []
+    timeline = []
+    for index in result['order'].tolist():
+        p = processes[index]
+        start = int(result['start_time'][index])
+        if timeline and timeline[-1]['start'] + timeline[-1]['length'] < start:
+            idle_start = timeline[-1]['start'] + timeline[-1]['length']
+            timeline.append({'pid': 'Idle', 'start': idle_start, 'length': start - idle_start})
+        elif not timeline and start > 0:
+            timeline.append({'pid': 'Idle', 'start': 0, 'length': start})
+        timeline.append({'pid': p.pid, 'start': start, 'length': p.burst_time})
+        rows.append({
+            'pid': p.pid,
+            'arrival_time': p.arrival_time,
+            'burst_time': p.burst_time,
+            'start_time': start,
+            'completion_time': int(result['completion_time'][index]),
+            'waiting_time': int(result['waiting_time'][index]),
+            'turnaround_time': int(result['turnaround_time'][index]),
+        })
+    return {
+        'algorithm': algorithm,
+        'quantum': None,
+        'metrics': result['metrics'],
+        'processes': rows,
+        'timeline': timeline,
+    }
+
+
+def load_memory_trace(path):
+    """
+    Reads a memory trace CSV with an 'op' column ('allocate' or 'deallocate'),
+    a 'pid' column and, for allocations, a 'size' column.
+    """
+    operations = []
+    with open(path, newline='') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            op = (row.get('op') or '').strip().lower()
+            pid = (row.get('pid') or '').strip()
+            if op not in ('allocate', 'deallocate') or not pid:
+                raise ValueError(f"Line {reader.line_num}: need op 'allocate' or 'deallocate' and a pid.")
+            operation = {'op': op, 'pid': pid}
+            if op == 'allocate':
+                try:
+                    operation['size'] = int(row.get('size'))
+                except (TypeError, ValueError):
+                    raise ValueError(f"Line {reader.line_num}: allocations need an integer size.")
+            operations.append(operation)
+    return operations
+
+
+MEMORY_ALLOCATORS = {
+    'contiguous': MemoryManager,
+    'buddy': BuddyAllocator,
+    'slab': SlabAllocator,
+}
+
+
+def run_memory_simulation(operations, total_memory, algorithm='First Fit', allocator='contiguous'):
+    """
+    Replays a list of {'op', 'pid', 'size'} operations against a memory allocator.
+    :param allocator: A MEMORY_ALLOCATORS name. The buddy allocator ignores algorithm
+                      and adds internal fragmentation to the stats; the slab allocator
+                      uses algorithm for slabs and large blocks and adds slab utilisation
+                      and per-size-class hit rates.
+    :return: dict with per-operation 'results', final 'stats' and 'memory_map'.
+    """
+    try:
+        manager = MEMORY_ALLOCATORS[allocator](total_memory)
+    except KeyError:
+        raise ValueError(f"Unknown memory allocator '{allocator}'. Choose from: {', '.join(MEMORY_ALLOCATORS)}.")
+    results = []
+    for operation in operations:
+        if operation['op'] == 'allocate':
+            success = manager.allocate(operation['pid'], operation['size'], algorithm)
+        else:
+            success = manager.deallocate(operation['pid'])
+        results.append(dict(operation, success=success))
+    return {
+        'algorithm': algorithm,
+        'allocator': allocator,
+        'total_memory': total_memory,
+        'results': results,
+        'stats': manager.calculate_stats(),
+        'memory_map': manager.get_memory_map_data(),
+    }
+
+
+def fragmentation_summary(result):
+    """
+    Fragmentation figures of a run_memory_simulation() result: failed allocations,
+    free holes, largest free block and external fragmentation, the percentage of
+    free memory outside the largest hole.
+    """
+    stats = result['stats']
+    free_memory = stats['free_memory']
+    return {
+        'failed_allocations': sum(1 for r in result['results'] if r['op'] == 'allocate' and not r['success']),
+        'free_holes': stats['free_holes'],
+        'largest_free_block': stats['largest_free_block'],
+        'external_fragmentation': (1 - stats['largest_free_block'] / free_memory) * 100 if free_memory else 0.0,
+    }
+
+
+def compare_with_first_fit(result, operations):
+    """
+    Replays the trace of a run_memory_simulation() result with a plain First Fit
+    MemoryManager and reports how much fragmentation the result's allocator prevented.
+    :return: dict with the fragmentation_summary() of both runs and 'prevented', the
+             First Fit figures minus the allocator's (positive is better).
+    """
+    baseline = run_memory_simulation(operations, result['total_memory'], 'First Fit', 'contiguous')
+    ours = fragmentation_summary(result)
+    first_fit = fragmentation_summary(baseline)
+    return {
+        'allocator': ours,
+        'first_fit': first_fit,
+        'prevented': {key: first_fit[key] - ours[key]
+                      for key in ('failed_allocations', 'free_holes', 'external_fragmentation')},
+    }
+
+
+def run_deadlock_detection(state):
+    """
+    Builds a DeadlockDetector from a dict of the form
+    {'resources': {rid: instances}, 'processes': {pid: {'allocated': {rid: qty}, 'requested': {rid: qty}}}}
+    and runs deadlock detection on it.
+    :return: dict with the detection 'result', any setup 'errors' and the final state.
+    """
+    detector = DeadlockDetector()
+    errors = []
+    for rid, instances in state.get('resources', {}).items():
+        detector.add_resource(rid, int(instances))
+    for pid, process_state in state.get('processes', {}).items():
+        detector.add_process(pid)
+        for rid, quantity in process_state.get('allocated', {}).items():
+            success, message = detector.allocate_resource(pid, rid, int(quantity))
+            if not success:
+                errors.append(message)
+        for rid, quantity in process_state.get('requested', {}).items():
+            success, message = detector.request_resource(pid, rid, int(quantity))
+            if not success:
+                errors.append(message)
+
+    resources, processes = detector.get_current_state()
+    return {
+        'result': detector.detect_deadlock(),
+        'errors': errors,
+        'resources': resources,
+        'processes': processes,
+    }
+
+
+def load_deadlock_state(path):
+    """Reads a deadlock scenario from a JSON file (see run_deadlock_detection)."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def result_rows(engine, result):
+    """Flattens a run_* result into (header, rows) for CSV output."""
+    if engine == 'cpu':
+        header = ['pid', 'arrival_time', 'burst_time', 'start_time', 'completion_time',
+                  'waiting_time', 'turnaround_time']
+        return header, [[p[column] for column in header] for p in result['processes']]
+    if engine == 'memory':
+        header = ['start', 'size', 'status', 'process_id']
+        return header, [[block[column] for column in header] for block in result['memory_map']]
+    header = ['pid', 'resource', 'allocated', 'requested']
+    rows = []
+    for pid, process_state in result['processes'].items():
+        for rid in sorted(set(process_state['allocated']) | set(process_state['requested'])):
+            rows.append([pid, rid, process_state['allocated'].get(rid, 0), process_state['requested'].get(rid, 0)])
+    return header, rows
@@ -0,0 +1,146 @@
+# os_simulations/benchmark.py
+
+"""
+Benchmark suite for the CPU scheduling engines.
+
+Each case generates a seeded synthetic workload (see workload.generate_processes),
+drives a scheduler over it and reports simulated ticks per wall-clock second and
+the peak Python heap used by the run. Results can be saved as a JSON baseline and
+later runs compared against it, so slowdowns in cpu_scheduling.py show up as numbers.
+
+    python -m os_simulations bench --sizes 100 10000 --save baseline.json
+    python -m os_simulations bench --sizes 100 10000 --compare baseline.json
+"""
+
+import json
+import platform
+import time
+import tracemalloc
+
+from os_simulations.cpu_scheduling import create_scheduler
+from os_simulations.workload import generate_workload
+
+DEFAULT_SIZES = (100, 10_000, 1_000_000)
+DEFAULT_ALGORITHMS = ('fcfs', 'sjf', 'rr')
+BENCH_COLUMNS = ['algorithm', 'processes', 'mode', 'ticks', 'seconds', 'ticks_per_sec', 'peak_memory_kib']
+BASELINE_VERSION = 1
+
+
+def _drive(scheduler, mode):
+    """Runs a loaded scheduler to the end and returns the simulated time."""
+    if mode == 'event':
+        scheduler.run_to_completion()
+        return scheduler.total_execution_time
+    current_time = 0
+    step = scheduler.step
+    is_finished = scheduler.is_finished
+    while not is_finished():
+        step(current_time)
+        current_time += 1
+    return current_time
+
+
+def run_case(workload, algorithm, quantum=4, mode='tick', measure_memory=True):
+    """
+    Times one algorithm on one workload.
+    :param workload: ProcessTable, e.g. from generate_workload().
+    :param mode: 'tick' calls step() once per tick like the GUI; 'event' uses run_to_completion().
+    :param measure_memory: Repeat the run under tracemalloc to record the peak heap.
+                           It is a separate run because tracing slows the interpreter down.
+    :return: dict keyed by BENCH_COLUMNS.
+    """
+    if mode not in ('tick', 'event'):
+        raise ValueError(f"Unknown benchmark mode '{mode}'. Choose 'tick' or 'event'.")
+    if algorithm.lower() != 'rr':
+        quantum = None
+    scheduler = create_scheduler(algorithm, quantum)
+    scheduler.add_processes(workload)
+    started = time.perf_counter()
+    ticks = _drive(scheduler, mode)
+    seconds = time.perf_counter() - started
+
+    peak = None
+    if measure_memory:
+        scheduler = create_scheduler(algorithm, quantum)
+        scheduler.add_processes(workload)
+        tracemalloc.start()
+        try:
+            _drive(scheduler, mode)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'algorithm': algorithm,
+        'processes': len(workload),
+        'mode': mode,
+        'ticks': ticks,
+        'seconds': round(seconds, 6),
+        'ticks_per_sec': round(ticks / seconds) if seconds > 0 else None,
+        'peak_memory_kib': None if peak is None else round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, algorithms=DEFAULT_ALGORITHMS, quantum=4, mode='tick', seed=0,
+                   burst_distribution='exponential', measure_memory=True, progress=None):
+    """
+    Runs every algorithm at every workload size. Each size uses one generated
+    workload shared by all algorithms.
+    :param progress: Optional callable receiving each result row as it finishes.
+    :return: List of result rows.
+    """
+    results = []
+    for size in sizes:
+        workload = generate_workload(size, seed=seed, burst_distribution=burst_distribution)
+        for algorithm in algorithms:
+            row = run_case(workload, algorithm, quantum, mode, measure_memory)
+            results.append(row)
+            if progress is not None:
+                progress(row)
+    return results
+
+
+def save_baseline(results, path):
+    """Writes benchmark results, with the interpreter and platform they ran on, to a JSON file."""
+    with open(path, 'w') as f:
+        json.dump({
+            'version': BASELINE_VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results,
+        }, f, indent=2)
+        f.write('\n')
+
+
+def load_baseline(path):
+    with open(path) as f:
+        data = json.load(f)
+    if data.get('version') != BASELINE_VERSION or 'results' not in data:
+        raise ValueError(f"{path} is not a benchmark baseline file.")
+    return data['results']
+
+
+def compare_to_baseline(results, baseline, tolerance=0.1):
+    """
+    Matches results to baseline rows by (algorithm, processes, mode).
+    :param tolerance: Fractional drop in ticks/sec that counts as a regression.
+    :return: List of dicts with both throughputs, their 'ratio' (current / baseline)
+             and a 'regression' flag. Cases missing from the baseline are skipped.
+    """
+    previous = {(row['algorithm'], row['processes'], row['mode']): row for row in baseline}
+    comparison = []
+    for row in results:
+        before = previous.get((row['algorithm'], row['processes'], row['mode']))
+        if before is None or not before['ticks_per_sec'] or not row['ticks_per_sec']:
+            continue
+        ratio = row['ticks_per_sec'] / before['ticks_per_sec']
+        comparison.append({
+            'algorithm': row['algorithm'],
+            'processes': row['processes'],
+            'mode': row['mode'],
+            'baseline_ticks_per_sec': before['ticks_per_sec'],
+            'ticks_per_sec': row['ticks_per_sec'],
+            'ratio': round(ratio, 3),
+            'regression': ratio < 1 - tolerance,
+        })
+    return comparison
@@ -0,0 +1,153 @@
+# os_simulations/buddy_allocator.py
+
+from os_simulations import instrumentation
+
+
+class BuddyAllocator:
+    """
+    Binary buddy allocator with the same interface as MemoryManager.
+
+    Memory is handed out in blocks of min_block_size * 2**order units. A
+    request gets the smallest order that fits, splitting a larger free block
+    in halves as needed; a freed block merges with its buddy (the other half
+    of the block it was split from) for as long as that buddy is free too.
+    Both take O(log N) steps. The rounding up is internal fragmentation,
+    reported separately from the free holes left between blocks.
+
+    Each order has a free list (a dict of block starts, for O(1) removal of
+    a buddy) and a bitmap with one bit per buddy pair that holds "exactly one
+    of the pair is free". Toggling the bit when a block is freed says whether
+    its buddy is free, without searching the list.
+
+    A total that is not a power of two is covered by several top-level
+    blocks (e.g. 1000 = 512 + 256 + 128 + 64 + 32 + 8), which never merge.
+    """
+    def __init__(self, total_memory_size, min_block_size=1):
+        if min_block_size <= 0:
+            raise ValueError("min_block_size must be a positive integer.")
+        if total_memory_size <= 0 or total_memory_size % min_block_size:
+            raise ValueError("The total memory must be a positive multiple of min_block_size.")
+        self.total_memory_size = total_memory_size
+        self.min_block_size = min_block_size
+        self.reset_memory()
+
+    def reset_memory(self):
+        """Frees everything: one free top-level block per set bit of the size in units."""
+        units = self.total_memory_size // self.min_block_size
+        self.max_order = units.bit_length() - 1
+        self.free_lists = [{} for _ in range(self.max_order + 1)]  # Per order: start unit -> None
+        self._pair_bits = [bytearray((units >> (order + 1)) // 8 + 1) for order in range(self.max_order + 1)]
+        self._allocations = {}  # pid -> [(start unit, order, requested size)]
+        self._units = units
+        self._free_units = units
+        self._requested = 0
+        start = 0
+        for order in range(self.max_order, -1, -1):
+            if units >> order & 1:
+                self.free_lists[order][start] = None
+                start += 1 << order
+
+    def _order_for(self, size):
+        units = -(-size // self.min_block_size)
+        return (units - 1).bit_length()
+
+    def _has_buddy(self, start, order):
+        """Whether a block lies inside a larger top-level block (only those have a buddy)."""
+        # The top-level block containing `start` has the order of the highest bit
+        # in which start differs from the size in units.
+        return order < (start ^ self._units).bit_length() - 1
+
+    def _toggle_pair(self, start, order):
+        """Flips the bit of the buddy pair containing the block; returns the new bit."""
+        pair = start >> (order + 1)
+        bits = self._pair_bits[order]
+        bits[pair >> 3] ^= 1 << (pair & 7)
+        return bits[pair >> 3] >> (pair & 7) & 1
+
+    def allocate(self, process_id, size, algorithm=None):
+        """
+        Allocates the smallest block of at least `size` units to a process.
+        algorithm is accepted for compatibility with MemoryManager and ignored.
+        Returns True if allocation successful, False otherwise.
+        """
+        if size <= 0:
+            return False # Invalid size
+        order = self._order_for(size)
+        if order > self.max_order:
+            return False
+        found = order
+        while found <= self.max_order and not self.free_lists[found]:
+            found += 1
+        if found > self.max_order:
+            return False # No free block is large enough
+
+        start = next(iter(self.free_lists[found]))
+        del self.free_lists[found][start]
+        if self._has_buddy(start, found):
+            self._toggle_pair(start, found)
+        while found > order:
+            # Keep the lower half and put the upper half (its buddy) on the free list.
+            found -= 1
+            buddy = start + (1 << found)
+            self.free_lists[found][buddy] = None
+            self._toggle_pair(buddy, found)
+
+        self._allocations.setdefault(process_id, []).append((start, order, size))
+        self._free_units -= 1 << order
+        self._requested += size
+        return True
+
+    def deallocate(self, process_id):
+        """
+        Deallocates memory held by a given process ID, merging each block
+        with its buddy while the buddy is free.
+        """
+        blocks = self._allocations.pop(process_id, None)
+        if not blocks:
+            return False
+        for start, order, size in blocks:
+            self._free_units += 1 << order
+            self._requested -= size
+            while self._has_buddy(start, order) and not self._toggle_pair(start, order):
+                # The bit went 1 -> 0, so the buddy was the free one of the pair: merge.
+                del self.free_lists[order][start ^ (1 << order)]
+                start &= ~(1 << order)
+                order += 1
+            self.free_lists[order][start] = None
+        return True
+
+    def get_memory_map_data(self):
+        """
+        Returns a list of dicts representing the current memory blocks for GUI display,
+        like MemoryManager.get_memory_map_data(). Allocated blocks also carry 'used',
+        the size that was requested; the rest of the block is internal fragmentation.
+        """
+        unit = self.min_block_size
+        blocks = [{'start': start * unit, 'size': unit << order, 'status': 'free', 'process_id': None}
+                  for order, free_list in enumerate(self.free_lists) for start in free_list]
+        blocks.extend({'start': start * unit, 'size': unit << order, 'status': 'allocated',
+                       'process_id': process_id, 'used': size}
+                      for process_id, allocations in self._allocations.items()
+                      for start, order, size in allocations)
+        blocks.sort(key=lambda b: b['start'])
+        return blocks
+
+    def calculate_stats(self):
+        """
+        Calculates and returns memory usage statistics: MemoryManager.calculate_stats()
+        plus 'requested_memory' and 'internal_fragmentation' (allocated minus requested).
+        """
+        free_memory = self._free_units * self.min_block_size
+        allocated_memory = self.total_memory_size - free_memory
+        largest = next((order for order in range(self.max_order, -1, -1) if self.free_lists[order]), None)
+        return {
+            'free_memory': free_memory,
+            'allocated_memory': allocated_memory,
+            'free_holes': sum(len(free_list) for free_list in self.free_lists),
+            'largest_free_block': 0 if largest is None else self.min_block_size << largest,
+            'requested_memory': self._requested,
+            'internal_fragmentation': allocated_memory - self._requested,
+        }
+
+
+instrumentation.register(BuddyAllocator, 'allocate', "BuddyAllocator.allocate")
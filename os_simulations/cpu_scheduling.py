@@ -1,320 +1,1100 @@
+import bisect
+import collections
+import heapq
+from array import array
 
+from os_simulations import instrumentation
+from os_simulations.gantt_timeline import GanttTimeline
+from os_simulations.indexed_heap import IndexedHeap
+from os_simulations.process_table import Process, ProcessList, ProcessTable, StreamingProcessTable
+from os_simulations.quantile_sketch import QuantileSketch
 
-import collections
+Checkpoint = collections.namedtuple('Checkpoint', 'time completed ids rows row_attrs attrs')
 
-class Process:
-    """
-    Represents a process with its attributes for CPU scheduling.
-    """
-    def __init__(self, pid, arrival_time, burst_time):
-        self.pid = pid
-        self.arrival_time = arrival_time
-        self.burst_time = burst_time
-        self.remaining_time = burst_time
-        self.start_time = -1      
-        self.completion_time = -1  
-        self.waiting_time = 0      
-        self.turnaround_time = 0   
-        self.initial_arrival = arrival_time 
-
-    def __repr__(self):
-        return f"Process(PID={self.pid}, Arrival={self.arrival_time}, Burst={self.burst_time}, Remaining={self.remaining_time})"
+
+def _copy_state(value):
+    """Copies a piece of scheduler state deeply enough that later steps cannot change the copy."""
+    if isinstance(value, list) and value and isinstance(value[0], collections.deque):
+        return [queue.copy() for queue in value]
+    if isinstance(value, array):
+        return array(value.typecode, value)
+    if hasattr(value, 'copy'):
+        return value.copy()
+    return value  # Numbers, None and tuples are immutable.
 
 class BaseScheduler:
     """
     Base class for CPU schedulers. Provides common functionalities.
+
+    The simulation can be driven one tick at a time with step(), or jump
+    between events (arrivals, completions, quantum expiries) with
+    advance_to() and run_to_completion(). Both paths share the same
+    dispatch and execution logic, so they produce identical results.
+    Derived classes only decide how the ready queue is ordered.
+
+    The Gantt chart is a run-length-encoded GanttTimeline; pass
+    gantt_max_segments to keep only the most recent segments.
+
+    Process state lives in a ProcessTable. Rows are ordered by arrival and
+    the ready queues hold integer row ids; current_process and
+    completed_processes expose Process views for callers.
+
+    Waiting, turnaround and response times (first dispatch minus arrival) of
+    completed processes also go into QuantileSketch objects, so percentiles
+    are available in constant memory however many processes complete.
+
+    enable_checkpoints(interval) records the state every `interval` ticks so
+    that seek() can rewind the run. A checkpoint holds the scalar counters,
+    copies of the queues and the table rows of the processes that are
+    waiting or running. Rows that had not arrived are fresh, and completed
+    rows never change again, so neither is stored. Restoring resets the rows
+    admitted or completed since the checkpoint and truncates the Gantt chart.
+    A seek backwards therefore replays at most `interval` ticks.
+
+    Processes with I/O bursts (see ProcessTable.io) block when a CPU burst
+    ends. Each named device serves one process at a time from a FIFO
+    queue, and a process whose I/O finishes rejoins the ready queue through
+    _enqueue(), ahead of arrivals at the same tick. I/O completions are
+    engine events like arrivals, so every scheduler supports I/O without
+    changes to its queue logic.
+
+    A streamed run (see load_stream()) keeps only the processes in the
+    system: a completed row is released from a StreamingProcessTable once
+    its figures have gone into the running totals and sketches.
     """
-    def __init__(self):
-        self.initial_processes = []  
-        self.ready_queue = collections.deque() 
-        self.completed_processes = [] 
-        self.current_process = None   
-        self.gantt_chart = []         
+    # State copied into each checkpoint; subclasses extend these.
+    CHECKPOINT_ATTRS = ('ready_queue', 'current_id', 'completed_count', 'cpu_idle_time', 'last_activity_time', 'total_waiting_time',
+                        'total_turnaround_time', 'total_context_switches', 'total_execution_time',
+                        'waiting_sketch', 'turnaround_sketch', 'response_sketch', '_next_arrival_index',
+                        'device_names', '_device_index', 'device_queues', 'device_busy', 'device_busy_time',
+                        '_io_events', 'io_phase', 'io_blocked', 'io_active_time', 'cpu_io_overlap_time')
+    CHECKPOINT_ROW_ATTRS = ()  # Per-row columns of the scheduler, filled in by _on_admit()
+
+    def __init__(self, gantt_max_segments=None):
+        self.initial_processes = ProcessTable()  # The workload, in insertion order
+        self.processes = ProcessTable()          # Run state, sorted by arrival
+        self.ready_queue = collections.deque()   # Row ids
+        self.current_id = None
+        self.completed_ids = array('q')
+        self.completed_count = 0
+        self.gantt_chart = GanttTimeline(gantt_max_segments)
         self.cpu_idle_time = 0
-        self.last_activity_time = 0   
+        self.last_activity_time = 0
         self.total_waiting_time = 0
         self.total_turnaround_time = 0
         self.total_context_switches = 0
-        self.total_execution_time = 0 
+        self.total_execution_time = 0
+        self.waiting_sketch = QuantileSketch()
+        self.turnaround_sketch = QuantileSketch()
+        self.response_sketch = QuantileSketch()
+        self._next_arrival_index = 0  # First row of self.processes not yet admitted
+        self._arrival_stream = None   # Iterator of rows still to be read, see load_stream()
+        self._on_complete = None      # Sink for the records of completed streamed processes
+        self._reset_io()
+        self.checkpoint_interval = None
+        self.max_checkpoints = None
+        self._checkpoint_times = []  # Sorted, parallel to self.checkpoints
+        self.checkpoints = []
+
+    @property
+    def current_process(self):
+        """The running process as a Process view, or None."""
+        if self.current_id is None:
+            return None
+        return self.processes.view(self.current_id)
+
+    @property
+    def completed_processes(self):
+        """
+        Completed processes in completion order, as Process views. Empty for a
+        streamed run, which releases completed rows; see load_stream()'s on_complete.
+        """
+        return ProcessList(self.processes, self.completed_ids)
 
     def add_process(self, process):
         """Adds a process to the initial list. Resets the scheduler state."""
-        self.initial_processes.append(process)
-        self.initial_processes.sort(key=lambda x: x.arrival_time) 
-        self.reset_state() 
+        self.initial_processes.add(process.pid, process.arrival_time, process.burst_time, process.priority,
+                                   process.io_bursts)
+        self.reset_state()
+
+    def add_processes(self, processes):
+        """Adds several processes at once, resetting only once."""
+        self.initial_processes.extend(processes)
+        self.reset_state()
+
+    def load_table(self, table):
+        """
+        Replaces the workload with an existing ProcessTable without copying it, e.g.
+        a read-only one from shared_workload.attach(). The table is only read: if it
+        is sorted by arrival, each run uses its columns in place (see
+        ProcessTable.for_run()), so several schedulers can share it.
+        """
+        self.initial_processes = table
+        self.reset_state()
+
+    def load_stream(self, rows, on_complete=None):
+        """
+        Starts a run over a lazily-read workload instead of initial_processes.
+        Only the processes in the system are held: a row is read when the simulation
+        reaches its arrival and released when it completes, so with gantt_max_segments
+        set memory does not grow with the length of the trace. Streamed runs cannot be
+        checkpointed. reset_state() drops the stream.
+        :param rows: Iterable of (pid, arrival, burst[, priority[, io]]) tuples sorted by
+                     arrival, e.g. workload.iter_processes().
+        :param on_complete: Optional function called with a dict of 'pid', 'arrival_time',
+                            'burst_time', 'start_time', 'completion_time', 'waiting_time' and
+                            'turnaround_time' for each process as it completes.
+        """
+        if self.checkpoint_interval is not None:
+            raise ValueError("A streamed run releases completed rows, so it cannot be checkpointed.")
+        self.initial_processes = ProcessTable()
+        self.reset_state()
+        self.processes = StreamingProcessTable()
+        for name in self.CHECKPOINT_ROW_ATTRS:
+            setattr(self, name, {})  # Released along with the rows
+        self._arrival_stream = iter(rows)
+        self._on_complete = on_complete
 
     def reset_state(self):
-        """Resets the scheduler to its initial state, re-populating the queue."""
+        """Resets the scheduler to its initial state, rebuilding the run table in arrival order."""
         self.ready_queue = collections.deque()
-        self.completed_processes = []
-        self.current_process = None
-        self.gantt_chart = []
+        self.current_id = None
+        self.completed_ids = array('q')
+        self.completed_count = 0
+        self.gantt_chart.clear()
         self.cpu_idle_time = 0
         self.last_activity_time = 0
 
-       
-        for p_original in sorted(self.initial_processes, key=lambda x: x.arrival_time):
-           
-            self.ready_queue.append(Process(p_original.pid, p_original.arrival_time, p_original.burst_time))
+        order = self.initial_processes.arrival_order()
+        if order is None:
+            self.processes = self.initial_processes.for_run()
+        else:
+            self.processes = self.initial_processes.fresh_copy(order)
+        self._next_arrival_index = 0
+        self._arrival_stream = None
+        self._on_complete = None
 
         self.total_waiting_time = 0
         self.total_turnaround_time = 0
         self.total_context_switches = 0
         self.total_execution_time = 0
+        self.waiting_sketch.clear()
+        self.turnaround_sketch.clear()
+        self.response_sketch.clear()
+        self._reset_io()
+        self._checkpoint_times = []
+        self.checkpoints = []
+
+    def _reset_io(self):
+        self.device_names = []      # Devices in order of first use
+        self._device_index = {}     # Device name -> position in device_names
+        self.device_queues = []     # Per device: FIFO of blocked row ids waiting for it
+        self.device_busy = []       # Per device: row id being served, or None
+        self.device_busy_time = []  # Per device: service time started so far, including unfinished parts
+        self._io_events = []        # Heap of (I/O completion time, device), one per busy device
+        self.io_phase = {}          # Row id -> I/O phases started; only rows with I/O that have not completed
+        self.io_blocked = {}        # Row id -> ticks spent blocked so far, for the same rows
+        self.io_active_time = 0     # Ticks with at least one device busy
+        self.cpu_io_overlap_time = 0  # Ticks with the CPU and at least one device busy
+
+    def enable_checkpoints(self, interval, max_checkpoints=None):
+        """
+        Records a checkpoint every `interval` ticks from now on, for seek().
+        :param max_checkpoints: How many to keep besides the one at the start of the
+                                run, dropping the oldest first; None keeps them all.
+                                Seeking before the oldest kept one replays from the start.
+        """
+        if interval <= 0:
+            raise ValueError("The checkpoint interval must be a positive number of ticks.")
+        if isinstance(self.processes, StreamingProcessTable):
+            raise ValueError("A streamed run releases completed rows, so it cannot be checkpointed.")
+        if max_checkpoints is not None and max_checkpoints < 1:
+            raise ValueError("max_checkpoints must be a positive integer or None.")
+        self.checkpoint_interval = interval
+        self.max_checkpoints = max_checkpoints
+
+    def seek(self, target_time):
+        """
+        Moves the run to target_time. Going back restores the latest checkpoint
+        at or before target_time and replays from there; going forward simply
+        runs on, stopping early if every process completes.
+        :return: Same tuple as step(), for the last simulated tick.
+        """
+        if self.checkpoint_interval is None:
+            raise ValueError("Checkpoints are not enabled; call enable_checkpoints() first.")
+        if target_time < self.total_execution_time:
+            position = bisect.bisect_right(self._checkpoint_times, target_time) - 1
+            if position < 0:
+                raise ValueError(f"No checkpoint at or before time {target_time}.")
+            self._restore_checkpoint(self.checkpoints[position])
+        return self._advance_checkpointed(target_time, stop_when_finished=True)
+
+    def _active_ids(self):
+        """Row ids of the processes that are waiting or running."""
+        ids = array('q', self._ready_ids())
+        if self.current_id is not None:
+            ids.append(self.current_id)
+        ids.extend(self._blocked_ids())
+        return ids
+
+    def _blocked_ids(self):
+        """Row ids of the processes blocked on I/O, being served or queued."""
+        for device, index in enumerate(self.device_busy):
+            if index is not None:
+                yield index
+                yield from self.device_queues[device]
+
+    def _timelines(self):
+        return [self.gantt_chart]
+
+    def _take_checkpoint(self):
+        """Records the current state unless a checkpoint for this time already exists."""
+        time = self.total_execution_time
+        times = self._checkpoint_times
+        position = bisect.bisect_left(times, time)
+        if position < len(times) and times[position] == time:
+            return  # Replaying after a seek reaches the same state again.
+        if self.max_checkpoints is not None and len(times) > self.max_checkpoints:
+            if position <= 1:
+                return  # Older than everything kept; it would be dropped straight away.
+            del times[1], self.checkpoints[1]
+            position -= 1
+
+        table = self.processes
+        ids = self._active_ids()
+        checkpoint = Checkpoint(
+            time, len(self.completed_ids), ids,
+            tuple(array('q', map(column.__getitem__, ids))
+                  for column in (table.remaining, table.start, table.waiting, table.last_enqueued)),
+            tuple(array(values.typecode, map(values.__getitem__, ids))
+                  for values in (getattr(self, name) for name in self.CHECKPOINT_ROW_ATTRS)),
+            {name: _copy_state(getattr(self, name)) for name in self.CHECKPOINT_ATTRS},
+        )
+        times.insert(position, time)
+        self.checkpoints.insert(position, checkpoint)
 
-    def _update_waiting_times(self, current_time, process_currently_executing_pid=None):
-        """Increments waiting time for processes in the ready queue."""
-        for p in self.ready_queue:
-            if p.arrival_time <= current_time and p.pid != process_currently_executing_pid:
-                p.waiting_time += 1
+    def _restore_checkpoint(self, checkpoint):
+        table = self.processes
+        admitted = checkpoint.attrs['_next_arrival_index']
+        table.reset_rows(self.completed_ids[checkpoint.completed:])
+        table.reset_rows(range(admitted, self._next_arrival_index))
+        del self.completed_ids[checkpoint.completed:]
+        for column, values in zip((table.remaining, table.start, table.waiting, table.last_enqueued),
+                                  checkpoint.rows):
+            for index, value in zip(checkpoint.ids, values):
+                column[index] = value
+        for name, values in zip(self.CHECKPOINT_ROW_ATTRS, checkpoint.row_attrs):
+            column = getattr(self, name)
+            del column[admitted:]
+            for index, value in zip(checkpoint.ids, values):
+                column[index] = value
+        for index in checkpoint.ids:
+            table.completion[index] = -1
+        for name, value in checkpoint.attrs.items():
+            setattr(self, name, _copy_state(value))  # The checkpoint itself stays reusable.
+        for timeline in self._timelines():
+            timeline.truncate(checkpoint.time)
+
+    def _discard_checkpoints_from(self, time):
+        position = bisect.bisect_left(self._checkpoint_times, time)
+        del self._checkpoint_times[position:], self.checkpoints[position:]
+
+    def get_process(self, pid):
+        """Returns the live state of the process with the given pid in the current run, or None."""
+        index = self.processes.index_of(pid)
+        return None if index is None else self.processes.view(index)
+
+    def is_finished(self):
+        """Returns True once every process has arrived and completed."""
+        return (self.current_id is None and not self.ready_queue and not self._io_events
+                and not self._has_pending_arrival())
+
+    def _has_pending_arrival(self):
+        """True if some process has not been admitted yet, reading one streamed row ahead if needed."""
+        if self._next_arrival_index < len(self.processes):
+            return True
+        if self._arrival_stream is None:
+            return False
+        row = next(self._arrival_stream, None)
+        if row is None:
+            self._arrival_stream = None
+            return False
+        table = self.processes
+        if table.last_arrival is not None and row[1] < table.last_arrival:
+            raise ValueError(f"Streamed process '{row[0]}' arrives at {row[1]}, before the previous one; "
+                             "streamed rows must be sorted by arrival.")
+        table.add(*row)
+        return True
+
+    def _next_arrival_time(self):
+        """Arrival time of the next process not yet admitted, or None."""
+        if self._has_pending_arrival():
+            return self.processes.arrival[self._next_arrival_index]
+        return None
+
+    def _next_ready_time(self):
+        """Time of the next arrival or I/O completion, or None."""
+        next_time = self._next_arrival_time()
+        if self._io_events and (next_time is None or self._io_events[0][0] < next_time):
+            next_time = self._io_events[0][0]
+        return next_time
+
+    def _admit_arrivals(self, current_time):
+        """Moves every process that has arrived, or finished its I/O, by current_time into the ready queue."""
+        if self._io_events:
+            self._finish_io(current_time)
+        table = self.processes
+        while self._has_pending_arrival() and table.arrival[self._next_arrival_index] <= current_time:
+            index = self._next_arrival_index
+            table.last_enqueued[index] = table.arrival[index]
+            self._on_admit(index)
+            self._enqueue(index)
+            self._next_arrival_index += 1
+
+    def _on_admit(self, index):
+        """Hook called when a process (by row id) arrives, before it is enqueued."""
+        pass
+
+    @staticmethod
+    def _add_row(column, index, value):
+        """Fills in an arriving row of a per-row column (see CHECKPOINT_ROW_ATTRS)."""
+        if isinstance(column, dict):
+            column[index] = value  # Streamed run
+        else:
+            column.append(value)  # Rows arrive in row order
+
+    def _start_io(self, index, current_time):
+        """
+        Blocks a process whose CPU burst ended at current_time on its next I/O device.
+        Returns False if it has no I/O burst left, i.e. it has completed.
+        """
+        phases = self.processes.io.get(index)
+        phase = self.io_phase.get(index, 0)
+        if phases is None or phase == len(phases):
+            return False
+        device_name, _, cpu_time = phases[phase]
+        self.io_phase[index] = phase + 1
+        table = self.processes
+        table.remaining[index] = cpu_time
+        table.last_enqueued[index] = current_time  # Start of the blocked period
+        device = self._device_index.get(device_name)
+        if device is None:
+            device = self._device_index[device_name] = len(self.device_names)
+            self.device_names.append(device_name)
+            self.device_queues.append(collections.deque())
+            self.device_busy.append(None)
+            self.device_busy_time.append(0)
+        if self.device_busy[device] is None:
+            self._serve_io(device, index, current_time)
+        else:
+            self.device_queues[device].append(index)
+        return True
+
+    def _serve_io(self, device, index, current_time):
+        io_time = self.processes.io[index][self.io_phase[index] - 1][1]
+        self.device_busy[device] = index
+        self.device_busy_time[device] += io_time
+        heapq.heappush(self._io_events, (current_time + io_time, device))
+
+    def _finish_io(self, current_time):
+        """Returns every process whose I/O has finished by current_time to the ready queue."""
+        events = self._io_events
+        table = self.processes
+        while events and events[0][0] <= current_time:
+            end_time, device = heapq.heappop(events)
+            index = self.device_busy[device]
+            self.io_blocked[index] = self.io_blocked.get(index, 0) + end_time - table.last_enqueued[index]
+            table.last_enqueued[index] = end_time
+            self._enqueue(index)
+            queue = self.device_queues[device]
+            if queue:
+                self._serve_io(device, queue.popleft(), end_time)
+            else:
+                self.device_busy[device] = None
+
+    def _enqueue(self, index):
+        """Adds a ready process (by row id) to the ready queue."""
+        self.ready_queue.append(index)
+
+    def _ready_ids(self):
+        """Iterates over the row ids currently in the ready queue."""
+        return iter(self.ready_queue)
+
+    def _select_next(self):
+        """Removes and returns the row id of the next process to run, or None if none is ready."""
+        raise NotImplementedError("Subclasses must implement '_select_next' method.")
+
+    def _ticks_until_preemption(self):
+        """Ticks the current process may still run before it must be preempted, or None."""
+        return None
+
+    def _preempt_current(self, current_time):
+        """Puts the running process back on the ready queue."""
+        self.processes.last_enqueued[self.current_id] = current_time
+        self._enqueue(self.current_id)
+        self.current_id = None
+
+    def _dispatch(self, current_time):
+        """
+        Makes the scheduling decision for current_time.
+        Returns True if a new process was dispatched (a context switch).
+        """
+        if self.current_id is not None:
+            ticks_left = self._ticks_until_preemption()
+            if ticks_left is not None and ticks_left <= 0:
+                self._preempt_current(current_time)
+
+        if self.current_id is None:
+            index = self._select_next()
+            if index is not None:
+                table = self.processes
+                table.waiting[index] += current_time - table.last_enqueued[index]
+                self.current_id = index
+                self._on_dispatch(index)
+                return True
+        return False
+
+    def _on_dispatch(self, index):
+        """Hook called when a process (by row id) is given the CPU."""
+        pass
+
+    def _on_run(self, ticks):
+        """Hook called after the current process has run for the given number of ticks."""
+        pass
+
+    def _execute(self, current_time, ticks, context_switch_occurred):
+        """
+        Runs the current process (or idles) for `ticks` time units starting at current_time.
+        No scheduling decision may fall strictly inside this interval.
+        """
+        pid_this_tick = 'Idle'
+        index = self.current_id
+        table = self.processes
+        if index is not None:
+            pid_this_tick = table.pids[index]
+            if table.start[index] == -1:
+                table.start[index] = current_time
+            table.remaining[index] -= ticks
+            self._on_run(ticks)
+            if context_switch_occurred:
+                self.total_context_switches += 1
+        else:
+            self.cpu_idle_time += ticks
+        if self._io_events:
+            self.io_active_time += ticks
+            if index is not None:
+                self.cpu_io_overlap_time += ticks
+
+        self.gantt_chart.append(pid_this_tick, current_time, ticks)
+
+        end_time = current_time + ticks
+        if index is not None and table.remaining[index] <= 0:
+            if index in table.io and self._start_io(index, end_time):
+                self.current_id = None
+            else:
+                self._complete_current(end_time)
+        self.total_execution_time = end_time
+        return pid_this_tick
+
+    def _complete_current(self, completion_time):
+        """Records the running process as completed at completion_time."""
+        self._record_completion(self.current_id, completion_time)
+        self.current_id = None
+
+    def _record_completion(self, index, completion_time):
+        """Fills in the completion, waiting and turnaround figures of a finished process."""
+        table = self.processes
+        turnaround = completion_time - table.arrival[index]
+        waiting = turnaround - table.burst[index]
+        if index in table.io:
+            waiting -= self.io_blocked.pop(index, 0)
+            self.io_phase.pop(index, None)
+        waiting = max(0, waiting)
+        table.completion[index] = completion_time
+        table.waiting[index] = waiting
+        self.completed_count += 1
+        self.total_waiting_time += waiting
+        self.total_turnaround_time += turnaround
+        self.waiting_sketch.add(waiting)
+        self.turnaround_sketch.add(turnaround)
+        self.response_sketch.add(table.start[index] - table.arrival[index])
+        if self._on_complete is not None:
+            self._on_complete({
+                'pid': table.pids[index],
+                'arrival_time': table.arrival[index],
+                'burst_time': table.burst[index],
+                'start_time': table.start[index],
+                'completion_time': completion_time,
+                'waiting_time': waiting,
+                'turnaround_time': turnaround,
+            })
+        if isinstance(table, StreamingProcessTable):
+            table.release(index)
+            for name in self.CHECKPOINT_ROW_ATTRS:
+                del getattr(self, name)[index]
+        else:
+            self.completed_ids.append(index)
+
+    def get_waiting_time(self, process, current_time):
+        """
+        Waiting time of a process so far, including its current stay in the ready queue.
+        :param process: A Process view from this run (e.g. from get_process()) or its row id.
+        """
+        index = process if isinstance(process, int) else process.index
+        table = self.processes
+        if (index == self.current_id or table.completion[index] != -1 or table.arrival[index] > current_time
+                or index in self._blocked_ids()):
+            return table.waiting[index]
+        return table.waiting[index] + current_time - table.last_enqueued[index]
 
     def _calculate_metrics(self, current_time_tick):
-        """Calculates and updates average waiting time, turnaround time, and CPU utilization."""
-        completed_count = len(self.completed_processes)
+        """
+        Calculates average waiting time, turnaround time, and CPU utilization
+        from the running totals, which are updated as processes complete.
+        """
+        completed_count = self.completed_count
         if completed_count == 0:
-            self.total_waiting_time = 0
-            self.total_turnaround_time = 0
             return 0, 0, 0.0
 
-        total_waiting = sum(p.waiting_time for p in self.completed_processes)
-        total_turnaround = sum(p.turnaround_time for p in self.completed_processes)
-
-        avg_wait = total_waiting / completed_count
-        avg_turnaround = total_turnaround / completed_count
+        avg_wait = self.total_waiting_time / completed_count
+        avg_turnaround = self.total_turnaround_time / completed_count
 
         cpu_utilization = (current_time_tick - self.cpu_idle_time) / current_time_tick * 100 if current_time_tick > 0 else 0
 
         return avg_wait, avg_turnaround, cpu_utilization
 
-    def step(self, current_time):
+    def get_percentiles(self):
         """
-        Executes one time unit of the simulation for a generic scheduler.
-        Derived classes must override to implement specific scheduling logic.
+        Estimated p50, p95 and p99 (within 1%) and exact max of the waiting,
+        turnaround and response times of the processes completed so far.
+        :return: {'waiting_time': {'p50', 'p95', 'p99', 'max'}, 'turnaround_time': {...}, 'response_time': {...}}
         """
-        raise NotImplementedError("Subclasses must implement 'step' method.")
+        return {
+            'waiting_time': self.waiting_sketch.summary(),
+            'turnaround_time': self.turnaround_sketch.summary(),
+            'response_time': self.response_sketch.summary(),
+        }
 
-class FCFSScheduler(BaseScheduler):
-    """
-    First-Come, First-Served (FCFS) CPU scheduling algorithm.
-    Non-preemptive.
-    """
-    def __init__(self):
-        super().__init__()
-        
+    def get_io_metrics(self):
+        """
+        Utilisation of each I/O device, of I/O as a whole (any device busy) and the
+        share of time the CPU and I/O were busy together, as percentages of the elapsed time.
+        :return: {'device_utilization': {device: %}, 'io_utilization': %, 'cpu_io_overlap': %}
+        """
+        total_time = self.total_execution_time
+        busy_time = list(self.device_busy_time)
+        for end_time, device in self._io_events:
+            busy_time[device] -= end_time - total_time  # Service not yet given
+        if total_time <= 0:
+            return {'device_utilization': {name: 0.0 for name in self.device_names},
+                    'io_utilization': 0.0, 'cpu_io_overlap': 0.0}
+        return {
+            'device_utilization': {name: busy / total_time * 100 for name, busy in zip(self.device_names, busy_time)},
+            'io_utilization': self.io_active_time / total_time * 100,
+            'cpu_io_overlap': self.cpu_io_overlap_time / total_time * 100,
+        }
+
+    def get_metrics(self):
+        """
+        Returns the metrics of the run so far as a dict, including get_percentiles() as
+        'percentiles', throughput (completed processes per tick) and get_io_metrics().
+        """
+        avg_wait, avg_turnaround, cpu_util = self._calculate_metrics(self.total_execution_time)
+        total_time = self.total_execution_time
+        metrics = {
+            'avg_waiting_time': avg_wait,
+            'avg_turnaround_time': avg_turnaround,
+            'cpu_utilization': cpu_util,
+            'context_switches': self.total_context_switches,
+            'completed_processes': self.completed_count,
+            'total_time': total_time,
+            'throughput': self.completed_count / total_time if total_time > 0 else 0.0,
+            'percentiles': self.get_percentiles(),
+        }
+        metrics.update(self.get_io_metrics())
+        return metrics
 
     def step(self, current_time):
         """
-        Executes one time unit for FCFS.
+        Executes one time unit of the simulation.
         :param current_time: The current time tick.
         :return: (pid_running_this_tick, avg_wait, avg_turnaround, cpu_utilization, num_context_switches)
         """
+        if self.checkpoint_interval is not None and (not self.checkpoints
+                                                     or current_time % self.checkpoint_interval == 0):
+            self._take_checkpoint()
+        self._admit_arrivals(current_time)
+        context_switch_occurred = self._dispatch(current_time)
+        pid_this_tick = self._execute(current_time, 1, context_switch_occurred)
+
+        avg_wait, avg_turnaround, cpu_util = self._calculate_metrics(current_time + 1)
+        return pid_this_tick, avg_wait, avg_turnaround, cpu_util, self.total_context_switches
+
+    def advance_to(self, target_time, stop_when_finished=False):
+        """
+        Runs the simulation up to (but not including) target_time, jumping
+        directly from one event to the next instead of ticking.
+        :param target_time: The time tick to stop at.
+        :param stop_when_finished: Stop as soon as every process has completed
+                                   instead of idling up to target_time.
+        :return: Same tuple as step(), for the last simulated tick.
+        """
+        return self._advance_checkpointed(target_time, stop_when_finished)
+
+    def run_to_completion(self):
+        """
+        Runs the simulation event by event until every process has completed.
+        :return: Same tuple as step(), for the last simulated tick.
+        """
+        return self._advance_checkpointed(None)
+
+    def _advance_checkpointed(self, target_time, stop_when_finished=False):
+        """_advance(), stopping at every multiple of checkpoint_interval to take a checkpoint."""
+        interval = self.checkpoint_interval
+        if interval is None:
+            return self._advance(target_time, stop_when_finished)
+        result = None
+        while True:
+            if not self.checkpoints or self.total_execution_time % interval == 0:
+                self._take_checkpoint()
+            boundary = (self.total_execution_time // interval + 1) * interval
+            if target_time is not None and target_time <= boundary:
+                return self._advance(target_time, stop_when_finished)
+            started = self.total_execution_time
+            part = self._advance(boundary, stop_when_finished or target_time is None)
+            if result is None or self.total_execution_time > started:
+                result = part
+            if self.total_execution_time < boundary:
+                return result  # Every process has completed.
+
+    def _advance(self, target_time, stop_when_finished=False):
+        current_time = self.total_execution_time
         pid_this_tick = 'Idle'
-        context_switch_occurred = False
-
-        
-        for p_original in self.initial_processes:
-            if p_original.arrival_time == current_time and \
-               p_original.pid not in [qp.pid for qp in self.ready_queue] and \
-               p_original.pid not in [cp.pid for cp in self.completed_processes]:
-                
-                self.ready_queue.append(Process(p_original.pid, p_original.arrival_time, p_original.burst_time))
-                
-                self.ready_queue = collections.deque(sorted(self.ready_queue, key=lambda x: x.arrival_time))
-
-
-        if self.current_process is None or self.current_process.remaining_time <= 0:
-           
-            if self.current_process is not None and self.current_process.remaining_time <= 0:
-                
-                self.current_process.completion_time = current_time
-                self.current_process.turnaround_time = self.current_process.completion_time - self.current_process.initial_arrival
-                self.current_process.waiting_time = max(0, self.current_process.turnaround_time - self.current_process.burst_time) # Ensure non-negative
-                self.completed_processes.append(self.current_process)
-                self.current_process = None 
-                context_switch_occurred = True 
-
-           
-            if self.ready_queue:
-              
-                next_process_candidate = None
-                for p_in_queue in self.ready_queue:
-                    if p_in_queue.arrival_time <= current_time:
-                        next_process_candidate = p_in_queue
-                        break
-
-                if next_process_candidate:
-                   
-                    self.ready_queue.remove(next_process_candidate)
-                    self.current_process = next_process_candidate
-                    if not context_switch_occurred:
-                        context_switch_occurred = True
-                else:
-                    self.current_process = None 
-            else:
-                self.current_process = None 
-
-        if self.current_process:
-            pid_this_tick = self.current_process.pid
-            if self.current_process.start_time == -1:
-                self.current_process.start_time = current_time
-            self.current_process.remaining_time -= 1
-            if context_switch_occurred: 
-                self.total_context_switches += 1
-        else:
-            self.cpu_idle_time += 1
-        self._update_waiting_times(current_time, pid_this_tick)
+        while target_time is None or current_time < target_time:
+            self._admit_arrivals(current_time)
+            context_switch_occurred = self._dispatch(current_time)
 
-       
-        self.gantt_chart.append({'pid': pid_this_tick, 'time': current_time})
+            # Ticks until the next event: completion, quantum expiry, arrival, I/O completion or the target.
+            next_arrival = self._next_arrival_time()
+            if self._io_events and (next_arrival is None or self._io_events[0][0] < next_arrival):
+                next_arrival = self._io_events[0][0]
+            if self.current_id is not None:
+                ticks = max(self.processes.remaining[self.current_id], 1)
+                preemption = self._ticks_until_preemption()
+                if preemption is not None:
+                    ticks = min(ticks, preemption)
+                if next_arrival is not None:
+                    ticks = min(ticks, next_arrival - current_time)
+            elif next_arrival is not None:
+                ticks = next_arrival - current_time
+            elif target_time is None or stop_when_finished:
+                break  # Nothing left to run or arrive.
+            else:
+                ticks = target_time - current_time
+            if target_time is not None:
+                ticks = min(ticks, target_time - current_time)
 
-       
-        avg_wait, avg_turnaround, cpu_util = self._calculate_metrics(current_time + 1)
-        self.total_execution_time = current_time + 1
+            pid_this_tick = self._execute(current_time, ticks, context_switch_occurred)
+            current_time += ticks
 
+        avg_wait, avg_turnaround, cpu_util = self._calculate_metrics(current_time)
         return pid_this_tick, avg_wait, avg_turnaround, cpu_util, self.total_context_switches
 
+class FCFSScheduler(BaseScheduler):
+    """
+    First-Come, First-Served (FCFS) CPU scheduling algorithm.
+    Non-preemptive.
+    """
+    def __init__(self, gantt_max_segments=None):
+        super().__init__(gantt_max_segments)
+
+    def _select_next(self):
+        """Arrivals are admitted in arrival order, so the head of the queue is next."""
+        if self.ready_queue:
+            return self.ready_queue.popleft()
+        return None
+
 class SJFScheduler(BaseScheduler):
     """
     Shortest Job First (SJF) CPU scheduling algorithm.
     Non-preemptive.
+    The ready queue is a binary heap keyed on (remaining_time, arrival_time, row id);
+    rows are in arrival order, so the id breaks ties by admission order.
     """
-    def __init__(self):
-        super().__init__()
+    def __init__(self, gantt_max_segments=None):
+        super().__init__(gantt_max_segments)
+        self.ready_queue = []
 
-    def step(self, current_time):
-        """
-        Executes one time unit for SJF.
-        :param current_time: The current time tick.
-        :return: (pid_running_this_tick, avg_wait, avg_turnaround, cpu_utilization, num_context_switches)
-        """
-        pid_this_tick = 'Idle'
-        context_switch_occurred = False
-
-       
-        for p_original in self.initial_processes:
-            if p_original.arrival_time == current_time and \
-               p_original.pid not in [qp.pid for qp in self.ready_queue] and \
-               p_original.pid not in [cp.pid for cp in self.completed_processes]:
-                self.ready_queue.append(Process(p_original.pid, p_original.arrival_time, p_original.burst_time))
-
-        if self.current_process is None or self.current_process.remaining_time <= 0:
-            if self.current_process is not None and self.current_process.remaining_time <= 0:
-               
-                self.current_process.completion_time = current_time
-                self.current_process.turnaround_time = self.current_process.completion_time - self.current_process.initial_arrival
-                self.current_process.waiting_time = max(0, self.current_process.turnaround_time - self.current_process.burst_time)
-                self.completed_processes.append(self.current_process)
-                self.current_process = None
-                context_switch_occurred = True
-
-           
-            ready_and_arrived_processes = [p for p in self.ready_queue if p.arrival_time <= current_time]
-            if ready_and_arrived_processes:
-                
-                ready_and_arrived_processes.sort(key=lambda p: (p.remaining_time, p.arrival_time))
-                next_process_candidate = ready_and_arrived_processes[0]
-
-               
-                self.ready_queue.remove(next_process_candidate)
-                self.current_process = next_process_candidate
-                if not context_switch_occurred:
-                    context_switch_occurred = True
-            else:
-                self.current_process = None
-        else:
-          
-            pass
-
-        
-        if self.current_process:
-            pid_this_tick = self.current_process.pid
-            if self.current_process.start_time == -1:
-                self.current_process.start_time = current_time
-            self.current_process.remaining_time -= 1
-            if context_switch_occurred:
-                self.total_context_switches += 1
-        else:
-            self.cpu_idle_time += 1
+    def reset_state(self):
+        super().reset_state()
+        self.ready_queue = []
 
-        self._update_waiting_times(current_time, pid_this_tick)
-        self.gantt_chart.append({'pid': pid_this_tick, 'time': current_time})
-        avg_wait, avg_turnaround, cpu_util = self._calculate_metrics(current_time + 1)
-        self.total_execution_time = current_time + 1
+    def _enqueue(self, index):
+        table = self.processes
+        heapq.heappush(self.ready_queue, (table.remaining[index], table.arrival[index], index))
 
-        return pid_this_tick, avg_wait, avg_turnaround, cpu_util, self.total_context_switches
+    def _select_next(self):
+        """Picks the ready process with the shortest remaining time, ties broken by arrival."""
+        if not self.ready_queue:
+            return None
+        return heapq.heappop(self.ready_queue)[-1]
+
+    def _ready_ids(self):
+        return (entry[-1] for entry in self.ready_queue)
 
 class RoundRobinScheduler(BaseScheduler):
     """
     Round Robin (RR) CPU scheduling algorithm.
     Preemptive, uses a time quantum.
     """
-    def __init__(self, quantum):
-        super().__init__()
+    CHECKPOINT_ATTRS = BaseScheduler.CHECKPOINT_ATTRS + ('current_quantum_tick',)
+
+    def __init__(self, quantum, gantt_max_segments=None):
+        super().__init__(gantt_max_segments)
         self.quantum = quantum
-        self.current_quantum_tick = 0 
+        self.current_quantum_tick = 0
     def reset_state(self):
         super().reset_state()
         self.current_quantum_tick = 0
 
-    def step(self, current_time):
+    def _select_next(self):
+        if self.ready_queue:
+            return self.ready_queue.popleft()
+        return None
+
+    def _ticks_until_preemption(self):
+        return self.quantum - self.current_quantum_tick
+
+    def _on_dispatch(self, index):
+        self.current_quantum_tick = 0
+
+    def _on_run(self, ticks):
+        self.current_quantum_tick += ticks
+
+class SRTFScheduler(BaseScheduler):
+    """
+    Shortest Remaining Time First (SRTF) CPU scheduling algorithm.
+    Preemptive version of SJF: a newly arrived process with less remaining
+    time than the running one takes the CPU. The ready queue is an
+    IndexedHeap keyed on (remaining_time, arrival_time, row id); a waiting
+    process's remaining time does not change, so only arrivals can preempt.
+    """
+    def __init__(self, gantt_max_segments=None):
+        super().__init__(gantt_max_segments)
+        self.ready_queue = IndexedHeap()
+
+    def reset_state(self):
+        super().reset_state()
+        self.ready_queue = IndexedHeap()
+
+    def _enqueue(self, index):
+        table = self.processes
+        self.ready_queue.push(index, (table.remaining[index], table.arrival[index], index))
+
+    def _select_next(self):
+        if not self.ready_queue:
+            return None
+        return self.ready_queue.pop()
+
+    def _ready_ids(self):
+        return iter(self.ready_queue)
+
+    def _ticks_until_preemption(self):
+        if self.ready_queue and self.ready_queue.peek_key()[0] < self.processes.remaining[self.current_id]:
+            return 0
+        return None
+
+class PriorityScheduler(BaseScheduler):
+    """
+    Priority CPU scheduling algorithm with optional aging.
+    Lower priority values run first. With aging_interval set, a waiting
+    process gains one priority level per aging_interval ticks in the ready
+    queue, so low-priority processes cannot starve:
+
+        effective priority = priority - (now - enqueued_at) / aging_interval
+
+    Aging is never applied tick by tick. Ordering waiting processes by
+    effective priority is the same as ordering them by the fixed key
+    priority * aging_interval + enqueued_at, so each process is pushed onto
+    an IndexedHeap once with that key. The running process keeps the
+    effective priority it was dispatched with; when preemptive, the time
+    until the heap top overtakes it is computed directly.
+    """
+    CHECKPOINT_ATTRS = BaseScheduler.CHECKPOINT_ATTRS + ('running_rank',)
+
+    def __init__(self, aging_interval=None, preemptive=True, gantt_max_segments=None):
+        super().__init__(gantt_max_segments)
+        self.aging_interval = aging_interval
+        self.preemptive = preemptive
+        self.ready_queue = IndexedHeap()
+        self.running_rank = None  # Effective priority of the running process, scaled by aging_interval
+
+    def reset_state(self):
+        super().reset_state()
+        self.ready_queue = IndexedHeap()
+        self.running_rank = None
+
+    def _key(self, index):
+        table = self.processes
+        enqueued_at = table.last_enqueued[index]
+        if self.aging_interval:
+            return table.priority[index] * self.aging_interval + enqueued_at, enqueued_at, index
+        return table.priority[index], enqueued_at, index
+
+    def _enqueue(self, index):
+        self.ready_queue.push(index, self._key(index))
+
+    def _select_next(self):
+        if not self.ready_queue:
+            return None
+        rank = self.ready_queue.peek_key()[0]
+        if self.aging_interval:
+            rank -= self.total_execution_time  # Freeze the aging earned so far.
+        self.running_rank = rank
+        return self.ready_queue.pop()
+
+    def _ready_ids(self):
+        return iter(self.ready_queue)
+
+    def _ticks_until_preemption(self):
+        if not self.preemptive or not self.ready_queue:
+            return None
+        best = self.ready_queue.peek_key()[0]
+        if not self.aging_interval:
+            return 0 if best < self.running_rank else None
+        # The top of the heap overtakes the running process once best - now < running_rank.
+        return max(0, best - self.running_rank - self.total_execution_time + 1)
+
+    def set_priority(self, pid, priority):
         """
-        Executes one time unit for Round Robin.
-        :param current_time: The current time tick.
-        :return: (pid_running_this_tick, avg_wait, avg_turnaround, cpu_utilization, num_context_switches)
+        Changes the base priority of a process in the current run. A waiting
+        process is moved within the ready queue in O(log n). Checkpoints from
+        now on are discarded; seeking back to an earlier one replays with the
+        new priority.
         """
-        pid_this_tick = 'Idle'
-        context_switch_occurred = False
-
-       
-        for p_original in self.initial_processes:
-            if p_original.arrival_time == current_time and \
-               p_original.pid not in [qp.pid for qp in self.ready_queue] and \
-               p_original.pid not in [cp.pid for cp in self.completed_processes]:
-                self.ready_queue.append(Process(p_original.pid, p_original.arrival_time, p_original.burst_time))
-
-       
-        if self.current_process:
-            if self.current_process.remaining_time <= 0:
-               
-                self.current_process.completion_time = current_time
-                self.current_process.turnaround_time = self.current_process.completion_time - self.current_process.initial_arrival
-                self.current_process.waiting_time = max(0, self.current_process.turnaround_time - self.current_process.burst_time)
-                self.completed_processes.append(self.current_process)
-                self.current_process = None
-                self.current_quantum_tick = 0 
-                context_switch_occurred = True 
-
-            elif self.current_quantum_tick >= self.quantum:
-               
-                if self.current_process.pid not in [p.pid for p in self.completed_processes] and \
-                   self.current_process.pid not in [p.pid for p in self.ready_queue]:
-                    self.ready_queue.append(self.current_process) 
-                self.current_process = None
-                self.current_quantum_tick = 0
-                context_switch_occurred = True
-
-        
-        if self.current_process is None and self.ready_queue:
-            self.current_process = self.ready_queue.popleft() 
-            self.current_quantum_tick = 0 
-            if not context_switch_occurred: 
-                context_switch_occurred = True
-
-
-        if self.current_process:
-            pid_this_tick = self.current_process.pid
-            if self.current_process.start_time == -1:
-                self.current_process.start_time = current_time
-            self.current_process.remaining_time -= 1
-            self.current_quantum_tick += 1
-            if context_switch_occurred:
-                self.total_context_switches += 1
+        index = self.processes.index_of(pid)
+        if index is None:
+            raise ValueError(f"No process with PID '{pid}' in this run.")
+        self._discard_checkpoints_from(self.total_execution_time)
+        if self.processes.priority is self.initial_processes.priority:
+            # The column is shared with the workload (see ProcessTable.for_run()): copy it on first write.
+            self.processes.priority = array('q', self.processes.priority)
+        change = priority - self.processes.priority[index]
+        self.processes.priority[index] = priority
+        if index == self.current_id:
+            self.running_rank += change * (self.aging_interval or 1)
+        elif index in self.ready_queue:
+            self.ready_queue.update(index, self._key(index))
+
+class MLFQScheduler(BaseScheduler):
+    """
+    Multilevel Feedback Queue (MLFQ) CPU scheduling algorithm.
+    Level 0 is the highest priority. quanta[i] is the time quantum of level i;
+    the last may be None to run that level FCFS. New processes start at
+    level 0. A process that uses up its quantum moves one level down; one
+    preempted by a process arriving at a higher level stays at its level,
+    at the front of that queue. Every boost_interval ticks all processes
+    return to level 0 so long-running ones cannot starve. A process that
+    blocks for I/O before its quantum runs out keeps its level; processes
+    blocked during a boost are only moved up by a later one.
+
+    Each level is a deque and self._nonempty is a bitmap of levels with
+    waiting processes, so picking the next process is a lowest-set-bit
+    lookup, O(1) whatever the number of levels or processes.
+    """
+    CHECKPOINT_ATTRS = BaseScheduler.CHECKPOINT_ATTRS + (
+        'level_queues', 'current_quantum_tick', 'next_boost', 'total_boosts', 'level_cpu_time',
+        'level_dispatches', 'level_completions', 'total_response_time', 'max_response_time', 'responded',
+        '_nonempty')
+    CHECKPOINT_ROW_ATTRS = ('levels',)
+
+    def __init__(self, quanta=(2, 4, 8), boost_interval=None, gantt_max_segments=None):
+        quanta = list(quanta)
+        if not quanta or any(q is not None and q <= 0 for q in quanta) or None in quanta[:-1]:
+            raise ValueError("MLFQ needs positive quanta; only the last level may be None (FCFS).")
+        if boost_interval is not None and boost_interval <= 0:
+            raise ValueError("The boost interval must be a positive number of ticks.")
+        super().__init__(gantt_max_segments)
+        self.quanta = quanta
+        self.boost_interval = boost_interval
+        self.reset_state()
+
+    def reset_state(self):
+        super().reset_state()
+        level_count = len(self.quanta)
+        self.level_queues = [collections.deque() for _ in range(level_count)]
+        self.levels = array('h')  # Current level per row id, filled in on arrival
+        self.current_quantum_tick = 0
+        self.next_boost = self.boost_interval
+        self.total_boosts = 0
+        self.level_cpu_time = array('q', [0]) * level_count
+        self.level_dispatches = array('q', [0]) * level_count
+        self.level_completions = array('q', [0]) * level_count
+        self.total_response_time = 0
+        self.max_response_time = 0
+        self.responded = 0  # Processes dispatched at least once
+        self._nonempty = 0  # Bit i set when level_queues[i] is not empty
+
+    def is_finished(self):
+        return (self.current_id is None and not self._nonempty and not self._io_events
+                and not self._has_pending_arrival())
+
+    def _on_admit(self, index):
+        self._add_row(self.levels, index, 0)
+
+    def _enqueue(self, index):
+        level = self.levels[index]
+        self.level_queues[level].append(index)
+        self._nonempty |= 1 << level
+
+    def _ready_ids(self):
+        for queue in self.level_queues:
+            yield from queue
+
+    def _select_next(self):
+        if not self._nonempty:
+            return None
+        level = (self._nonempty & -self._nonempty).bit_length() - 1
+        queue = self.level_queues[level]
+        index = queue.popleft()
+        if not queue:
+            self._nonempty &= ~(1 << level)
+        return index
+
+    def _admit_arrivals(self, current_time):
+        if self.next_boost is not None and current_time > self.next_boost:
+            # Apply a boost that fell between events before processes back from I/O rejoin their levels.
+            self._boost(current_time - 1)
+        super()._admit_arrivals(current_time)
+
+    def _dispatch(self, current_time):
+        if self.next_boost is not None and current_time >= self.next_boost:
+            self._boost(current_time)
+        return super()._dispatch(current_time)
+
+    def _boost(self, current_time):
+        """Moves every process back to level 0, keeping their relative order."""
+        moved = self._nonempty > 1
+        top = self.level_queues[0]
+        for queue in self.level_queues[1:]:
+            for index in queue:
+                self.levels[index] = 0
+            top.extend(queue)
+            queue.clear()
+        if top:
+            self._nonempty = 1
+        if self.current_id is not None and self.levels[self.current_id] > 0:
+            self.levels[self.current_id] = 0
+            self.current_quantum_tick = 0
+            moved = True
+        if moved:
+            self.total_boosts += 1
+        self.next_boost = (current_time // self.boost_interval + 1) * self.boost_interval
+
+    def _ticks_until_preemption(self):
+        level = self.levels[self.current_id]
+        if self._nonempty & ((1 << level) - 1):
+            return 0  # A higher level has work.
+        quantum = self.quanta[level]
+        ticks = None if quantum is None else quantum - self.current_quantum_tick
+        if self.next_boost is not None and (level > 0 or self._nonempty > 1):
+            # Stop at the boost, which will change some process's level.
+            until_boost = self.next_boost - self.total_execution_time
+            ticks = until_boost if ticks is None else min(ticks, until_boost)
+        return ticks
+
+    def _preempt_current(self, current_time):
+        index = self.current_id
+        level = self.levels[index]
+        quantum = self.quanta[level]
+        self.processes.last_enqueued[index] = current_time
+        if quantum is not None and self.current_quantum_tick >= quantum:
+            level = min(level + 1, len(self.quanta) - 1)
+            self.levels[index] = level
+            self.level_queues[level].append(index)
         else:
-            self.cpu_idle_time += 1
+            self.level_queues[level].appendleft(index)
+        self._nonempty |= 1 << level
+        self.current_id = None
+
+    def _on_dispatch(self, index):
+        self.current_quantum_tick = 0
+        self.level_dispatches[self.levels[index]] += 1
+        table = self.processes
+        if table.start[index] == -1:
+            response = self.total_execution_time - table.arrival[index]
+            self.total_response_time += response
+            self.responded += 1
+            self.max_response_time = max(self.max_response_time, response)
+
+    def _on_run(self, ticks):
+        self.current_quantum_tick += ticks
+        self.level_cpu_time[self.levels[self.current_id]] += ticks
+
+    def _complete_current(self, completion_time):
+        self.level_completions[self.levels[self.current_id]] += 1
+        super()._complete_current(completion_time)
+
+    def get_metrics(self):
+        """
+        Like BaseScheduler.get_metrics(), plus per-level CPU time, share of CPU
+        time (residency), dispatches and completions, and response times
+        (first dispatch minus arrival).
+        """
+        metrics = super().get_metrics()
+        busy_time = sum(self.level_cpu_time)
+        metrics.update({
+            'level_quanta': list(self.quanta),
+            'per_level_cpu_time': list(self.level_cpu_time),
+            'per_level_residency': [ticks / busy_time * 100 if busy_time else 0.0 for ticks in self.level_cpu_time],
+            'per_level_dispatches': list(self.level_dispatches),
+            'per_level_completions': list(self.level_completions),
+            'boosts': self.total_boosts,  # Boosts that moved at least one process
+            'avg_response_time': self.total_response_time / self.responded if self.responded else 0,
+            'max_response_time': self.max_response_time,
+        })
+        return metrics
+
+SCHEDULERS = {
+    'fcfs': FCFSScheduler,
+    'sjf': SJFScheduler,
+    'rr': RoundRobinScheduler,
+    'srtf': SRTFScheduler,
+    'priority': PriorityScheduler,
+    'mlfq': MLFQScheduler,
+}
+
+def create_scheduler(algorithm, quantum=None, aging_interval=None, **kwargs):
+    """
+    Creates a scheduler from its short name (see SCHEDULERS).
+    :param quantum: Time quantum, required by Round Robin. For MLFQ without explicit quanta,
+                    the levels get quantum, 2 * quantum and 4 * quantum.
+    :param aging_interval: Ticks of waiting per priority level gained, for the priority scheduler.
+    """
+    try:
+        scheduler_class = SCHEDULERS[algorithm.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown scheduling algorithm '{algorithm}'. Choose from: {', '.join(SCHEDULERS)}.")
+    if scheduler_class is RoundRobinScheduler:
+        if quantum is None or quantum <= 0:
+            raise ValueError("Round Robin needs a positive time quantum.")
+        return scheduler_class(quantum, **kwargs)
+    if scheduler_class is MLFQScheduler:
+        if 'quanta' not in kwargs and quantum is not None:
+            if quantum <= 0:
+                raise ValueError("MLFQ needs a positive base time quantum.")
+            kwargs['quanta'] = (quantum, 2 * quantum, 4 * quantum)
+        return scheduler_class(**kwargs)
+    if scheduler_class is PriorityScheduler:
+        if aging_interval is not None and aging_interval <= 0:
+            raise ValueError("The aging interval must be a positive number of ticks.")
+        return scheduler_class(aging_interval, **kwargs)
+    return scheduler_class(**kwargs)
+
+
+def _simulated_time(scheduler):
+    return scheduler.total_execution_time
 
-        self._update_waiting_times(current_time, pid_this_tick)
-        self.gantt_chart.append({'pid': pid_this_tick, 'time': current_time})
-        avg_wait, avg_turnaround, cpu_util = self._calculate_metrics(current_time + 1)
-        self.total_execution_time = current_time + 1
 
-        return pid_this_tick, avg_wait, avg_turnaround, cpu_util, self.total_context_switches
\ No newline at end of file
+for _name in ('step', 'advance_to', 'run_to_completion'):
+    instrumentation.register(BaseScheduler, _name, f"scheduler.{_name}", progress=_simulated_time)
@@ -1,5 +1,7 @@
 # os_simulations/deadlock_handling.py
 
+from os_simulations import instrumentation
+
 class Resource:
     """
     Represents a system resource type with a total number of instances.
@@ -198,4 +200,7 @@ class DeadlockDetector:
             } for pid, p_state in self.processes.items()
         }
 
-        return resource_usage, processes_display_state
\ No newline at end of file
+        return resource_usage, processes_display_state
+
+
+instrumentation.register(DeadlockDetector, 'detect_deadlock', "DeadlockDetector.detect_deadlock")
@@ -0,0 +1,181 @@
+# os_simulations/gantt_timeline.py
+
+from array import array
+
+class GanttTimeline:
+    """
+    Run-length-encoded Gantt chart.
+
+    Stores (pid, start, length) segments in typed arrays instead of one dict
+    per tick. Consecutive ticks run by the same pid are merged into a single
+    segment. PIDs are interned to small integer codes; a code is released
+    once no stored segment uses it, so a ring buffer stays bounded however
+    many distinct pids pass through it.
+
+    If max_segments is given, the timeline acts as a ring buffer and only the
+    most recent max_segments segments are kept.
+    """
+    def __init__(self, max_segments=None):
+        if max_segments is not None and max_segments <= 0:
+            raise ValueError("max_segments must be a positive integer or None.")
+        self.max_segments = max_segments
+        self.clear()
+
+    def clear(self):
+        """Removes every segment."""
+        if self.max_segments is None:
+            self._codes = array('i')
+            self._starts = array('q')
+            self._lengths = array('q')
+        else:
+            self._codes = array('i', [0]) * self.max_segments
+            self._starts = array('q', [0]) * self.max_segments
+            self._lengths = array('q', [0]) * self.max_segments
+        self._pid_codes = {}   # pid -> code
+        self._pid_names = []   # code -> pid (None for a released code)
+        self._pid_refs = []    # code -> number of stored segments using it
+        self._free_codes = []  # Released codes, reused before new ones
+        self._head = 0   # Physical index of the oldest segment
+        self._count = 0  # Number of stored segments
+        self.dropped_segments = 0
+
+    def _code_for(self, pid):
+        code = self._pid_codes.get(pid)
+        if code is None:
+            if self._free_codes:
+                code = self._free_codes.pop()
+                self._pid_names[code] = pid
+            else:
+                code = len(self._pid_names)
+                self._pid_names.append(pid)
+                self._pid_refs.append(0)
+            self._pid_codes[pid] = code
+        return code
+
+    def _release(self, code):
+        """Drops one segment's reference to a code, freeing the code after the last one."""
+        self._pid_refs[code] -= 1
+        if not self._pid_refs[code]:
+            del self._pid_codes[self._pid_names[code]]
+            self._pid_names[code] = None
+            self._free_codes.append(code)
+
+    def _physical(self, index):
+        if self.max_segments is None:
+            return index
+        return (self._head + index) % self.max_segments
+
+    def append(self, pid, start, length=1):
+        """
+        Records that `pid` ran for `length` ticks starting at `start`.
+        Segments must be appended in time order.
+        """
+        if length <= 0:
+            return
+        code = self._code_for(pid)
+        if self._count:
+            last = self._physical(self._count - 1)
+            if self._codes[last] == code and self._starts[last] + self._lengths[last] == start:
+                self._lengths[last] += length
+                return
+
+        # Count the new reference first: the overwritten segment may use the same code.
+        self._pid_refs[code] += 1
+        if self.max_segments is None:
+            self._codes.append(code)
+            self._starts.append(start)
+            self._lengths.append(length)
+            self._count += 1
+            return
+
+        if self._count == self.max_segments:
+            # Overwrite the oldest segment.
+            self._release(self._codes[self._head])
+            self._head = (self._head + 1) % self.max_segments
+            self._count -= 1
+            self.dropped_segments += 1
+        slot = self._physical(self._count)
+        self._codes[slot] = code
+        self._starts[slot] = start
+        self._lengths[slot] = length
+        self._count += 1
+
+    def segment(self, index):
+        """Returns the (pid, start, length) tuple of the index-th stored segment."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("segment index out of range")
+        i = self._physical(index)
+        return self._pid_names[self._codes[i]], self._starts[i], self._lengths[i]
+
+    def __len__(self):
+        """Number of stored segments."""
+        return self._count
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self.segment(index)
+
+    @property
+    def start_time(self):
+        """Start of the oldest stored segment (0 if empty)."""
+        return self._starts[self._physical(0)] if self._count else 0
+
+    @property
+    def end_time(self):
+        """End of the newest stored segment (0 if empty)."""
+        if not self._count:
+            return 0
+        last = self._physical(self._count - 1)
+        return self._starts[last] + self._lengths[last]
+
+    def _first_ending_after(self, time):
+        """Index of the first stored segment whose end lies after `time`."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            i = self._physical(mid)
+            if self._starts[i] + self._lengths[i] <= time:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def truncate(self, end_time):
+        """Removes everything from end_time on, shortening the segment that spans it."""
+        keep = self._first_ending_after(end_time)
+        if keep < self._count:
+            i = self._physical(keep)
+            if self._starts[i] < end_time:
+                self._lengths[i] = end_time - self._starts[i]
+                keep += 1
+        for index in range(keep, self._count):
+            self._release(self._codes[self._physical(index)])
+        if self.max_segments is None:
+            del self._codes[keep:]
+            del self._starts[keep:]
+            del self._lengths[keep:]
+        self._count = keep
+
+    def segments_in_range(self, t0, t1):
+        """Yields the (pid, start, length) segments overlapping [t0, t1)."""
+        index = self._first_ending_after(t0)
+        while index < self._count:
+            pid, start, length = self.segment(index)
+            if start >= t1:
+                break
+            yield pid, start, length
+            index += 1
+
+    def pid_at(self, time):
+        """Returns the pid that ran at `time`, or None if it is not stored."""
+        for pid, _, _ in self.segments_in_range(time, time + 1):
+            return pid
+        return None
+
+    def iter_ticks(self):
+        """Yields {'pid', 'time'} dicts, one per tick, like the old list-based chart."""
+        for pid, start, length in self:
+            for time in range(start, start + length):
+                yield {'pid': pid, 'time': time}
@@ -0,0 +1,142 @@
+# os_simulations/hole_tree.py
+
+import random
+
+_random = random.Random()  # Treap priorities, independent of the global generator and its seed
+
+
+class _Node:
+    __slots__ = ('key', 'size', 'max_size', 'priority', 'left', 'right')
+
+    def __init__(self, key, size):
+        self.key = key
+        self.size = size
+        self.max_size = size   # Largest size in this subtree
+        self.priority = _random.random()
+        self.left = None
+        self.right = None
+
+    def update(self):
+        best = self.size
+        if self.left is not None and self.left.max_size > best:
+            best = self.left.max_size
+        if self.right is not None and self.right.max_size > best:
+            best = self.right.max_size
+        self.max_size = best
+
+
+class HoleTree:
+    """
+    Ordered set of free holes: a treap of (key, size) entries in key order,
+    where every node also knows the largest size in its subtree.
+
+    That augmentation answers "leftmost entry (from min_key on) whose size is
+    at least n" in O(log n) expected time by skipping every subtree whose
+    largest size is too small. Keyed by start address it gives First Fit;
+    keyed by (size, start) the leftmost fit is the Best Fit. Keys must be
+    unique and comparable with <.
+    """
+    __slots__ = ('_root', '_len')
+
+    def __init__(self):
+        self._root = None
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __bool__(self):
+        return self._root is not None
+
+    def __iter__(self):
+        """Yields (key, size) pairs in key order."""
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key, node.size
+            node = node.right
+
+    def clear(self):
+        self._root = None
+        self._len = 0
+
+    @property
+    def max_size(self):
+        """Largest size in the tree, 0 when empty."""
+        return 0 if self._root is None else self._root.max_size
+
+    def insert(self, key, size):
+        """Adds an entry whose key is not yet in the tree."""
+        left, right = self._split(self._root, key)
+        self._root = self._merge(self._merge(left, _Node(key, size)), right)
+        self._len += 1
+
+    def remove(self, key):
+        """Removes the entry with this key; KeyError if there is none."""
+        self._root = self._remove(self._root, key)
+        self._len -= 1
+
+    def first_fit(self, size, min_key=None):
+        """Key of the leftmost entry with key >= min_key (if given) and size >= size, or None."""
+        node = self._root
+        if node is None or node.max_size < size:
+            return None
+        return self._first_fit(node, size, min_key)
+
+    def _first_fit(self, node, size, min_key):
+        while node is not None and node.max_size >= size:
+            if min_key is not None and node.key < min_key:
+                node = node.right  # This node and its left subtree come before min_key.
+                continue
+            left = node.left
+            if left is not None and left.max_size >= size:
+                found = self._first_fit(left, size, min_key)
+                if found is not None:
+                    return found
+            if node.size >= size:
+                return node.key
+            node = node.right
+            min_key = None  # Everything to the right is past min_key.
+        return None
+
+    def _split(self, node, key):
+        """Splits a subtree into (keys < key, keys >= key)."""
+        if node is None:
+            return None, None
+        if node.key < key:
+            node.right, right = self._split(node.right, key)
+            node.update()
+            return node, right
+        left, node.left = self._split(node.left, key)
+        node.update()
+        return left, node
+
+    def _merge(self, left, right):
+        """Joins two subtrees where every key in left is below every key in right."""
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            left.update()
+            return left
+        right.left = self._merge(left, right.left)
+        right.update()
+        return right
+
+    def _remove(self, node, key):
+        if node is None:
+            raise KeyError(key)
+        if key < node.key:
+            node.left = self._remove(node.left, key)
+        elif node.key < key:
+            node.right = self._remove(node.right, key)
+        else:
+            return self._merge(node.left, node.right)
+        node.update()
+        return node
@@ -0,0 +1,130 @@
+# os_simulations/indexed_heap.py
+
+
+class IndexedHeap:
+    """
+    Binary min-heap of items (e.g. ProcessTable row ids) with a position index.
+
+    Besides push and pop, an item already in the heap can have its key changed
+    with update() (decrease-key or increase-key) or be removed with remove(),
+    both in O(log n), because the heap knows where each item sits. Keys are
+    compared with <, so tuples work; include a unique tiebreaker in the key
+    for a deterministic order.
+    """
+    __slots__ = ('_keys', '_items', '_position')
+
+    def __init__(self):
+        self._keys = []       # Heap-ordered keys
+        self._items = []      # Item at the same heap slot
+        self._position = {}   # Item -> heap slot
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def __contains__(self, item):
+        return item in self._position
+
+    def __iter__(self):
+        """Iterates over the items in heap (not sorted) order."""
+        return iter(self._items)
+
+    def clear(self):
+        self._keys.clear()
+        self._items.clear()
+        self._position.clear()
+
+    def copy(self):
+        """Returns an independent heap with the same items and keys."""
+        heap = IndexedHeap()
+        heap._keys = self._keys.copy()
+        heap._items = self._items.copy()
+        heap._position = self._position.copy()
+        return heap
+
+    def key(self, item):
+        """Current key of an item in the heap."""
+        return self._keys[self._position[item]]
+
+    def push(self, item, key):
+        """Adds an item that is not yet in the heap."""
+        if item in self._position:
+            raise ValueError(f"{item!r} is already in the heap.")
+        self._keys.append(key)
+        self._items.append(item)
+        self._position[item] = len(self._items) - 1
+        self._sift_up(len(self._items) - 1)
+
+    def peek(self):
+        """Returns the item with the smallest key without removing it, or None if empty."""
+        return self._items[0] if self._items else None
+
+    def peek_key(self):
+        """Returns the smallest key, or None if empty."""
+        return self._keys[0] if self._keys else None
+
+    def pop(self):
+        """Removes and returns the item with the smallest key. Raises IndexError if empty."""
+        if not self._items:
+            raise IndexError("pop from an empty heap")
+        item = self._items[0]
+        self._remove_at(0)
+        return item
+
+    def remove(self, item):
+        """Removes an item from anywhere in the heap. Raises KeyError if it is not there."""
+        self._remove_at(self._position[item])
+
+    def update(self, item, key):
+        """Changes the key of an item in the heap, moving it up or down as needed."""
+        slot = self._position[item]
+        old_key = self._keys[slot]
+        self._keys[slot] = key
+        if key < old_key:
+            self._sift_up(slot)
+        else:
+            self._sift_down(slot)
+
+    def _remove_at(self, slot):
+        keys, items = self._keys, self._items
+        del self._position[items[slot]]
+        last_key, last_item = keys.pop(), items.pop()
+        if slot == len(items):
+            return
+        keys[slot], items[slot] = last_key, last_item
+        self._position[last_item] = slot
+        self._sift_down(slot)
+        self._sift_up(slot)
+
+    def _sift_up(self, slot):
+        keys, items, position = self._keys, self._items, self._position
+        key, item = keys[slot], items[slot]
+        while slot > 0:
+            parent = (slot - 1) >> 1
+            if not key < keys[parent]:
+                break
+            keys[slot], items[slot] = keys[parent], items[parent]
+            position[items[slot]] = slot
+            slot = parent
+        keys[slot], items[slot] = key, item
+        position[item] = slot
+
+    def _sift_down(self, slot):
+        keys, items, position = self._keys, self._items, self._position
+        count = len(items)
+        key, item = keys[slot], items[slot]
+        while True:
+            child = 2 * slot + 1
+            if child >= count:
+                break
+            if child + 1 < count and keys[child + 1] < keys[child]:
+                child += 1
+            if not keys[child] < key:
+                break
+            keys[slot], items[slot] = keys[child], items[child]
+            position[items[slot]] = slot
+            slot = child
+        keys[slot], items[slot] = key, item
+        position[item] = slot
@@ -0,0 +1,200 @@
+# os_simulations/instrumentation.py
+
+"""
+Opt-in timing hooks for the hot paths of the simulators.
+
+Modules register the functions worth watching when they are imported, e.g.
+
+    instrumentation.register(MemoryManager, 'allocate', 'MemoryManager.allocate')
+
+Registering changes nothing. registry.enable() replaces each registered
+method on its class with a wrapper that records call counts and wall time,
+and registry.disable() puts the original function back, so a disabled hook
+costs nothing at all rather than a flag check per call.
+
+    registry.enable()
+    ...  # run the simulation
+    registry.export_json('profile.json')
+"""
+
+import functools
+import json
+import threading
+import time
+
+from os_simulations.quantile_sketch import QuantileSketch
+
+
+class HookStats:
+    """
+    Call count, wall time and latency distribution of one hook.
+
+    histogram maps a power-of-two bucket b to the number of calls that took
+    [2**(b-1), 2**b) microseconds (bucket 0 is under a microsecond). ticks
+    is the simulated time the calls advanced, for hooks that track it.
+    """
+    def __init__(self, label):
+        self.label = label
+        self.clear()
+
+    def clear(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.ticks = 0
+        self.histogram = {}
+        self.latency = QuantileSketch(relative_accuracy=0.02)
+
+    def record(self, seconds, ticks=0):
+        self.calls += 1
+        self.total_seconds += seconds
+        self.ticks += ticks
+        bucket = int(seconds * 1_000_000).bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+        self.latency.add(seconds)
+
+    def as_dict(self):
+        """Plain-data view of the statistics, with times in seconds."""
+        summary = self.latency.summary()
+        return {
+            'label': self.label,
+            'calls': self.calls,
+            'total_seconds': self.total_seconds,
+            'mean_seconds': self.latency.mean(),
+            'p50_seconds': summary['p50'],
+            'p95_seconds': summary['p95'],
+            'p99_seconds': summary['p99'],
+            'max_seconds': summary['max'],
+            'ticks': self.ticks,
+            'ticks_per_sec': self.ticks / self.total_seconds if self.ticks and self.total_seconds > 0 else None,
+            # [upper bound in microseconds, calls] for every non-empty bucket, fastest first
+            'histogram_us': [[2 ** bucket, self.histogram[bucket]] for bucket in sorted(self.histogram)],
+        }
+
+
+class HookRegistry:
+    """
+    The set of registered hooks and their statistics.
+
+    Several methods may share a label (e.g. the step() of every scheduler
+    class); their calls are counted together. Variant labels (see the split
+    argument of register()) appear when their first call is recorded.
+    Statistics may be read from another thread through snapshot() while
+    the hooks are recording.
+    """
+    def __init__(self):
+        self.enabled = False
+        self._hooks = []    # (owner, name, original function, wrapper)
+        self._stats = {}    # label -> HookStats, in registration order
+        self._lock = threading.Lock()
+
+    def register(self, owner, name, label=None, progress=None, split=None):
+        """
+        Registers owner.name (a function defined on class owner) for timing.
+        :param label: Name the calls are reported under (default 'Owner.name').
+        :param progress: Optional function of the instance returning its simulated
+                         time; the hook then also counts the ticks each call advanced.
+        :param split: Optional function taking the call's arguments (instance first) and
+                      returning a variant name, e.g. the algorithm used. Calls are then
+                      also reported under 'label[variant]'. Not combinable with progress.
+        """
+        if progress is not None and split is not None:
+            raise ValueError("A hook can count progress or split by variant, not both.")
+        original = owner.__dict__[name]
+        label = label or f"{owner.__name__}.{name}"
+        stats = self._stats_for(label)
+        wrapper = self._wrap(original, stats, progress, split)
+        self._hooks.append((owner, name, original, wrapper))
+        if self.enabled:
+            setattr(owner, name, wrapper)
+        return label
+
+    def _stats_for(self, label):
+        stats = self._stats.get(label)
+        if stats is None:
+            stats = self._stats[label] = HookStats(label)
+        return stats
+
+    def _wrap(self, func, stats, progress, split):
+        lock = self._lock
+        clock = time.perf_counter
+        if split is not None:
+            stats_for = self._stats_for
+
+            @functools.wraps(func)
+            def timed_by_variant(*args, **kwargs):
+                started = clock()
+                result = func(*args, **kwargs)  # Calls that raise are not timed.
+                elapsed = clock() - started
+                variant_label = f"{stats.label}[{split(*args, **kwargs)}]"
+                with lock:
+                    stats.record(elapsed)
+                    stats_for(variant_label).record(elapsed)
+                return result
+            return timed_by_variant
+
+        if progress is None:
+            @functools.wraps(func)
+            def timed(*args, **kwargs):
+                started = clock()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    elapsed = clock() - started
+                    with lock:
+                        stats.record(elapsed)
+            return timed
+
+        @functools.wraps(func)
+        def timed_with_progress(instance, *args, **kwargs):
+            before = progress(instance)
+            started = clock()
+            try:
+                return func(instance, *args, **kwargs)
+            finally:
+                elapsed = clock() - started
+                with lock:
+                    stats.record(elapsed, progress(instance) - before)
+        return timed_with_progress
+
+    def enable(self):
+        """Starts timing every registered hook."""
+        for owner, name, _, wrapper in self._hooks:
+            setattr(owner, name, wrapper)
+        self.enabled = True
+
+    def disable(self):
+        """Restores the original functions; the statistics are kept."""
+        for owner, name, original, _ in self._hooks:
+            setattr(owner, name, original)
+        self.enabled = False
+
+    def reset(self):
+        """Clears the statistics of every hook."""
+        with self._lock:
+            for stats in self._stats.values():
+                stats.clear()
+
+    def labels(self):
+        return list(self._stats)
+
+    def snapshot(self):
+        """Returns {label: HookStats.as_dict()} for every hook, consistent across hooks."""
+        with self._lock:
+            return {label: stats.as_dict() for label, stats in self._stats.items()}
+
+    def to_json(self):
+        """Serialises snapshot() with the capture time and whether timing is enabled."""
+        return json.dumps({'captured_at': time.time(), 'enabled': self.enabled, 'hooks': self.snapshot()}, indent=2)
+
+    def export_json(self, path):
+        with open(path, 'w') as f:
+            f.write(self.to_json())
+            f.write('\n')
+
+
+registry = HookRegistry()
+
+
+def register(owner, name, label=None, progress=None, split=None):
+    """Registers a hook on the shared registry. See HookRegistry.register()."""
+    return registry.register(owner, name, label, progress, split)
@@ -1,5 +1,10 @@
 # os_simulations/memory_management.py
 
+from os_simulations import instrumentation
+from os_simulations.hole_tree import HoleTree
+
+ALLOCATION_ALGORITHMS = ('First Fit', 'Best Fit', 'Next Fit', 'Worst Fit')
+
 class MemoryBlock:
     """
     Represents a contiguous block of memory, either free or allocated.
@@ -10,6 +15,8 @@ class MemoryBlock:
         self.size = size
         self.status = status # 'free' or 'allocated'
         self.process_id = process_id # PID of the process if allocated
+        self.prev = None # Neighbouring blocks in address order
+        self.next = None
 
     def __repr__(self):
         if self.status == 'allocated':
@@ -19,115 +26,173 @@ class MemoryBlock:
 class MemoryManager:
     """
     Manages memory allocation and deallocation using various algorithms.
+
+    Blocks form a doubly linked list in address order, so splitting a hole
+    is O(1). The free holes are also indexed twice in HoleTrees, by start
+    address and by (size, start): First Fit is the leftmost hole big enough
+    in the first, Best Fit in the second, each found in O(log n) however
+    many allocated blocks lie in between. Next Fit searches the address
+    index from a roving pointer (the end of its previous allocation) and
+    wraps around; Worst Fit takes the largest hole, which both indexes
+    track per subtree. Ties go to the lowest address.
+
+    The allocated blocks are indexed by process ID, so a free finds them
+    directly and merges each with its list neighbours in O(log n), the
+    index updates, instead of scanning and rebuilding the whole list.
     """
     def __init__(self, total_memory_size):
         self.total_memory_size = total_memory_size
-        self.memory_blocks = [] # List of MemoryBlock objects
         self.reset_memory() # Initialize with one large free block
 
     def reset_memory(self):
         """Resets the memory to a single large free block."""
-        self.memory_blocks = [MemoryBlock('free-0', 0, self.total_memory_size, 'free')]
-        # Sort by start address to maintain order
-        self.memory_blocks.sort(key=lambda b: b.start)
+        self._first_block = MemoryBlock('free-0', 0, self.total_memory_size, 'free')
+        self._holes_by_address = HoleTree() # start -> size of every free block
+        self._holes_by_size = HoleTree()    # (size, start) -> size
+        self._free_blocks = {}              # start -> free MemoryBlock
+        self._free_memory = 0
+        self._next_fit_address = 0          # Where Next Fit resumes its search
+        self._blocks_by_pid = {}            # pid -> its allocated MemoryBlocks
+        self._add_hole(self._first_block)
+
+    @property
+    def memory_blocks(self):
+        """List of MemoryBlock objects in address order."""
+        return list(self._iter_blocks())
+
+    def _iter_blocks(self):
+        block = self._first_block
+        while block is not None:
+            yield block
+            block = block.next
+
+    def _add_hole(self, block):
+        """Indexes a free block."""
+        self._holes_by_address.insert(block.start, block.size)
+        self._holes_by_size.insert((block.size, block.start), block.size)
+        self._free_blocks[block.start] = block
+        self._free_memory += block.size
+
+    def _remove_hole(self, block):
+        """Drops a free block from the indexes, before it is resized or allocated."""
+        self._holes_by_address.remove(block.start)
+        self._holes_by_size.remove((block.size, block.start))
+        del self._free_blocks[block.start]
+        self._free_memory -= block.size
+
+    def _find_hole(self, size, algorithm):
+        """Returns the free block chosen by the algorithm for `size` units, or None."""
+        if algorithm == 'First Fit':
+            start = self._holes_by_address.first_fit(size)
+        elif algorithm == 'Best Fit':
+            key = self._holes_by_size.first_fit(size)  # Smallest fitting size, lowest address on ties
+            start = None if key is None else key[1]
+        elif algorithm == 'Next Fit':
+            start = self._holes_by_address.first_fit(size, self._next_fit_address)
+            if start is None:
+                start = self._holes_by_address.first_fit(size) # Wrap around to the start of memory
+            if start is not None:
+                self._next_fit_address = start + size
+        else: # Worst Fit
+            largest = self._holes_by_size.max_size
+            start = self._holes_by_address.first_fit(largest) if largest >= size else None
+        return None if start is None else self._free_blocks[start]
 
     def allocate(self, process_id, size, algorithm='First Fit'):
         """
-        Allocates a block of memory to a process using the specified algorithm.
+        Allocates a block of memory to a process using the specified algorithm
+        (one of ALLOCATION_ALGORITHMS; anything else raises ValueError).
         Returns True if allocation successful, False otherwise.
         """
+        return self.allocate_block(process_id, size, algorithm) is not None
+
+    def allocate_block(self, process_id, size, algorithm='First Fit'):
+        """Like allocate(), but returns the allocated MemoryBlock, or None if allocation failed."""
+        if algorithm not in ALLOCATION_ALGORITHMS:
+            raise ValueError(f"Unknown allocation algorithm '{algorithm}'. "
+                             f"Choose from: {', '.join(ALLOCATION_ALGORITHMS)}.")
         if size <= 0:
-            return False # Invalid size
-
-        best_fit_block_index = -1
-        min_remaining_size = float('inf')
-
-        # Find suitable block based on algorithm
-        for i, block in enumerate(self.memory_blocks):
-            if block.status == 'free' and block.size >= size:
-                if algorithm == 'First Fit':
-                    best_fit_block_index = i
-                    break # Found the first suitable block
-                elif algorithm == 'Best Fit':
-                    if block.size - size < min_remaining_size:
-                        min_remaining_size = block.size - size
-                        best_fit_block_index = i
-
-        if best_fit_block_index != -1:
-            block_to_allocate = self.memory_blocks[best_fit_block_index]
-            allocated_block_size = size
-            remaining_size = block_to_allocate.size - size
-
-            # Update the existing block to be the allocated portion
-            block_to_allocate.size = allocated_block_size
-            block_to_allocate.status = 'allocated'
-            block_to_allocate.process_id = process_id
-
-            if remaining_size > 0:
-                # Create a new free block for the remaining space
-                new_free_block = MemoryBlock(
-                    block_id=f"free-{block_to_allocate.id}-{block_to_allocate.start + allocated_block_size}",
-                    start_address=block_to_allocate.start + allocated_block_size,
-                    size=remaining_size,
-                    status='free'
-                )
-                # Insert the new free block right after the allocated one
-                self.memory_blocks.insert(best_fit_block_index + 1, new_free_block)
-            return True
-        return False # No suitable block found
+            return None # Invalid size
+
+        block_to_allocate = self._find_hole(size, algorithm)
+        if block_to_allocate is None:
+            return None # No suitable block found
+
+        self._remove_hole(block_to_allocate)
+        allocated_block_size = size
+        remaining_size = block_to_allocate.size - size
+
+        # Update the existing block to be the allocated portion
+        block_to_allocate.size = allocated_block_size
+        block_to_allocate.status = 'allocated'
+        block_to_allocate.process_id = process_id
+        self._blocks_by_pid.setdefault(process_id, []).append(block_to_allocate)
+
+        if remaining_size > 0:
+            # Create a new free block for the remaining space
+            new_free_block = MemoryBlock(
+                block_id=f"free-{block_to_allocate.start + allocated_block_size}-{remaining_size}",
+                start_address=block_to_allocate.start + allocated_block_size,
+                size=remaining_size,
+                status='free'
+            )
+            # Link the new free block right after the allocated one
+            new_free_block.prev = block_to_allocate
+            new_free_block.next = block_to_allocate.next
+            if block_to_allocate.next is not None:
+                block_to_allocate.next.prev = new_free_block
+            block_to_allocate.next = new_free_block
+            self._add_hole(new_free_block)
+        return block_to_allocate
 
     def deallocate(self, process_id):
         """
         Deallocates memory held by a given process ID.
-        Merges adjacent free blocks.
+        Each freed block merges with its free neighbours only.
         """
-        deallocated_any = False
-        # First, mark all blocks allocated to this process as free
-        for block in self.memory_blocks:
-            if block.process_id == process_id and block.status == 'allocated':
-                block.status = 'free'
-                block.process_id = None
-                deallocated_any = True
-
-        if deallocated_any:
-            self._merge_free_blocks()
-        return deallocated_any
-
-    def _merge_free_blocks(self):
+        blocks = self._blocks_by_pid.pop(process_id, None)
+        if not blocks:
+            return False
+        for block in blocks:
+            block.status = 'free'
+            block.process_id = None
+            self._coalesce(block)
+        return True
+
+    def _coalesce(self, block):
         """
-        Internal helper to merge adjacent free memory blocks.
-        Assumes self.memory_blocks is sorted by start address.
+        Internal helper to merge a freed block with the free blocks right before
+        and after it and index the resulting hole. Since free neighbours are
+        merged as soon as they appear, no other block can take part.
         """
-        if not self.memory_blocks:
-            return
-
-        merged_blocks = []
-        # Sort by start address to ensure correct merging
-        self.memory_blocks.sort(key=lambda b: b.start)
-
-        # Initialize with the first block
-        if self.memory_blocks:
-            current_merged_block = self.memory_blocks[0]
-            merged_blocks.append(current_merged_block)
-        else:
-            self.memory_blocks = []
-            return
-
-
-        for i in range(1, len(self.memory_blocks)):
-            next_block = self.memory_blocks[i]
-            if current_merged_block.status == 'free' and \
-               next_block.status == 'free' and \
-               current_merged_block.start + current_merged_block.size == next_block.start:
-                # Merge: Extend the current merged block's size
-                current_merged_block.size += next_block.size
-                # Update the ID of the merged block (optional, but good practice for unique IDs)
-                current_merged_block.id = f"free-{current_merged_block.start}-{current_merged_block.size}"
-            else:
-                # Cannot merge, start a new merged block
-                merged_blocks.append(next_block)
-                current_merged_block = next_block
-        self.memory_blocks = merged_blocks
+        merged = False
+        previous_block = block.prev
+        if previous_block is not None and previous_block.status == 'free':
+            self._remove_hole(previous_block)
+            previous_block.size += block.size
+            self._unlink(block)
+            block = previous_block
+            merged = True
+        next_block = block.next
+        if next_block is not None and next_block.status == 'free':
+            self._remove_hole(next_block)
+            block.size += next_block.size
+            self._unlink(next_block)
+            merged = True
+        if merged:
+            # Update the ID of the merged block (optional, but good practice for unique IDs)
+            block.id = f"free-{block.start}-{block.size}"
+        self._add_hole(block)
+
+    def _unlink(self, block):
+        """Removes a block (never the first) from the list after it was merged into its predecessor."""
+        block.prev.next = block.next
+        if block.next is not None:
+            block.next.prev = block.prev
+
+    def blocks_of(self, process_id):
+        """Returns [(start, size)] of the blocks allocated to a process, in address order."""
+        return sorted((b.start, b.size) for b in self._blocks_by_pid.get(process_id, ()))
 
     def get_memory_map_data(self):
         """
@@ -135,30 +200,22 @@ class MemoryManager:
         [{'start': 0, 'size': 100, 'status': 'free', 'process_id': None}, ...]
         """
         return [{'start': b.start, 'size': b.size, 'status': b.status, 'process_id': b.process_id}
-                for b in self.memory_blocks]
+                for b in self._iter_blocks()]
 
     def calculate_stats(self):
         """
         Calculates and returns memory usage statistics.
         Returns a dictionary: {'free_memory', 'allocated_memory', 'free_holes', 'largest_free_block'}
         """
-        free_memory = 0
-        allocated_memory = 0
-        free_holes = 0
-        largest_free_block = 0
-
-        for block in self.memory_blocks:
-            if block.status == 'free':
-                free_memory += block.size
-                free_holes += 1
-                if block.size > largest_free_block:
-                    largest_free_block = block.size
-            else:
-                allocated_memory += block.size
-
         return {
-            'free_memory': free_memory,
-            'allocated_memory': allocated_memory,
-            'free_holes': free_holes,
-            'largest_free_block': largest_free_block
-        }
\ No newline at end of file
+            'free_memory': self._free_memory,
+            'allocated_memory': self.total_memory_size - self._free_memory,
+            'free_holes': len(self._free_blocks),
+            'largest_free_block': self._holes_by_size.max_size
+        }
+
+def _allocation_algorithm(manager, process_id, size, algorithm='First Fit'):
+    return algorithm
+
+
+instrumentation.register(MemoryManager, 'allocate', "MemoryManager.allocate", split=_allocation_algorithm)
@@ -0,0 +1,327 @@
+# os_simulations/process_table.py
+
+from array import array
+
+
+class ProcessTable:
+    """
+    Struct-of-arrays store for process state.
+
+    Each process is a row identified by an integer id (its position). The
+    numeric attributes live in typed arrays, one per column, so a million
+    processes cost a few dozen bytes each instead of a full object with a
+    __dict__. Process objects are thin views onto a row.
+
+    A process may alternate CPU and I/O bursts. burst is then its total CPU
+    time, and io maps its row id to the (device, io_time, cpu_time) phases
+    that follow the first CPU burst. remaining always counts down the
+    current CPU burst. Rows without I/O have no entry in io.
+    """
+    COLUMNS = ('arrival', 'burst', 'priority', 'remaining', 'start', 'completion', 'waiting', 'last_enqueued')
+
+    def __init__(self):
+        self.pids = []
+        self.arrival = array('q')
+        self.burst = array('q')
+        self.priority = array('q')       # Lower value means higher priority
+        self.remaining = array('q')
+        self.start = array('q')          # -1 until first dispatched
+        self.completion = array('q')     # -1 until completed
+        self.waiting = array('q')        # Time spent in the ready queue up to the last dispatch
+        self.last_enqueued = array('q')  # When the process last joined (or, blocked, left) the ready queue
+        self.io = {}                     # Row id -> ((device, io_time, cpu_time), ...) after the first CPU burst
+        self._index_by_pid = None        # Built lazily by index_of()
+
+    def add(self, pid, arrival_time, burst_time, priority=0, io=None):
+        """
+        Appends a fresh row and returns its id.
+        :param io: Optional (device, io_time, cpu_time) phases that follow the first CPU
+                   burst; burst_time is the total CPU time, including their cpu_time.
+        """
+        index = len(self.pids)
+        io = _check_io(pid, burst_time, io)
+        if io:
+            self.io[index] = io
+        self.pids.append(pid)
+        self.arrival.append(arrival_time)
+        self.burst.append(burst_time)
+        self.priority.append(priority)
+        self.remaining.append(burst_time)
+        if io:
+            self.remaining[index] = self.first_burst(index)
+        self.start.append(-1)
+        self.completion.append(-1)
+        self.waiting.append(0)
+        self.last_enqueued.append(arrival_time)
+        if self._index_by_pid is not None:
+            self._index_by_pid[pid] = len(self.pids) - 1
+        return len(self.pids) - 1
+
+    def extend(self, processes):
+        """Appends a fresh row for each Process (or anything with pid, arrival_time and burst_time)."""
+        for p in processes:
+            self.add(p.pid, p.arrival_time, p.burst_time, getattr(p, 'priority', 0), getattr(p, 'io_bursts', None))
+
+    def fresh_copy(self, order=None):
+        """
+        Returns a new table with the same pids, arrivals, bursts, priorities and I/O
+        and reset run state, optionally with rows rearranged into `order` (a list of ids).
+        """
+        table = ProcessTable()
+        if order is None:
+            table.pids = list(self.pids)
+            table.arrival = array('q', self.arrival)
+            table.burst = array('q', self.burst)
+            table.priority = array('q', self.priority)
+            table.io = dict(self.io)
+        else:
+            table.pids = [self.pids[i] for i in order]
+            table.arrival = array('q', (self.arrival[i] for i in order))
+            table.burst = array('q', (self.burst[i] for i in order))
+            table.priority = array('q', (self.priority[i] for i in order))
+            table.io = {new: self.io[old] for new, old in enumerate(order) if old in self.io}
+        count = len(table.pids)
+        table.remaining = array('q', table.burst)
+        for index in table.io:
+            table.remaining[index] = table.first_burst(index)
+        table.start = array('q', [-1]) * count
+        table.completion = array('q', [-1]) * count
+        table.waiting = array('q', [0]) * count
+        table.last_enqueued = array('q', table.arrival)
+        return table
+
+    def for_run(self):
+        """
+        Returns a table for one simulation run over this workload. It shares the
+        pids, arrivals, bursts, priorities and I/O with this table instead of copying
+        them, so they may be read-only (see shared_workload.attach()), and only the
+        run state columns are allocated. This table must not change while it is used.
+        """
+        table = ProcessTable()
+        table.pids = self.pids
+        table.arrival = self.arrival
+        table.burst = self.burst
+        table.priority = self.priority
+        table.io = self.io
+        count = len(self.pids)
+        table.remaining = array('q', self.burst)
+        for index in self.io:
+            table.remaining[index] = self.first_burst(index)
+        table.start = array('q', [-1]) * count
+        table.completion = array('q', [-1]) * count
+        table.waiting = array('q', [0]) * count
+        table.last_enqueued = array('q', self.arrival)
+        return table
+
+    def reset_rows(self, ids):
+        """Puts the given rows back into their fresh, not yet arrived state."""
+        for index in ids:
+            self.remaining[index] = self.first_burst(index) if index in self.io else self.burst[index]
+            self.start[index] = -1
+            self.completion[index] = -1
+            self.waiting[index] = 0
+            self.last_enqueued[index] = self.arrival[index]
+
+    def first_burst(self, index):
+        """Length of the first CPU burst of a row."""
+        return self.burst[index] - sum(cpu_time for _, _, cpu_time in self.io.get(index, ()))
+
+    def arrival_order(self):
+        """Ids sorted by arrival time (stable), or None if they already are."""
+        arrival = self.arrival
+        if all(arrival[i] <= arrival[i + 1] for i in range(len(arrival) - 1)):
+            return None
+        return sorted(range(len(arrival)), key=arrival.__getitem__)
+
+    def index_of(self, pid):
+        """Returns the id of the row with the given pid, or None."""
+        if self._index_by_pid is None:
+            self._index_by_pid = {pid: index for index, pid in enumerate(self.pids)}
+        return self._index_by_pid.get(pid)
+
+    def view(self, index):
+        return Process._view(self, index)
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.pids)
+        if not 0 <= index < len(self.pids):
+            raise IndexError("process index out of range")
+        return Process._view(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.pids)):
+            yield Process._view(self, index)
+
+
+class StreamingProcessTable(ProcessTable):
+    """
+    Run table of a streamed workload (see BaseScheduler.load_stream()).
+
+    Row ids keep counting up as rows are added, but every column is a dict
+    keyed by row id instead of an array, and release() drops a completed
+    row. Memory therefore follows the number of processes in the system at
+    once, not the length of the trace. len() counts every row added so far.
+    """
+    def __init__(self):
+        super().__init__()
+        self.pids = {}
+        for name in self.COLUMNS:
+            setattr(self, name, {})
+        self._count = 0
+        self.last_arrival = None  # Arrival of the last row added
+
+    def add(self, pid, arrival_time, burst_time, priority=0, io=None):
+        """Adds a fresh row like ProcessTable.add() and returns its id."""
+        index = self._count
+        io = _check_io(pid, burst_time, io)
+        if io:
+            self.io[index] = io
+        self.pids[index] = pid
+        self.arrival[index] = arrival_time
+        self.burst[index] = burst_time
+        self.priority[index] = priority
+        self.remaining[index] = self.first_burst(index) if io else burst_time
+        self.start[index] = -1
+        self.completion[index] = -1
+        self.waiting[index] = 0
+        self.last_enqueued[index] = arrival_time
+        if self._index_by_pid is not None:
+            self._index_by_pid[pid] = index
+        self._count += 1
+        self.last_arrival = arrival_time
+        return index
+
+    def release(self, index):
+        """Drops a row, e.g. once its process has completed. Ids are never reused."""
+        pid = self.pids.pop(index)
+        for name in self.COLUMNS:
+            del getattr(self, name)[index]
+        self.io.pop(index, None)
+        if self._index_by_pid is not None and self._index_by_pid.get(pid) == index:
+            del self._index_by_pid[pid]
+
+    def index_of(self, pid):
+        """Returns the id of the held row with the given pid, or None."""
+        if self._index_by_pid is None:
+            self._index_by_pid = {pid: index for index, pid in self.pids.items()}
+        return self._index_by_pid.get(pid)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index not in self.pids:
+            raise IndexError("no process with this row id is held")
+        return Process._view(self, index)
+
+    def __iter__(self):
+        """Yields the rows still held, in row order."""
+        for index in list(self.pids):
+            yield Process._view(self, index)
+
+
+def _check_io(pid, burst_time, io):
+    """Returns the I/O phases of a new row as a tuple of triples, or None; ValueError if they do not fit."""
+    if not io:
+        return None
+    io = tuple((device, io_time, cpu_time) for device, io_time, cpu_time in io)
+    if burst_time - sum(cpu_time for _, _, cpu_time in io) <= 0:
+        raise ValueError(f"Process '{pid}': the CPU bursts after I/O must leave a positive first burst.")
+    return io
+
+
+class ProcessList:
+    """Read-only sequence of Process views for a list of row ids."""
+    __slots__ = ('_table', '_ids')
+
+    def __init__(self, table, ids):
+        self._table = table
+        self._ids = ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, position):
+        return Process._view(self._table, self._ids[position])
+
+    def __iter__(self):
+        table = self._table
+        for index in self._ids:
+            yield Process._view(table, index)
+
+
+def _column(name, doc):
+    def get(self):
+        return getattr(self._table, name)[self._index]
+
+    def set(self, value):
+        getattr(self._table, name)[self._index] = value
+
+    return property(get, set, doc=doc)
+
+
+class Process:
+    """
+    Represents a process with its attributes for CPU scheduling.
+
+    A Process is a lightweight view onto one row of a ProcessTable.
+    Process(pid, arrival, burst) creates a standalone one-row table, so it
+    can still be used as a plain value object.
+    """
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, pid, arrival_time, burst_time, priority=0, io=None):
+        self._table = ProcessTable()
+        self._index = self._table.add(pid, arrival_time, burst_time, priority, io)
+
+    @classmethod
+    def _view(cls, table, index):
+        process = cls.__new__(cls)
+        process._table = table
+        process._index = index
+        return process
+
+    @property
+    def pid(self):
+        return self._table.pids[self._index]
+
+    @property
+    def index(self):
+        """Row id in the underlying ProcessTable."""
+        return self._index
+
+    arrival_time = _column('arrival', "Arrival time.")
+    initial_arrival = _column('arrival', "Arrival time (kept for compatibility).")
+    burst_time = _column('burst', "Total CPU time needed.")
+    priority = _column('priority', "Scheduling priority, lower is more urgent.")
+    remaining_time = _column('remaining', "CPU time still needed in the current CPU burst.")
+    start_time = _column('start', "First dispatch time, -1 if never run.")
+    completion_time = _column('completion', "Completion time, -1 if not finished.")
+    waiting_time = _column('waiting', "Time spent in the ready queue before the last dispatch.")
+    last_enqueued_time = _column('last_enqueued', "When the process last joined the ready queue.")
+
+    @property
+    def io_bursts(self):
+        """(device, io_time, cpu_time) phases after the first CPU burst; empty for CPU-only processes."""
+        return self._table.io.get(self._index, ())
+
+    @property
+    def turnaround_time(self):
+        if self.completion_time == -1:
+            return 0
+        return self.completion_time - self.arrival_time
+
+    def __eq__(self, other):
+        if not isinstance(other, Process):
+            return NotImplemented
+        return self._table is other._table and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._table), self._index))
+
+    def __repr__(self):
+        return f"Process(PID={self.pid}, Arrival={self.arrival_time}, Burst={self.burst_time}, Remaining={self.remaining_time})"
@@ -0,0 +1,109 @@
+# os_simulations/quantile_sketch.py
+
+import math
+
+
+class QuantileSketch:
+    """
+    Streaming quantile estimator for non-negative values (DDSketch-style).
+
+    Values are counted in logarithmic buckets: bucket i holds values in
+    (gamma**(i-1), gamma**i] with gamma = (1 + a) / (1 - a), so every
+    quantile estimate is within relative error `a` of a value in the data.
+    Zeros, common for waiting times, have their own counter. Memory depends
+    only on the spread of the values (about 1,000 buckets cover 1 to 10**9 at
+    1% accuracy), never on how many were added; past max_buckets the lowest
+    buckets are merged, which only coarsens the smallest quantiles.
+    """
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1.")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.clear()
+
+    def clear(self):
+        self.buckets = {}  # Bucket index -> count
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        if value < 0:
+            raise ValueError("QuantileSketch only accepts non-negative values.")
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if value == 0:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        buckets = self.buckets
+        buckets[key] = buckets.get(key, 0) + 1
+        if len(buckets) > self.max_buckets:
+            lowest, second = sorted(buckets)[:2]
+            buckets[second] += buckets.pop(lowest)
+
+    def merge(self, other):
+        """Adds the contents of another sketch with the same relative accuracy."""
+        if other.gamma != self.gamma:
+            raise ValueError("Only sketches with the same relative accuracy can be merged.")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        for bound in (other.min, other.max):
+            if bound is not None:
+                self.min = bound if self.min is None else min(self.min, bound)
+                self.max = bound if self.max is None else max(self.max, bound)
+        while len(self.buckets) > self.max_buckets:
+            lowest, second = sorted(self.buckets)[:2]
+            self.buckets[second] += self.buckets.pop(lowest)
+
+    def copy(self):
+        """Returns an independent sketch with the same contents."""
+        sketch = QuantileSketch(self.relative_accuracy, self.max_buckets)
+        sketch.merge(self)
+        return sketch
+
+    def quantile(self, q):
+        """Estimated q-quantile (0 <= q <= 1), or None if nothing has been added."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1.")
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                estimate = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def summary(self):
+        """Returns {'p50', 'p95', 'p99', 'max'}, with zeros for an empty sketch."""
+        if self.count == 0:
+            return {'p50': 0, 'p95': 0, 'p99': 0, 'max': 0}
+        return {
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'max': self.max,
+        }
+
+    def __len__(self):
+        return self.count
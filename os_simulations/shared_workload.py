@@ -0,0 +1,84 @@
+# os_simulations/shared_workload.py
+
+"""
+Read-only workloads shared between processes.
+
+SharedWorkload puts the input columns of a ProcessTable (arrival, burst and
+priority, plus the pids and I/O phases) into one shared memory block. Worker
+processes attach to it by name and read the columns in place, so a workload
+is stored once however many schedulers run against it, and starting a worker
+only sends a short handle instead of pickling every row.
+
+    with SharedWorkload(table) as shared:
+        ...  # pass shared.handle to the workers, which call attach(handle)
+"""
+
+import pickle
+from array import array
+from multiprocessing import shared_memory
+
+from os_simulations.process_table import ProcessTable
+
+SHARED_COLUMNS = ('arrival', 'burst', 'priority')
+_ITEM_SIZE = array('q').itemsize
+
+
+class SharedWorkload:
+    """
+    Owns the shared memory block holding a workload.
+
+    Layout: the SHARED_COLUMNS as consecutive int64 arrays of `count` items,
+    then a pickled (pids, io) pair. close() frees the block; workers that
+    are still attached keep their mapping until they exit.
+    """
+    def __init__(self, table):
+        self.count = len(table)
+        blob = pickle.dumps((table.pids, table.io), protocol=pickle.HIGHEST_PROTOCOL)
+        self._blob_size = len(blob)
+        columns_size = len(SHARED_COLUMNS) * self.count * _ITEM_SIZE
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, columns_size + len(blob)))
+        buffer = self._shm.buf
+        offset = 0
+        for name in SHARED_COLUMNS:
+            data = getattr(table, name).tobytes()
+            buffer[offset:offset + len(data)] = data
+            offset += len(data)
+        buffer[offset:offset + len(blob)] = blob
+        del buffer  # The block cannot be closed while views of it exist.
+
+    @property
+    def handle(self):
+        """Picklable (name, count, blob size) tuple for attach()."""
+        return (self._shm.name, self.count, self._blob_size)
+
+    def close(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def attach(handle):
+    """
+    Opens a SharedWorkload from its handle.
+    :return: (block, table). table is a ProcessTable whose SHARED_COLUMNS are
+             read-only views into the block; it only serves as a scheduler's
+             input (see BaseScheduler.load_table()). Keep `block` referenced
+             for as long as the table is used.
+    """
+    name, count, blob_size = handle
+    block = shared_memory.SharedMemory(name=name)
+    view = block.buf.toreadonly()
+    table = ProcessTable()
+    offset = 0
+    for column in SHARED_COLUMNS:
+        setattr(table, column, view[offset:offset + count * _ITEM_SIZE].cast('q'))
+        offset += count * _ITEM_SIZE
+    table.pids, table.io = pickle.loads(view[offset:offset + blob_size])
+    return block, table
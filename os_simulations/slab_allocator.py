@@ -0,0 +1,203 @@
+# os_simulations/slab_allocator.py
+
+from bisect import bisect_left
+
+from os_simulations import instrumentation
+from os_simulations.memory_management import MemoryManager
+
+DEFAULT_SIZE_CLASSES = (8, 16, 32, 64)
+DEFAULT_SLAB_SIZE = 128
+
+_SLAB_OWNER = object()  # Tags the owner keys of slabs, so no caller's process ID can equal one
+
+
+class _Slab:
+    """One backing block carved into equal objects of its size class."""
+    __slots__ = ('process_id', 'start', 'size_class', 'free', 'in_use', 'requested')
+
+    def __init__(self, process_id, start, size_class, slab_size):
+        self.process_id = process_id  # The owner key of the backing block in the MemoryManager
+        self.start = start
+        self.size_class = size_class
+        count = slab_size // size_class.size
+        # Free object addresses as a stack, lowest address on top.
+        self.free = [start + index * size_class.size for index in range(count - 1, -1, -1)]
+        self.in_use = 0
+        self.requested = 0  # Sum of the requested sizes of the objects in use
+
+
+class _SizeClass:
+    __slots__ = ('size', 'partial', 'empty', 'slabs', 'in_use', 'requests', 'hits')
+
+    def __init__(self, size):
+        self.size = size
+        self.partial = {}   # Slabs with a free object -> None (a dict keeps removal O(1))
+        self.empty = None   # One fully free slab kept for reuse
+        self.slabs = 0
+        self.in_use = 0
+        self.requests = 0
+        self.hits = 0       # Requests served from an existing slab
+
+
+class SlabAllocator:
+    """
+    Size-class (slab) allocator layered on a MemoryManager, with the same interface.
+
+    A request of at most the largest size class is rounded up to the smallest
+    class that fits and served from a slab: a slab_size block taken from the
+    MemoryManager and carved into equal objects of that class. Each slab keeps
+    a free list of its objects and each class a set of slabs that still have
+    one, so allocating and freeing a small object are O(1) and only a new or
+    released slab goes through the MemoryManager. Same-size objects therefore
+    share a few slabs instead of scattering holes across the whole map.
+    Larger requests go to the MemoryManager directly.
+
+    A slab whose last object is freed goes back to the MemoryManager, except
+    for one empty slab per class, kept so a class that keeps dropping to zero
+    objects does not allocate and free a slab on every call.
+    """
+    def __init__(self, total_memory_size, size_classes=DEFAULT_SIZE_CLASSES, slab_size=DEFAULT_SLAB_SIZE):
+        size_classes = sorted(set(size_classes))
+        if not size_classes or size_classes[0] <= 0:
+            raise ValueError("Size classes must be positive integers.")
+        if slab_size < size_classes[-1]:
+            raise ValueError("slab_size must hold at least one object of the largest size class.")
+        self.total_memory_size = total_memory_size
+        self.size_classes = tuple(size_classes)
+        self.slab_size = slab_size
+        self.backing = MemoryManager(total_memory_size)
+        self.reset_memory()
+
+    def reset_memory(self):
+        """Frees every object, slab and large block."""
+        self.backing.reset_memory()
+        self._classes = [_SizeClass(size) for size in self.size_classes]
+        self._slabs = {}      # Owner key of the backing block -> _Slab
+        self._objects = {}    # pid -> [(address, _Slab, requested size)]
+        self._large = {}      # pid -> requested size of its blocks in the MemoryManager
+        self._next_slab_id = 0
+
+    def _new_slab(self, size_class, algorithm):
+        """Takes a slab for the class from the MemoryManager; None if there is no room."""
+        process_id = (_SLAB_OWNER, size_class.size, self._next_slab_id)
+        block = self.backing.allocate_block(process_id, self.slab_size, algorithm)
+        if block is None:
+            return None
+        self._next_slab_id += 1
+        slab = self._slabs[process_id] = _Slab(process_id, block.start, size_class, self.slab_size)
+        size_class.partial[slab] = None
+        size_class.slabs += 1
+        return slab
+
+    def allocate(self, process_id, size, algorithm='First Fit'):
+        """
+        Allocates `size` units to a process: an object of the smallest size class
+        that fits, or for larger sizes a block placed by the MemoryManager with the
+        given algorithm (which also places new slabs).
+        Returns True if allocation successful, False otherwise.
+        """
+        if size <= 0:
+            return False # Invalid size
+        index = bisect_left(self.size_classes, size)
+        if index == len(self.size_classes):
+            if not self.backing.allocate(process_id, size, algorithm):
+                return False
+            self._large[process_id] = self._large.get(process_id, 0) + size
+            return True
+
+        size_class = self._classes[index]
+        size_class.requests += 1
+        slab = next(iter(size_class.partial), None)
+        if slab is not None:
+            size_class.hits += 1
+        else:
+            slab = self._new_slab(size_class, algorithm)
+            if slab is None:
+                return False
+        if slab is size_class.empty:
+            size_class.empty = None
+        address = slab.free.pop()
+        if not slab.free:
+            del size_class.partial[slab]
+        slab.in_use += 1
+        slab.requested += size
+        size_class.in_use += 1
+        self._objects.setdefault(process_id, []).append((address, slab, size))
+        return True
+
+    def deallocate(self, process_id):
+        """Frees the objects and blocks held by a given process ID."""
+        objects = self._objects.pop(process_id, None)
+        large = self._large.pop(process_id, None)
+        if objects:
+            for address, slab, size in objects:
+                self._free_object(address, slab, size)
+        if large is not None:
+            self.backing.deallocate(process_id)
+        return bool(objects) or large is not None
+
+    def _free_object(self, address, slab, size):
+        size_class = slab.size_class
+        slab.free.append(address)
+        slab.in_use -= 1
+        slab.requested -= size
+        size_class.in_use -= 1
+        if len(slab.free) == 1:
+            size_class.partial[slab] = None # It was full
+        if slab.in_use:
+            return
+        if size_class.empty is None:
+            size_class.empty = slab
+        else:
+            del size_class.partial[slab]
+            del self._slabs[slab.process_id]
+            size_class.slabs -= 1
+            self.backing.deallocate(slab.process_id)
+
+    def get_memory_map_data(self):
+        """
+        Returns a list of dicts representing the current memory blocks for GUI display,
+        like MemoryManager.get_memory_map_data(). Slabs are shown as 'slab-<class>-<n>'
+        and also carry their 'slab_class' and 'used', the size requested by the objects in them.
+        """
+        blocks = self.backing.get_memory_map_data()
+        for block in blocks:
+            slab = self._slabs.get(block['process_id'])
+            if slab is not None:
+                _, size, number = slab.process_id
+                block['process_id'] = f"slab-{size}-{number}"
+                block['slab_class'] = slab.size_class.size
+                block['used'] = slab.requested
+        return blocks
+
+    def calculate_stats(self):
+        """
+        Calculates and returns memory usage statistics: MemoryManager.calculate_stats()
+        plus 'requested_memory', 'internal_fragmentation' (allocated minus requested),
+        'slab_memory', 'slab_utilization' (% of slab memory holding objects) and per
+        size class its slabs, objects in use, requests, hits and 'hit_rate' (%).
+        """
+        stats = self.backing.calculate_stats()
+        requested = sum(self._large.values()) + sum(slab.requested for slab in self._slabs.values())
+        slab_memory = len(self._slabs) * self.slab_size
+        object_memory = sum(size_class.in_use * size_class.size for size_class in self._classes)
+        stats.update({
+            'requested_memory': requested,
+            'internal_fragmentation': stats['allocated_memory'] - requested,
+            'slab_memory': slab_memory,
+            'slab_utilization': object_memory / slab_memory * 100 if slab_memory else 0.0,
+            'size_classes': {
+                size_class.size: {
+                    'slabs': size_class.slabs,
+                    'objects_in_use': size_class.in_use,
+                    'requests': size_class.requests,
+                    'hits': size_class.hits,
+                    'hit_rate': size_class.hits / size_class.requests * 100 if size_class.requests else 0.0,
+                }
+                for size_class in self._classes
+            },
+        })
+        return stats
+
+
+instrumentation.register(SlabAllocator, 'allocate', "SlabAllocator.allocate")
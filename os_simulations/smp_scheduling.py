@@ -0,0 +1,300 @@
+# os_simulations/smp_scheduling.py
+
+import collections
+import heapq
+from array import array
+
+from os_simulations import instrumentation
+from os_simulations.cpu_scheduling import BaseScheduler
+from os_simulations.gantt_timeline import GanttTimeline
+
+QUEUE_MODES = ('per-cpu', 'global')
+SMP_ALGORITHMS = ('fcfs', 'rr')
+
+
+class SMPScheduler(BaseScheduler):
+    """
+    Symmetric multiprocessing scheduler: num_cpus CPUs sharing one workload.
+
+    With queue_mode='per-cpu' every CPU has its own FIFO run queue and each
+    arriving process is placed on the least loaded CPU (queued plus running,
+    lowest CPU number on ties). With work_stealing, a CPU whose queue is empty
+    takes the newest process from the longest queue elsewhere. With
+    queue_mode='global' all CPUs pull from one shared queue.
+
+    algorithm is 'fcfs' or 'rr' (with quantum). Once dispatched, a slice runs
+    until completion or quantum expiry, so each CPU has exactly one pending
+    event. The engine keeps those events in a heap and jumps between them
+    instead of scanning every CPU per tick: ending a slice costs
+    O(log num_cpus). Placing an arrival on the least loaded CPU and picking
+    the victim of a steal scan the per-CPU counts, O(num_cpus) each.
+    step() is advance_to(t + 1) and gives the same results.
+
+    Each CPU has its own GanttTimeline in gantt_charts. A migration is
+    counted when a process runs on a different CPU from the one it last ran on.
+    """
+    CHECKPOINT_ATTRS = BaseScheduler.CHECKPOINT_ATTRS + (
+        'running', 'cpu_queues', 'queued', 'load', 'busy_time', 'migrations_in', 'total_migrations',
+        'total_steals', '_queued_total', '_slice_start', '_idle_since', '_idle', '_events', '_expired')
+    CHECKPOINT_ROW_ATTRS = ('last_cpu',)
+
+    def __init__(self, num_cpus, algorithm='fcfs', quantum=None, queue_mode='per-cpu', work_stealing=True,
+                 gantt_max_segments=None):
+        if num_cpus < 1:
+            raise ValueError("An SMP scheduler needs at least one CPU.")
+        if algorithm.lower() not in SMP_ALGORITHMS:
+            raise ValueError(f"SMP mode supports {', '.join(SMP_ALGORITHMS)}, not '{algorithm}'.")
+        if algorithm.lower() == 'rr' and (quantum is None or quantum <= 0):
+            raise ValueError("Round Robin needs a positive time quantum.")
+        if queue_mode not in QUEUE_MODES:
+            raise ValueError(f"Unknown queue mode '{queue_mode}'. Choose from: {', '.join(QUEUE_MODES)}.")
+        self.num_cpus = num_cpus
+        self.algorithm = algorithm.lower()
+        self.quantum = quantum if self.algorithm == 'rr' else None
+        self.queue_mode = queue_mode
+        self.work_stealing = work_stealing and queue_mode == 'per-cpu'
+        self.gantt_charts = [GanttTimeline(gantt_max_segments) for _ in range(num_cpus)]
+        super().__init__(gantt_max_segments)
+        self.gantt_chart = self.gantt_charts[0]  # For callers that only show one lane
+        self.reset_state()
+
+    def reset_state(self):
+        super().reset_state()
+        count = self.num_cpus
+        for timeline in self.gantt_charts:
+            timeline.clear()
+        self.running = [None] * count               # Row id running on each CPU
+        self.cpu_queues = [collections.deque() for _ in range(count)]  # Unused in global mode
+        self.queued = [0] * count                   # len(cpu_queues[cpu]), kept for fast max()
+        self.load = [0] * count                     # Queued plus running, per CPU (per-cpu mode)
+        self.busy_time = array('q', [0]) * count
+        self.migrations_in = array('q', [0]) * count
+        self.total_migrations = 0
+        self.total_steals = 0
+        self.last_cpu = array('q')                  # Per row id, -1 until first run
+        self._queued_total = 0
+        self._slice_start = array('q', [0]) * count  # Start of the running slice (or of the unflushed part)
+        self._idle_since = array('q', [0]) * count   # Start of the current idle period, -1 while busy
+        self._idle = set(range(count))
+        self._events = []    # Heap of (slice end, cpu), one per busy CPU
+        self._expired = []   # (cpu, row id) whose quantum ran out, requeued after arrivals
+
+    @property
+    def running_processes(self):
+        """Process view (or None) for each CPU."""
+        return [None if index is None else self.processes.view(index) for index in self.running]
+
+    def _active_ids(self):
+        ids = array('q', self.ready_queue)
+        for queue in self.cpu_queues:
+            ids.extend(queue)
+        ids.extend(index for index in self.running if index is not None)
+        ids.extend(index for _, index in self._expired)
+        ids.extend(self._blocked_ids())
+        return ids
+
+    def _timelines(self):
+        return self.gantt_charts
+
+    def is_finished(self):
+        return (not self._events and not self._expired and not self._queued_total and not self._io_events
+                and not self._has_pending_arrival())
+
+    def _on_admit(self, index):
+        self._add_row(self.last_cpu, index, -1)
+
+    def _enqueue(self, index):
+        """Places a newly arrived process, or one back from I/O."""
+        self._queued_total += 1
+        if self.queue_mode == 'global':
+            self.ready_queue.append(index)
+            return
+        load = self.load
+        cpu = load.index(min(load))
+        self.cpu_queues[cpu].append(index)
+        self.queued[cpu] += 1
+        load[cpu] += 1
+
+    def _requeue(self, cpu, index, current_time):
+        """Puts a preempted process back at the tail of its CPU's queue (or the global queue)."""
+        self.processes.last_enqueued[index] = current_time
+        self._queued_total += 1
+        if self.queue_mode == 'global':
+            self.ready_queue.append(index)
+        else:
+            self.cpu_queues[cpu].append(index)
+            self.queued[cpu] += 1
+
+    def _start(self, cpu, index, current_time):
+        """Gives the CPU to a process that has already been taken off a queue."""
+        table = self.processes
+        table.waiting[index] += current_time - table.last_enqueued[index]
+        if table.start[index] == -1:
+            table.start[index] = current_time
+        previous_cpu = self.last_cpu[index]
+        if previous_cpu != -1 and previous_cpu != cpu:
+            self.total_migrations += 1
+            self.migrations_in[cpu] += 1
+        self.last_cpu[index] = cpu
+        self._queued_total -= 1
+
+        idle_since = self._idle_since[cpu]
+        self.gantt_charts[cpu].append('Idle', idle_since, current_time - idle_since)
+        self._idle_since[cpu] = -1
+        self._idle.discard(cpu)
+
+        ticks = table.remaining[index]
+        if self.quantum is not None:
+            ticks = min(ticks, self.quantum)
+        self.running[cpu] = index
+        self._slice_start[cpu] = current_time
+        heapq.heappush(self._events, (current_time + ticks, cpu))
+        self.total_context_switches += 1
+
+    def _run_slice_part(self, cpu, current_time):
+        """Charges the running process on cpu for the ticks since its slice (part) began."""
+        index = self.running[cpu]
+        ticks = current_time - self._slice_start[cpu]
+        if ticks > 0:
+            self.processes.remaining[index] -= ticks
+            self.busy_time[cpu] += ticks
+            self.gantt_charts[cpu].append(self.processes.pids[index], self._slice_start[cpu], ticks)
+            self._slice_start[cpu] = current_time
+
+    def _end_slices(self, current_time):
+        """Ends every slice due by current_time: records completions and sets expired quanta aside."""
+        events = self._events
+        while events and events[0][0] <= current_time:
+            _, cpu = heapq.heappop(events)
+            self._run_slice_part(cpu, current_time)
+            index = self.running[cpu]
+            self.running[cpu] = None
+            self._idle_since[cpu] = current_time
+            self._idle.add(cpu)
+            if self.processes.remaining[index] <= 0:
+                self.load[cpu] -= 1
+                if not self._start_io(index, current_time):
+                    self._record_completion(index, current_time)
+            else:
+                self._expired.append((cpu, index))  # Still counts towards this CPU's load
+
+    def _schedule(self, current_time):
+        """Makes every scheduling decision due at current_time."""
+        self._end_slices(current_time)
+        self._admit_arrivals(current_time)
+        for cpu, index in self._expired:
+            self._requeue(cpu, index, current_time)
+        self._expired = []
+        if self._idle and self._queued_total:
+            self._dispatch_idle(current_time)
+
+    def _dispatch_idle(self, current_time):
+        if self.queue_mode == 'global':
+            queue = self.ready_queue
+            for cpu in sorted(self._idle):
+                if not queue:
+                    break
+                self._start(cpu, queue.popleft(), current_time)
+            return
+
+        queues, queued = self.cpu_queues, self.queued
+        for cpu in sorted(self._idle):
+            if queues[cpu]:
+                queued[cpu] -= 1
+                self._start(cpu, queues[cpu].popleft(), current_time)
+        if not self.work_stealing:
+            return
+        for cpu in sorted(self._idle):
+            if not self._queued_total:
+                break
+            victim = queued.index(max(queued))
+            # Steal the newest process: it has waited least on the victim.
+            index = queues[victim].pop()
+            queued[victim] -= 1
+            self.load[victim] -= 1
+            self.load[cpu] += 1
+            self.total_steals += 1
+            self._start(cpu, index, current_time)
+
+    def _account_io(self, ticks):
+        """Adds `ticks` to the I/O busy and CPU/I-O overlap times; nothing changes state in between."""
+        if self._io_events:
+            self.io_active_time += ticks
+            if len(self._idle) < self.num_cpus:
+                self.cpu_io_overlap_time += ticks
+
+    def _flush(self, current_time):
+        """Brings every lane of the Gantt chart and the busy times up to current_time."""
+        for cpu in range(self.num_cpus):
+            if self.running[cpu] is not None:
+                self._run_slice_part(cpu, current_time)
+            else:
+                idle_since = self._idle_since[cpu]
+                self.gantt_charts[cpu].append('Idle', idle_since, current_time - idle_since)
+                self._idle_since[cpu] = current_time
+
+    def get_waiting_time(self, process, current_time):
+        index = process if isinstance(process, int) else process.index
+        table = self.processes
+        if (index in self.running or table.completion[index] != -1 or table.arrival[index] > current_time
+                or index in self._blocked_ids()):
+            return table.waiting[index]
+        return table.waiting[index] + current_time - table.last_enqueued[index]
+
+    def _calculate_metrics(self, current_time_tick):
+        avg_wait, avg_turnaround, _ = super()._calculate_metrics(current_time_tick)
+        if current_time_tick <= 0:
+            return avg_wait, avg_turnaround, 0.0
+        return avg_wait, avg_turnaround, sum(self.busy_time) / (self.num_cpus * current_time_tick) * 100
+
+    def get_metrics(self):
+        """Like BaseScheduler.get_metrics(), plus per-CPU utilisation, migrations and steals."""
+        metrics = super().get_metrics()
+        total_time = self.total_execution_time
+        metrics.update({
+            'num_cpus': self.num_cpus,
+            'per_cpu_utilization': [busy / total_time * 100 if total_time > 0 else 0.0
+                                    for busy in self.busy_time],
+            'migrations': self.total_migrations,
+            'per_cpu_migrations': list(self.migrations_in),
+            'steals': self.total_steals,
+        })
+        return metrics
+
+    def step(self, current_time):
+        """
+        Executes one time unit on every CPU.
+        :return: (pids running on each CPU this tick, avg_wait, avg_turnaround, cpu_utilization,
+                  num_context_switches)
+        """
+        return self.advance_to(current_time + 1)
+
+    def _advance(self, target_time, stop_when_finished=False):
+        current_time = self.total_execution_time
+        while target_time is None or current_time < target_time:
+            self._schedule(current_time)
+            next_time = self._events[0][0] if self._events else None
+            next_ready = self._next_ready_time()
+            if next_ready is not None and (next_time is None or next_ready < next_time):
+                next_time = next_ready
+            if next_time is None and stop_when_finished:
+                break
+            if target_time is not None and (next_time is None or next_time >= target_time):
+                self._account_io(target_time - current_time)
+                current_time = target_time
+                break
+            if next_time is None:
+                break  # Nothing left to run or arrive.
+            self._account_io(next_time - current_time)
+            current_time = next_time
+
+        pids_this_tick = [self.processes.pids[index] if index is not None else 'Idle' for index in self.running]
+        self._end_slices(current_time)  # Completions belong to the tick that just ended.
+        self._flush(current_time)
+        self.total_execution_time = current_time
+        avg_wait, avg_turnaround, cpu_util = self._calculate_metrics(current_time)
+        return pids_this_tick, avg_wait, avg_turnaround, cpu_util, self.total_context_switches
+
+
+# step() is advance_to(t + 1), which already counts the ticks.
+instrumentation.register(SMPScheduler, 'step', "scheduler.step")
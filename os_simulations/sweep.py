@@ -0,0 +1,123 @@
+# os_simulations/sweep.py
+
+"""
+Parallel parameter sweeps over scheduling algorithms and time quanta.
+
+The workload is placed in shared memory once (see shared_workload); each
+worker process attaches to it through the pool initializer and every task
+only carries its (algorithm, quantum) pair, so the input is never copied
+per run. iter_sweep() yields results as they finish, e.g. for a live view.
+
+Workers are started by a forkserver rather than forked from the caller,
+which may be a GUI with other threads running: a forked worker could
+inherit a lock (e.g. the instrumentation registry's) held by one of them
+and deadlock on it.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from os_simulations.cpu_scheduling import RoundRobinScheduler, SCHEDULERS, create_scheduler
+from os_simulations.process_table import ProcessTable
+from os_simulations.shared_workload import SharedWorkload, attach
+
+SWEEP_COLUMNS = ['algorithm', 'quantum', 'avg_waiting_time', 'avg_turnaround_time',
+                 'cpu_utilization', 'context_switches', 'total_time', 'throughput']
+
+_worker_table = None  # Read-only ProcessTable of the workload, set once per worker process
+_worker_block = None  # Shared memory block backing _worker_table
+
+
+def _init_worker(handle):
+    global _worker_block, _worker_table
+    _worker_block, _worker_table = attach(handle)
+
+
+def _run_config(config, timelines=False):
+    algorithm, quantum = config
+    scheduler = create_scheduler(algorithm, quantum)
+    scheduler.load_table(_worker_table)
+    scheduler.run_to_completion()
+    metrics = scheduler.get_metrics()
+    row = {'algorithm': algorithm, 'quantum': quantum}
+    row.update((column, metrics[column]) for column in SWEEP_COLUMNS[2:])
+    if timelines:
+        row['timeline'] = scheduler.gantt_chart
+    return row
+
+
+def sweep_grid(algorithms, quanta):
+    """
+    Expands algorithms x quanta into (algorithm, quantum) configs.
+    Algorithms without a time quantum appear once, with quantum None.
+    """
+    configs = []
+    for algorithm in algorithms:
+        if algorithm.lower() not in SCHEDULERS:
+            raise ValueError(f"Unknown scheduling algorithm '{algorithm}'. Choose from: {', '.join(SCHEDULERS)}.")
+        if SCHEDULERS[algorithm.lower()] is RoundRobinScheduler:
+            configs.extend((algorithm, quantum) for quantum in quanta)
+        else:
+            configs.append((algorithm, None))
+    return configs
+
+
+def iter_sweep(processes, configs, max_workers=None, timelines=False):
+    """
+    Runs every (algorithm, quantum) config against the same workload, yielding
+    (position in configs, result row) pairs as the runs finish.
+    :param processes: ProcessTable (used as is) or iterable of Process objects.
+    :param configs: List of (algorithm, quantum) pairs, e.g. from sweep_grid().
+    :param max_workers: Worker processes to use; defaults to the CPU count. 1 runs in-process.
+    :param timelines: Also return each run's GanttTimeline as row['timeline'].
+    Closing the generator early cancels the runs that have not started.
+    """
+    global _worker_table
+    if isinstance(processes, ProcessTable):
+        table = processes
+    else:
+        table = ProcessTable()
+        table.extend(processes)
+    order = table.arrival_order()
+    if order is not None:
+        table = table.fresh_copy(order)  # Sort once here so every run can use the columns in place.
+    configs = list(configs)
+    for algorithm, quantum in configs:
+        create_scheduler(algorithm, quantum)  # Fail fast on bad configs before starting workers.
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(configs))
+    if max_workers <= 1:
+        _worker_table = table
+        for position, config in enumerate(configs):
+            yield position, _run_config(config, timelines)
+        return
+
+    with SharedWorkload(table) as shared, \
+            ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('forkserver'),
+                                initializer=_init_worker, initargs=(shared.handle,)) as executor:
+        futures = {executor.submit(_run_config, config, timelines): position
+                   for position, config in enumerate(configs)}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def run_sweep(processes, configs, max_workers=None):
+    """
+    Runs every (algorithm, quantum) config against the same workload.
+    :param processes: ProcessTable or iterable of Process objects.
+    :param configs: List of (algorithm, quantum) pairs, e.g. from sweep_grid().
+    :param max_workers: Worker processes to use; defaults to the CPU count. 1 runs in-process.
+    :return: List of result rows (dicts keyed by SWEEP_COLUMNS), in config order.
+    """
+    configs = list(configs)
+    rows = [None] * len(configs)
+    for position, row in iter_sweep(processes, configs, max_workers):
+        rows[position] = row
+    return rows
@@ -0,0 +1,194 @@
+# os_simulations/workload.py
+
+import csv
+import json
+import random
+
+from os_simulations.process_table import ProcessTable
+
+PID_FIELDS = ('pid',)
+ARRIVAL_FIELDS = ('arrival_time', 'arrival')
+BURST_FIELDS = ('burst_time', 'burst')
+PRIORITY_FIELDS = ('priority',)
+BURSTS_FIELDS = ('bursts',)
+
+BURST_DISTRIBUTIONS = ('exponential', 'bimodal', 'heavy-tailed')
+
+
+def _field(row, names, line_no, default=None):
+    for name in names:
+        if name in row and row[name] not in (None, ''):
+            return row[name]
+    if default is not None:
+        return default
+    raise ValueError(f"Line {line_no}: missing '{names[0]}' column.")
+
+
+def _int_field(row, names, line_no, default=None):
+    value = _field(row, names, line_no, default)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Line {line_no}: '{names[0]}' must be an integer, got {value!r}.")
+
+
+def parse_bursts(value, line_no):
+    """
+    Parses alternating CPU and I/O bursts that start and end with a CPU burst,
+    e.g. "5 disk:3 2 net:4 1" in CSV or [5, ["disk", 3], 2] in JSON Lines.
+    Returns (total CPU time, ((device, io_time, cpu_time), ...)), where each
+    phase is an I/O burst with the CPU burst after it, as ProcessTable.add() takes.
+    """
+    items = value.split() if isinstance(value, str) else list(value)
+    cpu_times, io_bursts = [], []
+    try:
+        for position, item in enumerate(items):
+            if isinstance(item, str) and ':' in item:
+                item = item.split(':', 1)
+            if position % 2 == 0:
+                cpu_times.append(int(item))
+            else:
+                if isinstance(item, str):
+                    raise ValueError
+                device, io_time = item
+                io_bursts.append((str(device).strip(), int(io_time)))
+    except (TypeError, ValueError):
+        raise ValueError(f"Line {line_no}: 'bursts' must alternate CPU times and device:time I/O bursts, "
+                         f"got {value!r}.")
+    if (len(items) % 2 == 0 or any(time <= 0 for time in cpu_times)
+            or any(time <= 0 or not device for device, time in io_bursts)):
+        raise ValueError(f"Line {line_no}: 'bursts' must start and end with a CPU burst, "
+                         "with positive times and named devices.")
+    return sum(cpu_times), tuple((device, io_time, cpu_time)
+                                 for (device, io_time), cpu_time in zip(io_bursts, cpu_times[1:]))
+
+
+def format_bursts(burst, io=()):
+    """Inverse of parse_bursts(): formats a total CPU time and its I/O phases as "5 disk:3 2"."""
+    parts = [str(burst - sum(cpu_time for _, _, cpu_time in io))]
+    for device, io_time, cpu_time in io:
+        parts.extend((f"{device}:{io_time}", str(cpu_time)))
+    return " ".join(parts)
+
+
+def parse_process(row, line_no):
+    """
+    Validates a dict with pid, arrival, burst and optional priority and bursts values.
+    With a 'bursts' column (see parse_bursts()) the burst may be left out; it is the total CPU time.
+    Returns (pid, arrival, burst, priority), plus the I/O phases for processes that do I/O;
+    raises ValueError if the row is incomplete or out of range.
+    """
+    pid = str(_field(row, PID_FIELDS, line_no)).strip()
+    arrival = _int_field(row, ARRIVAL_FIELDS, line_no)
+    bursts = _field(row, BURSTS_FIELDS, line_no, default='')
+    io = ()
+    if bursts:
+        cpu_time, io = parse_bursts(bursts, line_no)
+        burst = _int_field(row, BURST_FIELDS, line_no, default=cpu_time)
+        if burst != cpu_time:
+            raise ValueError(f"Line {line_no}: burst {burst} does not match the {cpu_time} ticks of CPU in 'bursts'.")
+    else:
+        burst = _int_field(row, BURST_FIELDS, line_no)
+    priority = _int_field(row, PRIORITY_FIELDS, line_no, default=0)
+    if not pid or arrival < 0 or burst <= 0:
+        raise ValueError(f"Line {line_no}: need a PID, non-negative arrival and positive burst.")
+    if io:
+        return pid, arrival, burst, priority, io
+    return pid, arrival, burst, priority
+
+
+def _read_rows(path):
+    """Yields (line_no, dict) pairs from a CSV or JSON Lines file."""
+    if path.endswith('.jsonl') or path.endswith('.ndjson'):
+        with open(path) as f:
+            for line_no, line in enumerate(f, start=1):
+                if line.strip():
+                    try:
+                        yield line_no, json.loads(line)
+                    except json.JSONDecodeError as error:
+                        raise ValueError(f"Line {line_no}: invalid JSON ({error.msg}).")
+    else:
+        with open(path, newline='') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+
+
+def iter_processes(path, require_sorted=True):
+    """
+    Streams validated (pid, arrival, burst, priority[, io]) tuples from a CSV file
+    with a header line or from a JSON Lines file, one row at a time.
+    Memory use does not depend on the file size, so traces larger than RAM
+    can be fed to BaseScheduler.load_stream(), which also holds only the
+    processes in the system.
+    :param require_sorted: Raise ValueError if arrivals are not in non-decreasing order.
+    """
+    last_arrival = None
+    for line_no, row in _read_rows(path):
+        process = parse_process(row, line_no)
+        if require_sorted:
+            if last_arrival is not None and process[1] < last_arrival:
+                raise ValueError(f"Line {line_no}: arrival {process[1]} is earlier than the previous row; "
+                                 "streamed traces must be sorted by arrival.")
+            last_arrival = process[1]
+        yield process
+
+
+def load_processes(path):
+    """
+    Reads a whole workload into a ProcessTable sorted by arrival.
+    Unlike iter_processes(), the rows may be in any order, and duplicate PIDs are rejected.
+    """
+    table = ProcessTable()
+    pids = set()
+    for row in iter_processes(path, require_sorted=False):
+        if row[0] in pids:
+            raise ValueError(f"Duplicate PID '{row[0]}' in {path}.")
+        pids.add(row[0])
+        table.add(*row)
+    order = table.arrival_order()
+    return table if order is None else table.fresh_copy(order)
+
+
+def _burst_sampler(rng, distribution, mean_burst):
+    """Returns a function drawing one positive integer burst from the named distribution."""
+    if distribution == 'exponential':
+        return lambda: max(1, round(rng.expovariate(1 / mean_burst)))
+    if distribution == 'bimodal':
+        # Mostly short interactive jobs plus a few long batch jobs, with the same overall mean.
+        short, long_ = max(1, mean_burst / 2), mean_burst * 5.5
+        return lambda: max(1, round(rng.gauss(long_, long_ / 5) if rng.random() < 0.1
+                                    else rng.gauss(short, short / 3)))
+    if distribution == 'heavy-tailed':
+        # Pareto with shape 1.5: finite mean, infinite variance.
+        alpha = 1.5
+        scale = mean_burst * (alpha - 1) / alpha
+        return lambda: max(1, round(scale * rng.paretovariate(alpha)))
+    raise ValueError(f"Unknown burst distribution '{distribution}'. Choose from: {', '.join(BURST_DISTRIBUTIONS)}.")
+
+
+def generate_processes(count, seed=0, arrival_rate=0.2, burst_distribution='exponential', mean_burst=4):
+    """
+    Yields a synthetic workload of (pid, arrival, burst, priority) tuples, sorted by arrival,
+    so it can go straight into BaseScheduler.load_stream() or a ProcessTable.
+    Arrivals form a Poisson process and priorities are uniform over 0-9.
+    The same seed always gives the same workload.
+    :param arrival_rate: Mean arrivals per tick. Keep it below 1 / mean_burst for a stable queue.
+    :param burst_distribution: 'exponential', 'bimodal' or 'heavy-tailed' (Pareto).
+    """
+    if arrival_rate <= 0 or mean_burst <= 0:
+        raise ValueError("arrival_rate and mean_burst must be positive.")
+    rng = random.Random(seed)
+    next_burst = _burst_sampler(rng, burst_distribution, mean_burst)
+    clock = 0.0
+    for i in range(count):
+        clock += rng.expovariate(arrival_rate)
+        yield f"P{i + 1}", int(clock), next_burst(), rng.randrange(10)
+
+
+def generate_workload(count, seed=0, arrival_rate=0.2, burst_distribution='exponential', mean_burst=4):
+    """Like generate_processes(), collected into a ProcessTable."""
+    table = ProcessTable()
+    for row in generate_processes(count, seed, arrival_rate, burst_distribution, mean_burst):
+        table.add(*row)
+    return table